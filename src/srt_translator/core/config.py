@@ -19,7 +19,7 @@ class ConfigManager:
     """配置管理器，統一管理系統的各種配置"""
 
     # 允許的配置類型（防止記憶體洩漏）
-    # 注意：default_prompt 用於 PromptManager 的預設提示詞配置
+    # 注意：default_prompt 沒有對應的配置檔，僅為相容舊呼叫端而保留
     ALLOWED_CONFIG_TYPES = frozenset({"app", "user", "model", "prompt", "file", "cache", "theme", "default_prompt"})
 
     # 類變量，儲存已建立的配置管理器實例（單例模式）
@@ -109,8 +109,9 @@ class ConfigManager:
         # 先初始化監聽器列表，避免在 load_config 呼叫儲存時未定義 listeners
         self.listeners: list[Callable[..., Any]] = []
 
-        # 載入配置
+        # 載入配置；以路徑記錄各配置檔最後載入/儲存時的修改時間，檔案未變更時不重新解析
         self.configs: dict[str, dict[str, Any]] = {}
+        self._config_mtimes: dict[str, int] = {}
         self.load_config()
 
         logger.info(f"配置管理器初始化完成: {config_type}")
@@ -155,6 +156,10 @@ class ConfigManager:
                 "cache_expiry": 600,  # 秒數
                 "connect_timeout": 5,
                 "request_timeout": 10,
+                "http_pool_size": 100,  # HTTP 連線池總連線數上限
+                "http_limit_per_host": 10,  # 每個主機的連線數上限
+                "log_level": "INFO",  # 模型管理器日誌等級（DEBUG / INFO / WARNING / ERROR）
+                "persistent_model_cache": False,  # 是否將 API 模型列表另存於磁碟快取，跨行程沿用
                 "model_patterns": [
                     "llama",
                     "qwen",
@@ -241,6 +246,10 @@ class ConfigManager:
 
     def load_config(self) -> None:
         """載入配置檔案，如果檔案不存在則使用預設值"""
+        # 未經 __init__ 建立的實例（如直接以 __new__ 建構）補上修改時間紀錄
+        if not hasattr(self, "_config_mtimes"):
+            self._config_mtimes = {}
+
         if self.config_type == "all":
             # 載入所有配置
             for config_type in self.config_paths:
@@ -249,6 +258,11 @@ class ConfigManager:
             # 載入特定配置
             self._load_specific_config(self.config_type)
 
+    def reload(self) -> None:
+        """強制重新讀取配置檔案（忽略修改時間檢查，未儲存的記憶體變更將被捨棄）"""
+        self._config_mtimes.clear()
+        self.load_config()
+
     def _load_specific_config(self, config_type: str) -> None:
         """載入特定類型的配置
 
@@ -266,12 +280,18 @@ class ConfigManager:
 
         try:
             if os.path.exists(config_path):
+                # 檔案自上次載入或儲存後未變更時，沿用記憶體中的配置
+                mtime_ns = os.stat(config_path).st_mtime_ns
+                if config_type in self.configs and self._config_mtimes.get(config_path) == mtime_ns:
+                    return
+
                 with open(config_path, encoding="utf-8") as f:
                     loaded_config = json.load(f)
 
                 # 將預設配置與載入的配置合併
                 merged_config = self._merge_configs(default_config, loaded_config)
                 self.configs[config_type] = merged_config
+                self._config_mtimes[config_path] = mtime_ns
                 logger.debug(f"已載入配置: {config_path}")
             else:
                 # 如果檔案不存在，使用預設配置並儲存
@@ -353,6 +373,7 @@ class ConfigManager:
             # 儲存到檔案
             with open(config_path, "w", encoding="utf-8") as f:
                 json.dump(config, f, ensure_ascii=False, indent=4)
+            self._config_mtimes[config_path] = os.stat(config_path).st_mtime_ns
 
             logger.debug(f"已儲存配置: {config_path}")
 
@@ -700,6 +721,17 @@ class ConfigManager:
             if not isinstance(timeout, int) or timeout <= 0 or timeout > 300:
                 errors[timeout_key] = ["逾時設定必須為 1-300 的整數（秒）"]
 
+        # 連線池設定（未設定時使用預設值）
+        for pool_key in ["http_pool_size", "http_limit_per_host"]:
+            if pool_key in config:
+                pool_size = config[pool_key]
+                if not isinstance(pool_size, int) or isinstance(pool_size, bool) or not 1 <= pool_size <= 1000:
+                    errors[pool_key] = ["連線數上限必須為 1-1000 的整數"]
+
+        # 日誌等級
+        if config.get("log_level", "INFO") not in ("DEBUG", "INFO", "WARNING", "ERROR"):
+            errors["log_level"] = ["必須為 DEBUG、INFO、WARNING 或 ERROR"]
+
         # 模型模式列表
         model_patterns = config.get("model_patterns", [])
         if not isinstance(model_patterns, list) or not all(isinstance(p, str) for p in model_patterns):
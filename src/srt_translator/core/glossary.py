@@ -9,12 +9,26 @@ from typing import Any, cast
 
 from srt_translator.core.singleton import SingletonMixin
 
+# 大型 JSON 術語表的串流解析（可選）
+try:
+    import ijson
+
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# 增量檔（.jsonl）超過此大小時，載入後立即合併回主檔
+SIDECAR_COMPACT_THRESHOLD = 256 * 1024
 
-@dataclass
+# 超過此大小的 JSON 術語表改以串流方式匯入（需安裝 ijson）
+STREAMING_IMPORT_THRESHOLD = 10 * 1024 * 1024
+
+
+@dataclass(frozen=True)
 class GlossaryEntry:
-    """術語表條目"""
+    """術語表條目（不可變；術語表的比對與序列化快取依賴條目內容不會原地變更）"""
 
     source: str  # 來源語言術語
     target: str  # 目標語言翻譯
@@ -22,6 +36,16 @@ class GlossaryEntry:
     notes: str = ""  # 備註說明
     case_sensitive: bool = False  # 是否區分大小寫
 
+    def to_dict(self) -> dict[str, Any]:
+        """轉換為字典格式"""
+        return {
+            "source": self.source,
+            "target": self.target,
+            "category": self.category,
+            "notes": self.notes,
+            "case_sensitive": self.case_sensitive,
+        }
+
 
 @dataclass
 class Glossary:
@@ -32,6 +56,16 @@ class Glossary:
     target_lang: str  # 目標語言
     entries: dict[str, GlossaryEntry] = field(default_factory=dict)
     description: str = ""
+    # 替換用的編譯結果，條目異動時失效並於下次套用時重建
+    # (條目, 不區分大小寫時預先編譯的正則)；區分大小寫的條目以 str.replace 處理
+    _ordered_entries: list[tuple[GlossaryEntry, re.Pattern[str] | None]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _translate_table: dict[int, str] | None = field(default=None, init=False, repr=False, compare=False)
+    # 最短來源術語長度，比它更短的文字不可能命中任何條目
+    _min_source_len: int = field(default=0, init=False, repr=False, compare=False)
+    # to_dict 用的條目序列化快取，新增條目時就地附加，其餘異動時失效
+    _serialized_entries: list[dict[str, Any]] | None = field(default=None, init=False, repr=False, compare=False)
 
     def add_entry(
         self,
@@ -40,26 +74,51 @@ class Glossary:
         category: str = "",
         notes: str = "",
         case_sensitive: bool = False,
-    ) -> None:
-        """新增術語條目"""
+    ) -> GlossaryEntry:
+        """新增術語條目，回傳存入的條目"""
         key = source if case_sensitive else source.lower()
-        self.entries[key] = GlossaryEntry(
+        is_new = key not in self.entries
+        entry = GlossaryEntry(
             source=source,
             target=target,
             category=category,
             notes=notes,
             case_sensitive=case_sensitive,
         )
+        self.entries[key] = entry
+        self._invalidate_matcher()
+
+        # 新條目附加在字典尾端，序列化快取同步附加；覆寫既有條目則整份失效
+        if self._serialized_entries is not None:
+            if is_new:
+                self._serialized_entries.append(entry.to_dict())
+            else:
+                self._serialized_entries = None
+        return entry
+
+    def add_entry_from_dict(self, entry_data: dict[str, Any]) -> None:
+        """從字典格式新增術語條目"""
+        self.add_entry(
+            source=entry_data.get("source", ""),
+            target=entry_data.get("target", ""),
+            category=entry_data.get("category", ""),
+            notes=entry_data.get("notes", ""),
+            case_sensitive=entry_data.get("case_sensitive", False),
+        )
 
     def remove_entry(self, source: str) -> bool:
         """移除術語條目"""
         key = source.lower()
         if key in self.entries:
             del self.entries[key]
+            self._invalidate_matcher()
+            self._serialized_entries = None
             return True
         # 嘗試精確匹配
         if source in self.entries:
             del self.entries[source]
+            self._invalidate_matcher()
+            self._serialized_entries = None
             return True
         return False
 
@@ -72,39 +131,75 @@ class Glossary:
         # 再嘗試精確匹配
         return self.entries.get(source)
 
+    def _invalidate_matcher(self) -> None:
+        """條目異動後清除編譯結果"""
+        self._ordered_entries = None
+        self._translate_table = None
+
+    def _build_matcher(self) -> list[tuple[GlossaryEntry, re.Pattern[str] | None]]:
+        """依目前條目建立排序後的替換清單與單字元轉換表
+
+        區分大小寫的單字元條目（常見於中日文專有名詞）改由 str.translate 一次處理，
+        其餘條目維持逐條替換，不區分大小寫的正則只在此編譯一次。
+        """
+        if self._ordered_entries is not None:
+            return self._ordered_entries
+
+        # 按來源術語長度降序排列，避免短詞誤替換長詞
+        sorted_entries = sorted(self.entries.values(), key=lambda e: len(e.source), reverse=True)
+        single_char_map = {ord(e.source): e.target for e in sorted_entries if e.case_sensitive and len(e.source) == 1}
+        self._translate_table = str.maketrans(single_char_map) if single_char_map else None
+        self._ordered_entries = [
+            (e, None if e.case_sensitive else re.compile(re.escape(e.source), re.IGNORECASE))
+            for e in sorted_entries
+            if not (e.case_sensitive and len(e.source) == 1)
+        ]
+        self._min_source_len = len(sorted_entries[-1].source) if sorted_entries else 0
+        return self._ordered_entries
+
     def apply_to_text(self, text: str) -> str:
         """將術語表應用到文字上"""
+        if not self.entries:
+            return text
+
+        ordered_entries = self._build_matcher()
+        # 短句（如 "Yes."）遇上長術語時直接略過
+        if len(text) < self._min_source_len:
+            return text
+
         result = text
-        # 按來源術語長度降序排列，避免短詞誤替換長詞
-        sorted_entries = sorted(self.entries.values(), key=lambda e: len(e.source), reverse=True)
+        pending_table = self._translate_table
+
+        for entry, pattern in ordered_entries:
+            # 單字元轉換表在所有多字元條目之後套用，保持長詞優先
+            if pending_table is not None and len(entry.source) <= 1:
+                result = result.translate(pending_table)
+                pending_table = None
 
-        for entry in sorted_entries:
-            if entry.case_sensitive:
+            if pattern is None:
                 result = result.replace(entry.source, entry.target)
             else:
                 # 不區分大小寫的替換
-                pattern = re.compile(re.escape(entry.source), re.IGNORECASE)
                 result = pattern.sub(entry.target, result)
 
+        if pending_table is not None:
+            result = result.translate(pending_table)
+
         return result
 
     def to_dict(self) -> dict[str, Any]:
-        """轉換為字典格式"""
+        """轉換為字典格式
+
+        entries 為內部序列化快取的淺拷貝，增刪列表項目不影響快取；各條目字典仍與快取共用，請勿修改。
+        """
+        if self._serialized_entries is None:
+            self._serialized_entries = [e.to_dict() for e in self.entries.values()]
         return {
             "name": self.name,
             "source_lang": self.source_lang,
             "target_lang": self.target_lang,
             "description": self.description,
-            "entries": [
-                {
-                    "source": e.source,
-                    "target": e.target,
-                    "category": e.category,
-                    "notes": e.notes,
-                    "case_sensitive": e.case_sensitive,
-                }
-                for e in self.entries.values()
-            ],
+            "entries": list(self._serialized_entries),
         }
 
     @classmethod
@@ -118,13 +213,7 @@ class Glossary:
         )
 
         for entry_data in data.get("entries", []):
-            glossary.add_entry(
-                source=entry_data.get("source", ""),
-                target=entry_data.get("target", ""),
-                category=entry_data.get("category", ""),
-                notes=entry_data.get("notes", ""),
-                case_sensitive=entry_data.get("case_sensitive", False),
-            )
+            glossary.add_entry_from_dict(entry_data)
 
         return glossary
 
@@ -135,8 +224,12 @@ class GlossaryManager(SingletonMixin):
     def __init__(self) -> None:
         """初始化術語表管理器"""
         self._glossaries: dict[str, Glossary] = {}
-        self._active_glossaries: set[str] = set()
+        # 啟用順序即套用優先順序；集合僅供 O(1) 成員檢查
+        self._active_order: list[str] = []
+        self._active_set: set[str] = set()
         self._glossary_dir = os.path.join("data", "glossaries")
+        # 尚有增量檔未合併回主檔的術語表名稱
+        self._pending_sidecars: set[str] = set()
 
         # 確保目錄存在
         os.makedirs(self._glossary_dir, exist_ok=True)
@@ -164,6 +257,11 @@ class GlossaryManager(SingletonMixin):
                 except Exception as e:
                     logger.error(f"載入術語表失敗 {filename}: {e}")
 
+    def _get_glossary_path(self, name: str, ext: str = ".json") -> str:
+        """取得術語表的檔案路徑（以安全的檔案名稱）"""
+        safe_name = re.sub(r'[<>:"/\\|?*]', "_", name)
+        return os.path.join(self._glossary_dir, f"{safe_name}{ext}")
+
     def _load_glossary_file(self, file_path: str) -> Glossary | None:
         """載入單一術語表檔案"""
         try:
@@ -171,28 +269,91 @@ class GlossaryManager(SingletonMixin):
                 data = json.load(f)
                 glossary = Glossary.from_dict(data)
                 self._glossaries[glossary.name] = glossary
-                logger.debug(f"已載入術語表: {glossary.name} ({len(glossary.entries)} 條目)")
-                return glossary
+
+            # 增量檔與寫入端（_append_entry）同樣依術語表名稱定位，檔名與名稱不同時也能合併
+            sidecar_path = self._get_glossary_path(glossary.name, ".jsonl")
+            if os.path.exists(sidecar_path):
+                self._merge_sidecar(glossary, sidecar_path)
+
+            logger.debug(f"已載入術語表: {glossary.name} ({len(glossary.entries)} 條目)")
+            return glossary
         except Exception as e:
             logger.error(f"載入術語表檔案失敗 {file_path}: {e}")
             return None
 
+    def _merge_sidecar(self, glossary: Glossary, sidecar_path: str) -> None:
+        """將增量檔中的條目合併到術語表，過大時順便壓縮回主檔"""
+        with open(sidecar_path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry_data = json.loads(line)
+                except json.JSONDecodeError:
+                    # 寫入中斷造成的殘缺行，略過即可
+                    logger.warning(f"略過無法解析的術語表增量記錄: {sidecar_path}")
+                    continue
+                glossary.add_entry_from_dict(entry_data)
+
+        self._pending_sidecars.add(glossary.name)
+        if os.path.getsize(sidecar_path) > SIDECAR_COMPACT_THRESHOLD:
+            self.compact(glossary.name)
+
+    def _append_entry(self, glossary: Glossary, entry_data: dict[str, Any]) -> bool:
+        """以附加方式將單一條目寫入增量檔，避免整份術語表重寫"""
+        if not os.path.exists(self._get_glossary_path(glossary.name)):
+            # 主檔不存在時增量檔無從合併，直接完整儲存
+            return self._save_glossary(glossary)
+
+        try:
+            with open(self._get_glossary_path(glossary.name, ".jsonl"), "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry_data, ensure_ascii=False) + "\n")
+            self._pending_sidecars.add(glossary.name)
+            return True
+        except Exception as e:
+            logger.error(f"寫入術語表增量記錄失敗 {glossary.name}: {e}")
+            return self._save_glossary(glossary)
+
     def _save_glossary(self, glossary: Glossary) -> bool:
         """儲存術語表到檔案"""
         try:
-            # 產生安全的檔案名稱
-            safe_name = re.sub(r'[<>:"/\\|?*]', "_", glossary.name)
-            file_path = os.path.join(self._glossary_dir, f"{safe_name}.json")
+            file_path = self._get_glossary_path(glossary.name)
 
             with open(file_path, "w", encoding="utf-8") as f:
                 json.dump(glossary.to_dict(), f, ensure_ascii=False, indent=2)
 
+            # 主檔已包含全部條目，增量檔可以捨棄
+            sidecar_path = self._get_glossary_path(glossary.name, ".jsonl")
+            if os.path.exists(sidecar_path):
+                os.remove(sidecar_path)
+            self._pending_sidecars.discard(glossary.name)
+
             logger.info(f"已儲存術語表: {glossary.name}")
             return True
         except Exception as e:
             logger.error(f"儲存術語表失敗 {glossary.name}: {e}")
             return False
 
+    def compact(self, name: str | None = None) -> bool:
+        """將增量檔合併回主檔
+
+        參數:
+            name: 術語表名稱，若為 None 則處理所有有增量記錄的術語表
+
+        回傳:
+            是否全部合併成功
+        """
+        names = [name] if name is not None else list(self._pending_sidecars)
+        success = True
+        for glossary_name in names:
+            glossary = self._glossaries.get(glossary_name)
+            if glossary is None or glossary_name not in self._pending_sidecars:
+                continue
+            if not self._save_glossary(glossary):
+                success = False
+        return success
+
     def create_glossary(
         self,
         name: str,
@@ -233,13 +394,16 @@ class GlossaryManager(SingletonMixin):
 
         # 從記憶體移除
         del self._glossaries[name]
-        self._active_glossaries.discard(name)
+        if name in self._active_set:
+            self._active_set.discard(name)
+            self._active_order.remove(name)
 
-        # 刪除檔案
-        safe_name = re.sub(r'[<>:"/\\|?*]', "_", name)
-        file_path = os.path.join(self._glossary_dir, f"{safe_name}.json")
-        if os.path.exists(file_path):
-            os.remove(file_path)
+        # 刪除檔案（含增量檔）
+        self._pending_sidecars.discard(name)
+        for ext in (".json", ".jsonl"):
+            file_path = self._get_glossary_path(name, ext)
+            if os.path.exists(file_path):
+                os.remove(file_path)
 
         logger.info(f"已刪除術語表: {name}")
         return True
@@ -258,8 +422,8 @@ class GlossaryManager(SingletonMixin):
         if not glossary:
             return False
 
-        glossary.add_entry(source, target, category, notes, case_sensitive)
-        self._save_glossary(glossary)
+        entry = glossary.add_entry(source, target, category, notes, case_sensitive)
+        self._append_entry(glossary, entry.to_dict())
         return True
 
     def remove_entry_from_glossary(self, glossary_name: str, source: str) -> bool:
@@ -276,22 +440,25 @@ class GlossaryManager(SingletonMixin):
     def activate_glossary(self, name: str) -> bool:
         """啟用術語表（用於翻譯）"""
         if name in self._glossaries:
-            self._active_glossaries.add(name)
+            if name not in self._active_set:
+                self._active_set.add(name)
+                self._active_order.append(name)
             logger.info(f"已啟用術語表: {name}")
             return True
         return False
 
     def deactivate_glossary(self, name: str) -> bool:
         """停用術語表"""
-        if name in self._active_glossaries:
-            self._active_glossaries.remove(name)
+        if name in self._active_set:
+            self._active_set.remove(name)
+            self._active_order.remove(name)
             logger.info(f"已停用術語表: {name}")
             return True
         return False
 
     def get_active_glossaries(self) -> list[str]:
-        """取得已啟用的術語表名稱"""
-        return list(self._active_glossaries)
+        """取得已啟用的術語表名稱（依啟用順序）"""
+        return self._active_order.copy()
 
     def apply_glossaries(self, text: str, source_lang: str = "", target_lang: str = "") -> str:
         """將啟用的術語表應用到文字上
@@ -304,11 +471,47 @@ class GlossaryManager(SingletonMixin):
         回傳:
             處理後的文字
         """
+        applicable = self._get_applicable_glossaries(source_lang, target_lang)
+        if not applicable:
+            return text
+
         result = text
+        for glossary in applicable:
+            result = glossary.apply_to_text(result)
+
+        return result
 
-        for name in self._active_glossaries:
+    def apply_glossaries_batch(self, texts: list[str], source_lang: str = "", target_lang: str = "") -> list[str]:
+        """將啟用的術語表批次應用到多行文字上
+
+        適用術語表與各術語表的替換清單只解析、編譯一次，逐行結果與 apply_glossaries 相同。
+
+        參數:
+            texts: 要處理的文字列表（如整個字幕檔的各行）
+            source_lang: 來源語言（用於篩選適用的術語表）
+            target_lang: 目標語言（用於篩選適用的術語表）
+
+        回傳:
+            處理後的文字列表，順序與輸入相同
+        """
+        applicable = self._get_applicable_glossaries(source_lang, target_lang)
+        if not applicable:
+            return list(texts)
+
+        results = []
+        for text in texts:
+            for glossary in applicable:
+                text = glossary.apply_to_text(text)
+            results.append(text)
+
+        return results
+
+    def _get_applicable_glossaries(self, source_lang: str = "", target_lang: str = "") -> list[Glossary]:
+        """依啟用順序取得適用於指定語言的術語表（先啟用的術語表優先）"""
+        applicable = []
+        for name in self._active_order:
             glossary = self._glossaries.get(name)
-            if not glossary:
+            if not glossary or not glossary.entries:
                 continue
 
             # 如果指定了語言，檢查術語表是否適用
@@ -317,9 +520,9 @@ class GlossaryManager(SingletonMixin):
             if target_lang and glossary.target_lang and glossary.target_lang != target_lang:
                 continue
 
-            result = glossary.apply_to_text(result)
+            applicable.append(glossary)
 
-        return result
+        return applicable
 
     def export_glossary(self, name: str, file_path: str, format: str = "json") -> bool:
         """匯出術語表到檔案
@@ -387,11 +590,13 @@ class GlossaryManager(SingletonMixin):
             ext = os.path.splitext(file_path)[1].lower()
 
             if ext == ".json":
-                with open(file_path, encoding="utf-8") as f:
-                    data = json.load(f)
-                    glossary = Glossary.from_dict(data)
-                    if name:
-                        glossary.name = name
+                if IJSON_AVAILABLE and os.path.getsize(file_path) > STREAMING_IMPORT_THRESHOLD:
+                    glossary = self._stream_json_glossary(file_path)
+                else:
+                    with open(file_path, encoding="utf-8") as f:
+                        glossary = Glossary.from_dict(json.load(f))
+                if name:
+                    glossary.name = name
 
             elif ext == ".csv":
                 import csv
@@ -446,6 +651,28 @@ class GlossaryManager(SingletonMixin):
             logger.error(f"匯入術語表失敗: {e}")
             return None
 
+    def _stream_json_glossary(self, file_path: str) -> Glossary:
+        """以 ijson 串流解析 JSON 術語表，峰值記憶體與單一條目同級
+
+        第一輪只讀取頂層欄位，第二輪逐一產生條目，避免整份文件同時存在記憶體中。
+        """
+        header: dict[str, str] = {}
+        with open(file_path, "rb") as f:
+            for prefix, event, value in ijson.parse(f):
+                if event == "string" and prefix in ("name", "source_lang", "target_lang", "description"):
+                    header[prefix] = value
+
+        glossary = Glossary(
+            name=header.get("name", ""),
+            source_lang=header.get("source_lang", ""),
+            target_lang=header.get("target_lang", ""),
+            description=header.get("description", ""),
+        )
+        with open(file_path, "rb") as f:
+            for entry_data in ijson.items(f, "entries.item"):
+                glossary.add_entry_from_dict(entry_data)
+        return glossary
+
     def find_glossaries_for_languages(self, source_lang: str, target_lang: str) -> list[Glossary]:
         """尋找適用於指定語言對的術語表"""
         result = []
@@ -1,69 +1,199 @@
 import asyncio
+import atexit
+import functools
+import hashlib
+import importlib.util
+import json
 import logging
+import operator
 import os
+import queue
 import re
+import sqlite3
+import sys
 import threading
 import time
-from dataclasses import dataclass, field
-from logging.handlers import TimedRotatingFileHandler
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field, replace
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
 from pathlib import Path
+from types import MappingProxyType
 from typing import Any
 
 import aiohttp
 
 # 載入環境變數（優先從 .env 檔案）
 try:
-    from dotenv import load_dotenv
+    from dotenv import dotenv_values
 
-    # 嘗試從專案根目錄載入 .env
-    env_path = Path(__file__).resolve().parents[3] / ".env"
-    if env_path.exists():
-        load_dotenv(env_path)
-    else:
-        load_dotenv()  # 嘗試從當前目錄載入
     DOTENV_AVAILABLE = True
 except ImportError:
     DOTENV_AVAILABLE = False
 
-# 嘗試匯入所有可能的 LLM 客戶端
-try:
-    import openai
-    from openai import OpenAI
-
-    OPENAI_AVAILABLE = True
-except ImportError:
-    OPENAI_AVAILABLE = False
-
+# 較快的 JSON 解析器（可選），未安裝時使用標準函式庫
 try:
-    from google import genai
+    import orjson
 
-    GOOGLE_AVAILABLE = True
+    ORJSON_AVAILABLE = True
 except ImportError:
-    GOOGLE_AVAILABLE = False
+    ORJSON_AVAILABLE = False
 
 # 從配置管理器導入
 from srt_translator.core.config import ConfigManager
 
+
+def _module_available(name: str) -> bool:
+    """檢查模組是否已安裝，只查找模組規格而不實際匯入"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:
+        return False
+
+
+# LLM 客戶端 SDK 匯入成本高（pydantic、httpx 等），模組載入時只檢查是否已安裝，
+# 實際匯入延後到第一次建立客戶端或測試連線時
+OPENAI_AVAILABLE = _module_available("openai")
+GOOGLE_AVAILABLE = _module_available("google.genai")
+
+openai: Any = None
+OpenAI: Any = None
+genai: Any = None
+
+
+def _import_openai() -> None:
+    """首次使用時匯入 OpenAI SDK（已匯入或已被替換時不重複處理）"""
+    global openai, OpenAI
+    if openai is None:
+        import openai as openai_module
+
+        openai = openai_module
+    if OpenAI is None:
+        OpenAI = openai.OpenAI
+
+
+def _import_genai() -> None:
+    """首次使用時匯入 Google GenAI SDK"""
+    global genai
+    if genai is None:
+        from google import genai as genai_module
+
+        genai = genai_module
+
+
+# 已載入 .env 的哨兵環境變數，子行程繼承後即略過重複解析
+_DOTENV_SENTINEL = "_SRT_DOTENV_LOADED"
+
+
+@functools.cache
+def _load_env_once() -> None:
+    """載入 .env 至環境變數，每個行程只執行一次；已存在的環境變數不會被覆寫
+
+    設定 SRT_SKIP_DOTENV，或所有提供者的 API 金鑰已由環境（如 systemd / docker）提供時，
+    完全略過 .env 的路徑解析與讀取。
+    """
+    if not DOTENV_AVAILABLE or os.environ.get(_DOTENV_SENTINEL) or os.environ.get("SRT_SKIP_DOTENV"):
+        return
+    if os.environ.get("OPENAI_API_KEY") and (os.environ.get("GOOGLE_API_KEY") or os.environ.get("GEMINI_API_KEY")):
+        return
+
+    # 嘗試從專案根目錄載入 .env，否則嘗試從當前目錄載入
+    env_path = Path(__file__).resolve().parents[3] / ".env"
+    values = dotenv_values(env_path) if env_path.exists() else dotenv_values()
+    for key, value in values.items():
+        if value is not None:
+            os.environ.setdefault(key, value)
+    os.environ[_DOTENV_SENTINEL] = "1"
+
+
+_load_env_once()
+
+# HTTP 回應本文的 JSON 解析函式（llama.cpp /props 含完整聊天模板，本文可達數十 KB）
+_json_loads = orjson.loads if ORJSON_AVAILABLE else json.loads
+
 # 設定日誌
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.DEBUG)
+# 預設只記錄 INFO 以上；除錯時可於模型配置設定 log_level 為 DEBUG
+logger.setLevel(logging.INFO)
 
-# 確保日誌目錄存在
-os.makedirs("logs", exist_ok=True)
+# 檔案日誌處理程序延後到 ModelManager 初始化時才建立，單純匯入模組不碰檔案系統
+_LOG_HANDLER_ATTACHED = False
+_LOG_HANDLER_LOCK = threading.RLock()
+# 實際寫檔的背景監聽器；記錄端只將 LogRecord 放入佇列，不在呼叫端執行磁碟 I/O
+_LOG_LISTENER: QueueListener | None = None
 
-# 避免重複添加處理程序
-if not logger.handlers:
-    handler = TimedRotatingFileHandler(
-        filename="logs/model_manager.log", when="midnight", interval=1, backupCount=7, encoding="utf-8"
-    )
-    formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s")
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
+
+def _ensure_log_handler() -> None:
+    """建立 logs 目錄並掛上每日輪替的檔案日誌處理程序（僅首次呼叫生效）
+
+    logger 只掛 QueueHandler，檔案寫入由背景 QueueListener 執行緒負責，
+    連線測試與快取未命中時的日誌不會在 event loop 上阻塞於寫檔。
+    """
+    global _LOG_HANDLER_ATTACHED, _LOG_LISTENER
+    if _LOG_HANDLER_ATTACHED:
+        return
+
+    with _LOG_HANDLER_LOCK:
+        if _LOG_HANDLER_ATTACHED:
+            return
+
+        # 避免重複添加處理程序
+        if not logger.handlers:
+            # 確保日誌目錄存在
+            os.makedirs("logs", exist_ok=True)
+            handler = TimedRotatingFileHandler(
+                filename="logs/model_manager.log", when="midnight", interval=1, backupCount=7, encoding="utf-8"
+            )
+            formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s")
+            handler.setFormatter(formatter)
+
+            log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+            _LOG_LISTENER = QueueListener(log_queue, handler, respect_handler_level=True)
+            _LOG_LISTENER.start()
+            logger.addHandler(QueueHandler(log_queue))
+        _LOG_HANDLER_ATTACHED = True
+
+
+def _apply_log_level(level: Any) -> None:
+    """依配置值設定模組日誌等級，無法識別的值沿用 INFO
+
+    參數:
+        level: 日誌等級名稱（如 "DEBUG"、"INFO"）
+    """
+    resolved = logging.getLevelName(str(level).upper())
+    logger.setLevel(resolved if isinstance(resolved, int) else logging.INFO)
+
+
+def _stop_log_listener() -> None:
+    """停止背景日誌監聽器：寫出佇列中剩餘的記錄後關閉檔案處理程序"""
+    global _LOG_LISTENER
+    listener = _LOG_LISTENER
+    if listener is None:
+        return
+    _LOG_LISTENER = None
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+# 能力評分的標準鍵（以 sys.intern 共用字串物件）
+CAPABILITY_KEYS: tuple[str, ...] = tuple(
+    sys.intern(key) for key in ("translation", "multilingual", "context_handling", "chinese")
+)
+
+# 標籤組合快取：內容相同的標籤 tuple 於所有 ModelInfo 間共用同一物件
+_TAG_CACHE: dict[tuple[str, ...], tuple[str, ...]] = {}
 
 
-@dataclass
+def _intern_tags(tags: Iterable[str]) -> tuple[str, ...]:
+    """將標籤轉為共用的 tuple，相同的標籤組合回傳同一物件"""
+    key = tuple(sys.intern(tag) for tag in tags)
+    return _TAG_CACHE.setdefault(key, key)
+
+
+@dataclass(slots=True, frozen=True)
 class ModelInfo:
-    """模型資訊資料類別"""
+    """模型資訊資料類別（不可變；需變更欄位時以 dataclasses.replace 建立副本）"""
 
     id: str  # 模型 ID/名稱
     provider: str  # 提供者（如 openai、google、llamacpp）
@@ -73,32 +203,570 @@ class ModelInfo:
     pricing: str = "未知"  # 價格描述
     recommended_for: str = "一般翻譯"  # 推薦用途
     parallel: int = 10  # 建議並行數量
-    tags: list[str] = field(default_factory=list)  # 模型標籤
+    tags: tuple[str, ...] = ()  # 模型標籤
     capabilities: dict[str, float] = field(default_factory=dict)  # 能力評分(0-1)
     available: bool = True  # 是否可用
+    _dict_cache: dict[str, Any] | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # 標籤與能力鍵改用共用的 interned 物件（frozen 需透過 object.__setattr__ 寫入）
+        object.__setattr__(self, "tags", _intern_tags(self.tags))
+        object.__setattr__(
+            self, "capabilities", {sys.intern(key): value for key, value in self.capabilities.items()}
+        )
 
     def to_dict(self) -> dict[str, Any]:
-        """轉換為字典格式"""
-        return {
-            "id": self.id,
-            "name": self.name or self.id,
-            "provider": self.provider,
-            "description": self.description,
-            "context_length": self.context_length,
-            "pricing": self.pricing,
-            "recommended_for": self.recommended_for,
-            "parallel": self.parallel,
-            "tags": self.tags,
-            "capabilities": self.capabilities,
-            "available": self.available,
-        }
+        """轉換為字典格式（首次呼叫時建立並快取，之後回傳淺拷貝，呼叫端可自由修改頂層欄位）"""
+        cached = self._dict_cache
+        if cached is None:
+            cached = {
+                "id": self.id,
+                "name": self.name or self.id,
+                "provider": self.provider,
+                "description": self.description,
+                "context_length": self.context_length,
+                "pricing": self.pricing,
+                "recommended_for": self.recommended_for,
+                "parallel": self.parallel,
+                "tags": list(self.tags),
+                "capabilities": self.capabilities,
+                "available": self.available,
+            }
+            object.__setattr__(self, "_dict_cache", cached)
+        # 標籤與能力評分另行複製，避免呼叫端修改後影響快取與共用的註冊表項目
+        return {**cached, "tags": list(self.tags), "capabilities": dict(self.capabilities)}
+
+
+# Google 模型列表端點（用於免費驗證 API 金鑰）與驗證結果快取秒數
+GOOGLE_MODELS_ENDPOINT = "https://generativelanguage.googleapis.com/v1beta/models"
+API_KEY_VALIDATION_TTL = 600
+# 無效金鑰的負向快取秒數：較短，使用者修正金鑰後能盡快重新驗證，同時避免連續重試
+API_KEY_INVALID_TTL = 30
+# 連線測試成功結果的快取秒數
+CONNECTION_TEST_TTL = 60
+# 提供者狀態的快取秒數：介面刷新時的重複查詢共用同一次探測結果
+PROVIDER_STATUS_TTL = 5.0
+
+# llama.cpp 請求的固定逾時設定，模組載入時建立一次並於每次請求重用
+# （需支援 Python 3.10，無法使用 asyncio.timeout()）
+LLAMACPP_PROBE_TIMEOUT = aiohttp.ClientTimeout(total=15)
+LLAMACPP_STATUS_TIMEOUT = aiohttp.ClientTimeout(total=5)
+
+# 各提供者同時進行中的外部請求上限，避免大量並行檢查觸發速率限制或塞滿連線池
+PROVIDER_CONCURRENCY = {"openai": 5, "google": 5, "llamacpp": 8}
+
+# 模型列表快取的最大項目數，超過時淘汰最久未使用的項目
+MODEL_LIST_CACHE_SIZE = 32
+
+# 連線測試結果快取的最大項目數
+PROBE_CACHE_SIZE = 64
+
+# 內建模型目錄：隨套件發佈的 JSON 資產，首次使用時讀取一次，首次存取該提供者時才實體化為 ModelInfo。
+# llama.cpp 條目的 id 刻意使用 GGUF 檔名，使未指定 -m 時推薦結果能觸發 hunyuan-mt prompt 策略；
+# llama-server 會忽略 API 的 model 欄位、改用實際載入的模型，故名稱僅影響 prompt 策略。
+MODEL_CATALOG_PATH = Path(__file__).with_name("model_catalog.json")
+
+
+@functools.cache
+def _model_catalog() -> dict[str, tuple[dict[str, Any], ...]]:
+    """讀取內建模型目錄（每個行程只讀取一次）
+
+    回傳:
+        {提供者: (模型條目字典, ...)}，讀取失敗時回傳空字典
+    """
+    try:
+        with open(MODEL_CATALOG_PATH, encoding="utf-8") as f:
+            raw = json.load(f)
+    except (OSError, ValueError) as e:
+        logger.error("載入內建模型目錄失敗 %s: %s", MODEL_CATALOG_PATH, e)
+        return {}
+    return {provider: tuple(entries) for provider, entries in raw.items()}
+
+
+# API 金鑰來源：(提供者, 顯示名稱, 依序檢查的環境變數)
+_API_KEY_PROVIDERS: tuple[tuple[str, str, tuple[str, ...]], ...] = (
+    ("openai", "OpenAI", ("OPENAI_API_KEY",)),
+    ("google", "Google", ("GOOGLE_API_KEY", "GEMINI_API_KEY")),
+)
+
+# 需要 API 金鑰的提供者與其連線測試方法名稱（以名稱查找，實例上的覆寫與測試替身同樣生效）
+_KEYED_CONNECTION_TESTS: dict[str, str] = {
+    "openai": "_test_openai_connection",
+    "google": "_test_google_connection",
+}
+
+# 預設的常見模型模式
+_DEFAULT_MODEL_PATTERNS: tuple[str, ...] = (
+    "llama",
+    "mixtral",
+    "aya",
+    "yi",
+    "qwen",
+    "solar",
+    "mistral",
+    "openchat",
+    "neural",
+    "phi",
+    "stable",
+    "dolphin",
+    "vicuna",
+    "zephyr",
+    "gemma",
+    "deepseek",
+)
+
+# 模型名稱處理用的預編譯正則：版本/標籤後綴、駝峰分詞、日期版本後綴（如 gpt-3.5-turbo-0301）
+_RE_VERSION_TAG = re.compile(r"[:@].+")
+_RE_CAMEL = re.compile(r"[A-Z][a-z]*|[a-z]+")
+_RE_DATE_SUFFIX = re.compile(r"-\d{4}$")
+
+# OpenAI 模型的翻譯優先級（數字越小越前面），未列出的模型位於優先模型與降權模型之間
+_OPENAI_TRANSLATION_PRIORITY: dict[str, int] = {
+    "gpt-4.1-mini": 1,
+    "gpt-4.1": 2,
+    "gpt-4.1-nano": 3,
+    "gpt-4o": 4,
+    "gpt-4-turbo": 5,
+    "gpt-4": 6,
+    "gpt-3.5-turbo-16k": 7,
+    "gpt-3.5-turbo": 8,
+    "gpt-4-vision-preview": 999,
+}
+_OPENAI_UNRANKED_PRIORITY = 900
+
+
+def _order_by_translation_priority(models: list[ModelInfo]) -> list[ModelInfo]:
+    """依翻譯優先級排列 OpenAI 模型，結果與以優先級穩定排序相同
+
+    只對少數列於 _OPENAI_TRANSLATION_PRIORITY 的模型排序，其餘模型一次走訪即分出，
+    不需對整個列表呼叫排序鍵。
+
+    參數:
+        models: 模型列表
+
+    回傳:
+        排序後的新列表
+    """
+    ranked: list[tuple[int, int, ModelInfo]] = []
+    unranked: list[ModelInfo] = []
+    for index, model in enumerate(models):
+        priority = _OPENAI_TRANSLATION_PRIORITY.get(model.id)
+        if priority is None:
+            unranked.append(model)
+        else:
+            ranked.append((priority, index, model))
+    ranked.sort(key=operator.itemgetter(0, 1))
+    head = [model for priority, _index, model in ranked if priority < _OPENAI_UNRANKED_PRIORITY]
+    tail = [model for priority, _index, model in ranked if priority >= _OPENAI_UNRANKED_PRIORITY]
+    return head + unranked + tail
+
+
+# 不同任務的能力權重（get_recommended_model 計分用）
+_TASK_WEIGHTS: dict[str, dict[str, float]] = {
+    "translation": {"translation": 0.7, "multilingual": 0.2, "context_handling": 0.1},
+    "literary": {  # 文學翻譯
+        "translation": 0.5,
+        "multilingual": 0.2,
+        "context_handling": 0.3,
+    },
+    "technical": {  # 技術文件翻譯
+        "translation": 0.6,
+        "multilingual": 0.1,
+        "context_handling": 0.3,
+    },
+    "subtitle": {  # 字幕翻譯
+        "translation": 0.5,
+        "multilingual": 0.3,
+        "context_handling": 0.2,
+    },
+}
+
+# 任務權重向量：依 CAPABILITY_KEYS 順序排列，與模型能力向量做內積即得分數
+_TASK_WEIGHT_VECTORS: dict[str, tuple[float, ...]] = {
+    task: tuple(weights.get(key, 0.0) for key in CAPABILITY_KEYS) for task, weights in _TASK_WEIGHTS.items()
+}
+
+
+def _capability_vector(model: ModelInfo) -> tuple[float, ...]:
+    """將模型能力評分轉為依 CAPABILITY_KEYS 排列的向量，缺少的能力以 0 計"""
+    return tuple(model.capabilities.get(key, 0.0) for key in CAPABILITY_KEYS)
+
+
+@dataclass(slots=True, frozen=True)
+class _Registry:
+    """內建模型登錄表快照：模型資料庫與其索引，一併建立、一併替換"""
+
+    models: Mapping[str, ModelInfo]  # {"提供者:模型ID": ModelInfo}
+    by_id: Mapping[str, ModelInfo]  # {模型ID: ModelInfo}，同名時保留先載入者
+    by_provider: Mapping[str, tuple[ModelInfo, ...]]  # {提供者: (ModelInfo, ...)}
+    cap_vectors: Mapping[str, tuple[tuple[float, ...], ...]]  # {提供者: 與 by_provider 對齊的能力向量}
+    # {(提供者, 任務類型): 依得分由高至低排列的 (模型, 得分)}；首次查詢時建立，隨快照替換一併失效
+    rankings: dict[tuple[str, str], tuple[tuple[ModelInfo, float], ...]] = field(default_factory=dict, compare=False)
+
+    @classmethod
+    def build(cls, models: dict[str, ModelInfo]) -> "_Registry":
+        """由模型資料庫建立唯讀快照與索引
+
+        參數:
+            models: 以 "提供者:模型ID" 為鍵的模型字典
+
+        回傳:
+            登錄表快照
+        """
+        by_id: dict[str, ModelInfo] = {}
+        by_provider: dict[str, list[ModelInfo]] = {}
+        for model in models.values():
+            by_id.setdefault(model.id, model)
+            by_provider.setdefault(model.provider, []).append(model)
+        return cls(
+            models=MappingProxyType(models),
+            by_id=MappingProxyType(by_id),
+            by_provider=MappingProxyType({provider: tuple(items) for provider, items in by_provider.items()}),
+            cap_vectors=MappingProxyType(
+                {provider: tuple(map(_capability_vector, items)) for provider, items in by_provider.items()}
+            ),
+        )
+
+    def ranked(self, provider: str, task_type: str) -> tuple[tuple[ModelInfo, float], ...]:
+        """取得指定提供者的模型依任務得分由高至低的排序（同分時維持目錄順序）
+
+        參數:
+            provider: 提供者名稱
+            task_type: 任務類型（需為 _TASK_WEIGHT_VECTORS 的鍵）
+
+        回傳:
+            (模型, 得分) 的序列
+        """
+        key = (provider, task_type)
+        ranking = self.rankings.get(key)
+        if ranking is None:
+            weights = _TASK_WEIGHT_VECTORS[task_type]
+            scored = [
+                (model, sum(map(operator.mul, vector, weights)))
+                for model, vector in zip(
+                    self.by_provider.get(provider, ()), self.cap_vectors.get(provider, ()), strict=True
+                )
+            ]
+            # 穩定排序：同分的模型維持目錄中的先後順序
+            ranking = tuple(sorted(scored, key=lambda item: -item[1]))
+            self.rankings[key] = ranking
+        return ranking
+
+
+# 內建模型登錄表：所有 ModelManager 實例共用的唯讀快照，各提供者首次使用時才建立 ModelInfo。
+# 採寫入時複製（copy-on-write），載入新提供者時整份替換，正在迭代舊快照的讀者不受影響。
+_REGISTRY = _Registry.build({})
+_LOADED_PROVIDERS: set[str] = set()
+_REGISTRY_LOCK = threading.Lock()
+
+
+def _ensure_provider_loaded(provider: str) -> None:
+    """確保指定提供者的內建模型已載入共用登錄表（執行緒安全，僅首次建立）
+
+    參數:
+        provider: 提供者名稱
+    """
+    global _REGISTRY
+    if provider in _LOADED_PROVIDERS or provider not in _model_catalog():
+        return
+    with _REGISTRY_LOCK:
+        if provider in _LOADED_PROVIDERS:
+            return
+        entries = dict(_REGISTRY.models)
+        for entry in _model_catalog()[provider]:
+            model = ModelInfo(**entry)
+            entries[f"{provider}:{model.id}"] = model
+        _REGISTRY = _Registry.build(entries)
+        _LOADED_PROVIDERS.add(provider)
+
+
+def _ensure_all_providers_loaded() -> None:
+    """確保所有提供者的內建模型皆已載入；全部載入後僅需一次長度比較，缺少的提供者一次重建完成"""
+    global _REGISTRY
+    catalog = _model_catalog()
+    if len(_LOADED_PROVIDERS) == len(catalog):
+        return
+    with _REGISTRY_LOCK:
+        missing = [provider for provider in catalog if provider not in _LOADED_PROVIDERS]
+        if not missing:
+            return
+        entries = dict(_REGISTRY.models)
+        for provider in missing:
+            for entry in catalog[provider]:
+                model = ModelInfo(**entry)
+                entries[f"{provider}:{model.id}"] = model
+        _REGISTRY = _Registry.build(entries)
+        _LOADED_PROVIDERS.update(missing)
+
+
+@functools.lru_cache(maxsize=16)
+def _compile_pattern_alternation(patterns: tuple[str, ...]) -> re.Pattern[str] | None:
+    """編譯模型模式交替正則；相同的模式組合（如重建實例或設定未變更）直接重用已編譯結果"""
+    if not patterns:
+        return None
+    return re.compile("|".join(map(re.escape, patterns)), re.IGNORECASE)
+
+
+@functools.cache
+def _llamacpp_offline_model() -> ModelInfo:
+    """llama-server 無法連線時的提示模型（不可變，建立一次後於各次失敗回退間共用）"""
+    return ModelInfo(
+        id="llama-server-offline",
+        provider="llamacpp",
+        name="llama-server (未連線)",
+        description=(
+            "請先啟動 llama-server："
+            "llama-server -m <model.gguf> --jinja --parallel 1 -c 1024 --cache-ram 4096"
+            "；Qwen3.5 建議加 --reasoning-format deepseek，"
+            "Gemma 4 建議改用 --reasoning off --reasoning-format none"
+        ),
+        context_length=1024,
+        pricing="免費(本機執行)",
+        recommended_for="本地高速推理翻譯",
+        parallel=1,
+        tags=("free", "local", "llamacpp"),
+        capabilities={"translation": 0.0, "multilingual": 0.0, "context_handling": 0.0},
+        available=False,
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_model_name(model_id: str) -> str:
+    """將模型 ID 格式化為易讀名稱；模型列表重複取得時相同 ID 直接沿用快取結果"""
+    try:
+        # 移除版本號和標籤
+        name = _RE_VERSION_TAG.sub("", model_id)
+
+        # 處理常見縮寫
+        name = name.replace("-", " ").replace("_", " ")
+
+        # 分割路徑，只取最後部分
+        parts = name.split("/")
+        name = parts[-1]
+
+        # 首字母大寫
+        words = name.split()
+        capitalized = []
+        for word in words:
+            # 處理駝峰命名
+            camel_parts = _RE_CAMEL.findall(word)
+            camel_parts = [p.capitalize() for p in camel_parts]
+            capitalized.append(" ".join(camel_parts))
+
+        return " ".join(capitalized)
+    except Exception:
+        return model_id
+
+
+def _credential_digest(credential: str) -> str:
+    """回傳憑證（API 金鑰等）的截短 SHA-256 摘要，供快取鍵使用而不保存明文"""
+    return hashlib.sha256(credential.encode()).hexdigest()[:16]
+
+
+# 連線測試成功結果的行程層級快取：{(提供者, 模型, 憑證摘要): (time.monotonic() 寫入時間, 結果)}
+# 各 ModelManager 實例（如 ModelService 每次建立的新實例）共用，以 LRU 方式限制大小
+_PROBE_CACHE: OrderedDict[tuple[str, str, str], tuple[float, dict[str, Any]]] = OrderedDict()
+_PROBE_CACHE_LOCK = threading.Lock()
+# 進行中的連線測試：相同鍵的並行呼叫等待同一個 future，不重複發送請求
+_PROBE_INFLIGHT: dict[tuple[str, str, str], asyncio.Future[dict[str, Any]]] = {}
+
+
+def _cached_probe(cache_key: tuple[str, str, str]) -> dict[str, Any] | None:
+    """取得未過期的連線測試結果副本，無則回傳 None"""
+    with _PROBE_CACHE_LOCK:
+        cached = _PROBE_CACHE.get(cache_key)
+        if cached is None or time.monotonic() - cached[0] >= CONNECTION_TEST_TTL:
+            return None
+        _PROBE_CACHE.move_to_end(cache_key)
+        return dict(cached[1])
+
+
+def _store_probe(cache_key: tuple[str, str, str], result: dict[str, Any]) -> None:
+    """記錄連線測試結果，超過上限時淘汰最久未使用的項目"""
+    with _PROBE_CACHE_LOCK:
+        _PROBE_CACHE[cache_key] = (time.monotonic(), result)
+        _PROBE_CACHE.move_to_end(cache_key)
+        while len(_PROBE_CACHE) > PROBE_CACHE_SIZE:
+            _PROBE_CACHE.popitem(last=False)
+
+
+# 模型列表磁碟快取（第二層，需於模型配置啟用 persistent_model_cache）：跨行程沿用需分頁查詢的 API 模型列表。
+# llama.cpp 的列表反映目前載入的本機模型，隨伺服器重啟而變，不寫入磁碟
+MODEL_LIST_CACHE_DB = "data/model_list_cache.db"
+_PERSISTED_MODEL_LISTS = frozenset({"openai"})
+
+
+class _ModelListDiskCache:
+    """以 SQLite 保存模型列表的第二層快取，項目依寫入時指定的到期時間淘汰"""
+
+    def __init__(self, path: str) -> None:
+        """開啟（必要時建立）快取資料庫
+
+        參數:
+            path: SQLite 資料庫檔案路徑
+        """
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        # autocommit 模式：每次 INSERT OR REPLACE 皆為單一原子交易
+        self._conn = sqlite3.connect(path, isolation_level=None, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS model_lists (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires REAL NOT NULL)"
+        )
+
+    def get(self, key: str) -> list[ModelInfo] | None:
+        """取得未過期的模型列表，無則回傳 None
+
+        參數:
+            key: 快取鍵
+
+        回傳:
+            ModelInfo 列表或 None
+        """
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT value FROM model_lists WHERE key = ? AND expires > ?", (key, time.time())
+                ).fetchone()
+            if row is None:
+                return None
+            return [ModelInfo(**entry) for entry in json.loads(row[0])]
+        except (sqlite3.Error, ValueError, TypeError) as e:
+            logger.warning("讀取模型列表磁碟快取失敗: %s", e)
+            return None
+
+    def put(self, key: str, models: list[ModelInfo], ttl: float) -> None:
+        """寫入模型列表
+
+        參數:
+            key: 快取鍵
+            models: ModelInfo 列表
+            ttl: 有效秒數
+        """
+        value = json.dumps([model.to_dict() for model in models], ensure_ascii=False)
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO model_lists (key, value, expires) VALUES (?, ?, ?)",
+                    (key, value, time.time() + ttl),
+                )
+        except sqlite3.Error as e:
+            logger.warning("寫入模型列表磁碟快取失敗: %s", e)
+
+    def clear(self) -> None:
+        """清除所有項目"""
+        try:
+            with self._lock:
+                self._conn.execute("DELETE FROM model_lists")
+        except sqlite3.Error as e:
+            logger.warning("清除模型列表磁碟快取失敗: %s", e)
+
+    def close(self) -> None:
+        """關閉資料庫連線"""
+        with self._lock:
+            self._conn.close()
+
+
+_MODEL_LIST_DISK_CACHE: _ModelListDiskCache | None = None
+_MODEL_LIST_DISK_CACHE_LOCK = threading.Lock()
+
+
+def _get_model_list_disk_cache() -> _ModelListDiskCache | None:
+    """取得（必要時開啟）行程共用的模型列表磁碟快取，無法開啟時回傳 None"""
+    global _MODEL_LIST_DISK_CACHE
+    cache = _MODEL_LIST_DISK_CACHE
+    if cache is None:
+        with _MODEL_LIST_DISK_CACHE_LOCK:
+            cache = _MODEL_LIST_DISK_CACHE
+            if cache is None:
+                try:
+                    cache = _MODEL_LIST_DISK_CACHE = _ModelListDiskCache(MODEL_LIST_CACHE_DB)
+                except (OSError, sqlite3.Error) as e:
+                    logger.warning("無法開啟模型列表磁碟快取: %s", e)
+                    return None
+    return cache
+
+
+def _clear_model_list_disk_cache() -> None:
+    """清除模型列表磁碟快取的所有項目；資料庫尚未建立時略過，不為此建立新檔"""
+    if _MODEL_LIST_DISK_CACHE is None and not os.path.exists(MODEL_LIST_CACHE_DB):
+        return
+    cache = _get_model_list_disk_cache()
+    if cache is not None:
+        cache.clear()
+
+
+def _close_model_list_disk_cache() -> None:
+    """關閉行程共用的模型列表磁碟快取"""
+    global _MODEL_LIST_DISK_CACHE
+    with _MODEL_LIST_DISK_CACHE_LOCK:
+        cache, _MODEL_LIST_DISK_CACHE = _MODEL_LIST_DISK_CACHE, None
+    if cache is not None:
+        cache.close()
+
+
+# 同步包裝方法（如 get_model_list）共用的背景 event loop，於 daemon 執行緒中持續執行
+_BACKGROUND_LOOP: asyncio.AbstractEventLoop | None = None
+_BACKGROUND_THREAD: threading.Thread | None = None
+_BACKGROUND_LOOP_LOCK = threading.Lock()
+
+
+def _get_background_loop() -> asyncio.AbstractEventLoop:
+    """取得（必要時啟動）共用的背景 event loop
+
+    首次呼叫時建立 loop 並於背景 daemon 執行緒中持續執行，之後所有 ModelManager 實例的
+    同步呼叫皆重複使用，不再每次建立與關閉 event loop，也不會每個實例各開一條執行緒。
+
+    回傳:
+        背景執行中的 event loop
+    """
+    global _BACKGROUND_LOOP, _BACKGROUND_THREAD
+    loop = _BACKGROUND_LOOP
+    if loop is None or loop.is_closed():
+        with _BACKGROUND_LOOP_LOCK:
+            loop = _BACKGROUND_LOOP
+            if loop is None or loop.is_closed():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="ModelManagerLoop", daemon=True)
+                thread.start()
+                _BACKGROUND_LOOP, _BACKGROUND_THREAD = loop, thread
+    return loop
+
+
+@dataclass(slots=True)
+class _RuntimeConfig:
+    """ModelManager 執行期設定快照"""
+
+    llamacpp_url: str = "http://localhost:8080"
+    default_llamacpp_model: str = "local-model"
+    model_patterns: list[str] = field(default_factory=lambda: list(_DEFAULT_MODEL_PATTERNS))
+    cache_expiry: float = 600  # 10 分鐘快取過期
+    connect_timeout: float = 5
+    request_timeout: float = 10
+    http_pool_size: int = 100
+    http_limit_per_host: int = 10
+
+    @classmethod
+    def from_config(cls, config: dict[str, Any]) -> "_RuntimeConfig":
+        """從模型配置字典建立設定快照，缺少的鍵使用預設值"""
+        defaults = cls()
+        return cls(
+            llamacpp_url=config.get("llamacpp_url", defaults.llamacpp_url),
+            default_llamacpp_model=str(config.get("default_llamacpp_model", defaults.default_llamacpp_model)),
+            model_patterns=list(config.get("model_patterns", defaults.model_patterns)),
+            cache_expiry=config.get("cache_expiry", defaults.cache_expiry),
+            connect_timeout=config.get("connect_timeout", defaults.connect_timeout),
+            request_timeout=config.get("request_timeout", defaults.request_timeout),
+            http_pool_size=int(config.get("http_pool_size", defaults.http_pool_size)),
+            http_limit_per_host=int(config.get("http_limit_per_host", defaults.http_limit_per_host)),
+        )
 
 
 class ModelManager:
     """模型管理器，負責管理、載入和監控不同的大型語言模型"""
 
     # 類變數，用於實現單例模式
-    _instance = None
+    _instance: "ModelManager | None" = None
     _lock = threading.Lock()
 
     @classmethod
@@ -111,6 +779,12 @@ class ModelManager:
         回傳:
             模型管理器實例
         """
+        # 雙重檢查鎖定：實例建立後直接回傳，不再每次取得鎖；
+        # 建立時於鎖內再次檢查，並行的首次呼叫只會有一個執行模型資料庫與 API 金鑰的初始化
+        instance = cls._instance
+        if instance is not None:
+            return instance
+
         with cls._lock:
             if cls._instance is None:
                 cls._instance = ModelManager(config_file)
@@ -122,6 +796,8 @@ class ModelManager:
         參數:
             config_file: 配置檔案路徑
         """
+        _ensure_log_handler()
+
         # 獲取配置管理器實例
         if config_file:
             self.config_manager = ConfigManager.get_instance("model", config_path=config_file)
@@ -132,48 +808,32 @@ class ModelManager:
         # 從配置載入模型設定
         self.config = self._load_config()
 
-        # llama.cpp 設定
-        self.llamacpp_url = self.config.get("llamacpp_url", "http://localhost:8080")
-        self.default_llamacpp_model: str = str(self.config.get("default_llamacpp_model", "local-model"))
-
-        # 常見模型模式，用於過濾
-        self.model_patterns = self.config.get(
-            "model_patterns",
-            [
-                "llama",
-                "mixtral",
-                "aya",
-                "yi",
-                "qwen",
-                "solar",
-                "mistral",
-                "openchat",
-                "neural",
-                "phi",
-                "stable",
-                "dolphin",
-                "vicuna",
-                "zephyr",
-                "gemma",
-                "deepseek",
-            ],
-        )
-
-        # 快取設定
-        self.cached_models: dict[str, list[ModelInfo]] = {}
-        self.cache_time: dict[str, float] = {}
-        self.cache_expiry = self.config.get("cache_expiry", 600)  # 10 分鐘快取過期
+        # 執行期設定快照：初始化時一次讀出，之後以屬性存取
+        self.rcfg = _RuntimeConfig.from_config(self.config)
+        self.model_patterns_re = self._compile_model_patterns(self.rcfg.model_patterns)
+        _apply_log_level(self.config.get("log_level", "INFO"))
 
-        # 用於測試 API 的逾時設定
-        self.connect_timeout = self.config.get("connect_timeout", 5)
-        self.request_timeout = self.config.get("request_timeout", 10)
+        # 模型列表快取：{llm_type: (time.monotonic() 寫入時間, 模型列表)}
+        self._cache: OrderedDict[str, tuple[float, list[ModelInfo]]] = OrderedDict()
 
         # 非同步 HTTP 客戶端
         self.session: aiohttp.ClientSession | None = None
         self._session_lock: asyncio.Lock | None = None
+        # 各提供者的並行請求閘門：提供者 -> (建立時的 event loop, semaphore)
+        self._provider_sems: dict[str, tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = {}
+
+        # 同步包裝方法使用的背景 event loop（模組層級共用，首次使用時才啟動）
+        self._sync_loop: asyncio.AbstractEventLoop | None = None
 
         # API 金鑰集合
         self.api_keys: dict[str, str] = {}
+        # API 金鑰驗證結果快取：{(提供者, 金鑰摘要): (是否有效, 到期時間)}
+        self._api_key_valid: dict[tuple[str, str], tuple[bool, float]] = {}
+        # 提供者狀態快取：(time.monotonic() 寫入時間, {提供者: 是否可用})
+        self._status_cache: tuple[float, dict[str, bool]] | None = None
+        # SDK 客戶端池：{(提供者, 金鑰摘要): 客戶端}，重用其連線池與 TLS 設定
+        self._clients: dict[tuple[str, str], Any] = {}
+        self._clients_lock = threading.Lock()
 
         # 初始化模型資訊庫
         self._init_model_info_database()
@@ -181,12 +841,72 @@ class ModelManager:
         # 載入 API 金鑰
         self._load_api_keys()
 
-        logger.info(f"ModelManager 初始化完成，預設 llama.cpp 模型: {self.default_llamacpp_model}")
+        logger.info("ModelManager 初始化完成，預設 llama.cpp 模型: %s", self.rcfg.default_llamacpp_model)
+
+    # 以下唯讀屬性維持既有的公開介面，實際值來自執行期設定快照
+    @property
+    def llamacpp_url(self) -> str:
+        """llama.cpp server 位址"""
+        return self.rcfg.llamacpp_url
+
+    @property
+    def default_llamacpp_model(self) -> str:
+        """預設 llama.cpp 模型名稱"""
+        return self.rcfg.default_llamacpp_model
+
+    @property
+    def model_patterns(self) -> list[str]:
+        """常見模型模式，用於過濾"""
+        return self.rcfg.model_patterns
+
+    @property
+    def cache_expiry(self) -> float:
+        """模型列表快取過期秒數"""
+        return self.rcfg.cache_expiry
+
+    @property
+    def connect_timeout(self) -> float:
+        """連線逾時秒數"""
+        return self.rcfg.connect_timeout
+
+    @property
+    def request_timeout(self) -> float:
+        """請求逾時秒數"""
+        return self.rcfg.request_timeout
+
+    @staticmethod
+    def _compile_model_patterns(patterns: list[str]) -> re.Pattern[str] | None:
+        """將模型模式關鍵字編譯為單一不分大小寫的交替正則，無模式時回傳 None"""
+        return _compile_pattern_alternation(tuple(patterns))
+
+    def matches_pattern(self, name: str) -> bool:
+        """檢查模型名稱是否包含任一常見模型模式
+
+        參數:
+            name: 模型名稱或 ID
+
+        回傳:
+            是否符合任一模式
+        """
+        return self.model_patterns_re is not None and self.model_patterns_re.search(name) is not None
 
     def _load_config(self) -> dict[str, Any]:
         """從配置管理器載入設定"""
         return self.config_manager.get_config()
 
+    def reload(self) -> None:
+        """重新讀取模型配置檔案，並重建執行期設定與模型列表快取（含磁碟快取）"""
+        self.config_manager.reload()
+        self.config = self._load_config()
+        self.rcfg = _RuntimeConfig.from_config(self.config)
+        self.model_patterns_re = self._compile_model_patterns(self.rcfg.model_patterns)
+        _apply_log_level(self.config.get("log_level", "INFO"))
+        self._cache.clear()
+        _clear_model_list_disk_cache()
+        self._recommended_cache.clear()
+        self._status_cache = None
+        logger.info("已重新載入模型配置")
+
     def _save_config(self) -> bool:
         """儲存設定到配置管理器"""
         for key, value in self.config.items():
@@ -204,253 +924,43 @@ class ModelManager:
         - 建議使用 .env 檔案管理 API 金鑰
         - 確保 .env 檔案已加入 .gitignore
         """
-        # 載入 OpenAI API 金鑰
-        try:
-            openai_key = os.environ.get("OPENAI_API_KEY", "").strip()
+        # .env 已由 _load_env_once 於行程內載入一次，此處只查詢所需的少數變數，不複製整個環境
+        environ = os.environ
 
-            if openai_key:
-                self.api_keys["openai"] = openai_key
-                logger.info("已從環境變數 / .env 載入 OpenAI API 金鑰")
-            else:
-                logger.debug("未設定 OpenAI API 金鑰")
-        except Exception as e:
-            logger.error(f"載入 OpenAI API 金鑰時發生錯誤: {e!s}")
-
-        # 載入 Google Gemini API 金鑰
         try:
-            # 支援兩種環境變數名稱
-            google_key = os.environ.get("GOOGLE_API_KEY", "").strip()
-            if not google_key:
-                google_key = os.environ.get("GEMINI_API_KEY", "").strip()
-
-            if google_key:
-                self.api_keys["google"] = google_key
-                logger.info("已從環境變數 / .env 載入 Google API 金鑰")
+            for provider, display_name, env_vars in _API_KEY_PROVIDERS:
+                # 依序取第一個有值的環境變數
+                key = next((value for value in (environ.get(var, "").strip() for var in env_vars) if value), "")
+                if key:
+                    self.api_keys[provider] = key
+                    logger.info("已從環境變數 / .env 載入 %s API 金鑰", display_name)
+                else:
+                    logger.debug("未設定 %s API 金鑰", display_name)
         except Exception as e:
-            logger.error(f"載入 Google API 金鑰時發生錯誤: {e!s}")
+            logger.error("載入 API 金鑰時發生錯誤: %s", e)
 
     def _init_model_info_database(self) -> None:
-        """初始化模型資訊資料庫"""
-        self.model_database: dict[str, ModelInfo] = {}
-
-        # OpenAI 模型資訊
-        openai_models = {
-            "gpt-4.1-mini": ModelInfo(
-                id="gpt-4.1-mini",
-                provider="openai",
-                name="GPT-4.1 Mini",
-                description="高性價比翻譯首選：指令遵循佳、速度快，費用約為 GPT-4o 的 1/6",
-                context_length=1047576,
-                pricing="低",
-                recommended_for="字幕翻譯與日常翻譯，最具成本效益",
-                parallel=30,
-                tags=["recommended", "fast", "economic", "accurate"],
-                capabilities={"translation": 0.95, "multilingual": 0.96, "context_handling": 0.96},
-            ),
-            "gpt-4.1": ModelInfo(
-                id="gpt-4.1",
-                provider="openai",
-                name="GPT-4.1",
-                description="OpenAI 旗艦級指令模型，術語遵循與長文件一致性最佳",
-                context_length=1047576,
-                pricing="高",
-                recommended_for="專業翻譯，需要最高品質與術語一致性",
-                parallel=25,
-                tags=["advanced", "accurate"],
-                capabilities={"translation": 0.98, "multilingual": 0.98, "context_handling": 0.98},
-            ),
-            "gpt-4.1-nano": ModelInfo(
-                id="gpt-4.1-nano",
-                provider="openai",
-                name="GPT-4.1 Nano",
-                description="最便宜最快的輕量模型，適合大量低難度翻譯",
-                context_length=1047576,
-                pricing="低",
-                recommended_for="大批量簡單翻譯，速度與成本優先",
-                parallel=35,
-                tags=["fast", "economic"],
-                capabilities={"translation": 0.88, "multilingual": 0.88, "context_handling": 0.90},
-            ),
-            "gpt-4o": ModelInfo(
-                id="gpt-4o",
-                provider="openai",
-                name="GPT-4o",
-                description="上一代旗艦模型（legacy），品質佳但費用高、速率限額較緊",
-                context_length=128000,
-                pricing="高",
-                recommended_for="既有工作流相容性，新工作建議改用 GPT-4.1 系列",
-                parallel=25,
-                tags=["legacy", "fast", "accurate"],
-                capabilities={"translation": 0.96, "multilingual": 0.97, "context_handling": 0.96},
-            ),
-            "gpt-4-turbo": ModelInfo(
-                id="gpt-4-turbo",
-                provider="openai",
-                name="GPT-4 Turbo",
-                description="強大的翻譯模型，適合需要高品質翻譯的場合",
-                context_length=128000,
-                pricing="高",
-                recommended_for="專業翻譯，需要高品質",
-                parallel=20,
-                tags=["advanced", "accurate"],
-                capabilities={"translation": 0.96, "multilingual": 0.95, "context_handling": 0.96},
-            ),
-            "gpt-4": ModelInfo(
-                id="gpt-4",
-                provider="openai",
-                name="GPT-4",
-                description="強大而穩定的翻譯模型",
-                context_length=8192,
-                pricing="高",
-                recommended_for="專業翻譯，需要高品質",
-                parallel=15,
-                tags=["advanced", "stable"],
-                capabilities={"translation": 0.94, "multilingual": 0.93, "context_handling": 0.95},
-            ),
-            "gpt-3.5-turbo-16k": ModelInfo(
-                id="gpt-3.5-turbo-16k",
-                provider="openai",
-                name="GPT-3.5 Turbo (16K)",
-                description="具有較大上下文視窗的經濟型模型",
-                context_length=16384,
-                pricing="中",
-                recommended_for="包含較多上下文的一般翻譯",
-                parallel=30,
-                tags=["balanced", "extended_context"],
-                capabilities={"translation": 0.88, "multilingual": 0.86, "context_handling": 0.90},
-            ),
-            "gpt-3.5-turbo": ModelInfo(
-                id="gpt-3.5-turbo",
-                provider="openai",
-                name="GPT-3.5 Turbo",
-                description="平衡經濟性和翻譯品質的模型",
-                context_length=4096,
-                pricing="低",
-                recommended_for="日常翻譯，最具成本效益",
-                parallel=35,
-                tags=["balanced", "economic"],
-                capabilities={"translation": 0.85, "multilingual": 0.84, "context_handling": 0.82},
-            ),
-        }
-
-        # Google Gemini 模型資訊
-        google_models = {
-            # Gemini 3 系列（最新，2025年11月發布）
-            "gemini-3-pro": ModelInfo(
-                id="gemini-3-pro",
-                provider="google",
-                name="Gemini 3 Pro",
-                description="Google 最新旗艦模型，推理優先設計，適合複雜翻譯任務",
-                context_length=1048576,
-                pricing="高",
-                recommended_for="專業翻譯、文學翻譯、需要最高品質",
-                parallel=15,
-                tags=["advanced", "accurate", "reasoning", "multilingual"],
-                capabilities={"translation": 0.98, "multilingual": 0.99, "context_handling": 0.97},
-            ),
-            "gemini-3-flash": ModelInfo(
-                id="gemini-3-flash",
-                provider="google",
-                name="Gemini 3 Flash",
-                description="Google 最新快速模型，強大的多模態理解和推理能力",
-                context_length=1048576,
-                pricing="中",
-                recommended_for="一般翻譯任務，平衡速度與品質",
-                parallel=25,
-                tags=["fast", "balanced", "reasoning", "multilingual"],
-                capabilities={"translation": 0.95, "multilingual": 0.96, "context_handling": 0.94},
-            ),
-            # Gemini 2.5 系列
-            "gemini-2.5-pro": ModelInfo(
-                id="gemini-2.5-pro",
-                provider="google",
-                name="Gemini 2.5 Pro",
-                description="Google 進階專業模型，適合高品質翻譯",
-                context_length=1048576,
-                pricing="高",
-                recommended_for="專業翻譯、需要高品質輸出",
-                parallel=15,
-                tags=["advanced", "accurate", "multilingual"],
-                capabilities={"translation": 0.97, "multilingual": 0.98, "context_handling": 0.96},
-            ),
-            "gemini-2.5-flash": ModelInfo(
-                id="gemini-2.5-flash",
-                provider="google",
-                name="Gemini 2.5 Flash",
-                description="Google 快速模型，平衡速度與品質",
-                context_length=1048576,
-                pricing="中",
-                recommended_for="一般翻譯任務，需要良好的速度和品質",
-                parallel=25,
-                tags=["balanced", "fast", "multilingual"],
-                capabilities={"translation": 0.93, "multilingual": 0.94, "context_handling": 0.92},
-            ),
-            "gemini-2.5-flash-lite": ModelInfo(
-                id="gemini-2.5-flash-lite",
-                provider="google",
-                name="Gemini 2.5 Flash Lite",
-                description="Google 輕量快速模型，優化速度和成本效益",
-                context_length=1048576,
-                pricing="低",
-                recommended_for="大批量翻譯任務，速度快且成本低",
-                parallel=30,
-                tags=["fast", "economic", "lite", "multilingual"],
-                capabilities={"translation": 0.90, "multilingual": 0.91, "context_handling": 0.88},
-            ),
-            # Gemini 2.0 系列（將於 2026年3月退役）
-            "gemini-2.0-flash": ModelInfo(
-                id="gemini-2.0-flash",
-                provider="google",
-                name="Gemini 2.0 Flash",
-                description="Google 2.0 快速模型（將於 2026年3月退役）",
-                context_length=1048576,
-                pricing="低",
-                recommended_for="大批量翻譯任務，速度快且成本低",
-                parallel=30,
-                tags=["fast", "economic", "multilingual", "legacy"],
-                capabilities={"translation": 0.90, "multilingual": 0.92, "context_handling": 0.88},
-            ),
-        }
-
-        # llama.cpp 本地模型資訊（騰訊 Hunyuan-MT2 翻譯專用模型）
-        # id 刻意使用 GGUF 檔名，使未指定 -m 時推薦結果能觸發 hunyuan-mt prompt 策略；
-        # llama-server 會忽略 API 的 model 欄位、改用實際載入的模型，故名稱僅影響 prompt 策略。
-        llamacpp_models = {
-            "Hy-MT2-7B-Q4_K_M": ModelInfo(
-                id="Hy-MT2-7B-Q4_K_M",
-                provider="llamacpp",
-                name="Hunyuan-MT2 7B (Q4_K_M)",
-                description="騰訊 Hunyuan-MT2 翻譯專用模型 7B，支援 33 語言；8GB VRAM 可全載入，品質優於 1.8B",
-                context_length=262144,
-                pricing="免費(本機執行)",
-                recommended_for="高品質日英中字幕翻譯（本地首選，速度快、語意理解佳）",
-                parallel=3,
-                tags=["free", "local", "translation", "multilingual", "chinese"],
-                capabilities={"translation": 0.95, "multilingual": 0.93, "context_handling": 0.6, "chinese": 0.93},
-            ),
-            "Hy-MT2-1.8B-Q8_0": ModelInfo(
-                id="Hy-MT2-1.8B-Q8_0",
-                provider="llamacpp",
-                name="Hunyuan-MT2 1.8B (Q8_0)",
-                description="騰訊 Hunyuan-MT2 翻譯專用模型 1.8B，極輕量、速度最快；品質略遜 7B",
-                context_length=262144,
-                pricing="免費(本機執行)",
-                recommended_for="低資源環境的快速字幕翻譯",
-                parallel=3,
-                tags=["free", "local", "translation", "multilingual", "chinese", "fast"],
-                capabilities={"translation": 0.88, "multilingual": 0.86, "context_handling": 0.55, "chinese": 0.88},
-            ),
-        }
-
-        # 合併所有模型資訊到資料庫
-        for model in openai_models.values():
-            self.model_database[f"openai:{model.id}"] = model
-
-        for model in google_models.values():
-            self.model_database[f"google:{model.id}"] = model
-
-        for model in llamacpp_models.values():
-            self.model_database[f"llamacpp:{model.id}"] = model
+        """初始化模型可用性狀態（內建模型本身存於模組層級的共用登錄表）"""
+        # 各實例自行記錄的可用性覆寫（如 API 金鑰驗證結果），不影響共用的 ModelInfo
+        self._availability: dict[str, bool] = {}
+        # 推薦模型快取：(任務類型, 提供者) -> (計算時的登錄表, 結果)；登錄表重建或可用性變更即失效
+        self._recommended_cache: dict[tuple[str, str | None], tuple[_Registry, ModelInfo | None]] = {}
+
+    @property
+    def model_database(self) -> Mapping[str, ModelInfo]:
+        """完整模型資訊資料庫的唯讀視圖（存取時載入所有提供者的內建模型）"""
+        _ensure_all_providers_loaded()
+        return _REGISTRY.models
+
+    def _is_available(self, key: str, model: ModelInfo) -> bool:
+        """取得模型在此實例中的可用性（優先採用實例層級的覆寫）"""
+        return self._availability.get(key, model.available)
+
+    def _model_to_dict(self, key: str, model: ModelInfo) -> dict[str, Any]:
+        """將模型轉為字典，並套用此實例的可用性覆寫"""
+        data = model.to_dict()
+        data["available"] = self._is_available(key, model)
+        return data
 
     def _get_session_lock(self) -> asyncio.Lock:
         """取得當前 event loop 可安全使用的 session lock。"""
@@ -464,6 +974,22 @@ class ModelManager:
 
         return lock
 
+    def _provider_gate(self, provider: str) -> asyncio.Semaphore:
+        """取得當前 event loop 上限制指定提供者並行請求數的 semaphore
+
+        參數:
+            provider: 提供者名稱
+
+        回傳:
+            綁定於當前 event loop 的 asyncio.Semaphore
+        """
+        current_loop = asyncio.get_running_loop()
+        entry = self._provider_sems.get(provider)
+        if entry is None or entry[0] is not current_loop:
+            entry = (current_loop, asyncio.Semaphore(PROVIDER_CONCURRENCY.get(provider, 4)))
+            self._provider_sems[provider] = entry
+        return entry[1]
+
     async def _init_async_session(self) -> None:
         """初始化非同步 HTTP 客戶端"""
         session_lock = self._get_session_lock()
@@ -479,16 +1005,26 @@ class ModelManager:
                     self.session = None
                     logger.debug("偵測到 HTTP 客戶端 session 的 event loop 已關閉，將重新建立")
                 elif session_loop is not None and session_loop is not current_loop:
-                    self.session = None
+                    stale_session, self.session = self.session, None
                     logger.debug("偵測到 HTTP 客戶端 session 屬於不同 event loop，將重新建立")
+                    await self._close_session_on_loop(stale_session, session_loop)
             if self.session is None:
                 timeout = aiohttp.ClientTimeout(
-                    total=self.request_timeout,
-                    connect=self.connect_timeout,
-                    sock_connect=self.connect_timeout,
-                    sock_read=self.request_timeout,
+                    total=self.rcfg.request_timeout,
+                    connect=self.rcfg.connect_timeout,
+                    sock_connect=self.rcfg.connect_timeout,
+                    sock_read=self.rcfg.request_timeout,
+                )
+                # 明確的連線池設定：各提供者端點分屬不同主機，保留 keep-alive 並快取 DNS；
+                # 連線數上限可由 http_pool_size / http_limit_per_host 調整，connector 隨 session 一併關閉
+                connector = aiohttp.TCPConnector(
+                    limit=self.rcfg.http_pool_size,
+                    limit_per_host=self.rcfg.http_limit_per_host,
+                    ttl_dns_cache=300,
+                    enable_cleanup_closed=True,
+                    keepalive_timeout=75,
                 )
-                self.session = aiohttp.ClientSession(timeout=timeout)
+                self.session = aiohttp.ClientSession(connector=connector, timeout=timeout)
                 logger.debug("已初始化非同步 HTTP 客戶端")
 
     async def _close_async_session(self) -> None:
@@ -499,7 +1035,7 @@ class ModelManager:
                 try:
                     await self.session.close()
                 except RuntimeError as e:
-                    logger.debug(f"關閉跨 event loop 的 HTTP 客戶端 session 時略過例外: {e!s}")
+                    logger.debug("關閉跨 event loop 的 HTTP 客戶端 session 時略過例外: %s", e)
                 self.session = None
                 logger.debug("已關閉非同步 HTTP 客戶端")
 
@@ -514,18 +1050,31 @@ class ModelManager:
             ModelInfo物件列表
         """
         await self._init_async_session()
+        _ensure_provider_loaded(llm_type)
 
         try:
             # 檢查快取是否有效
-            if llm_type in self.cached_models:
-                elapsed = time.time() - self.cache_time.get(llm_type, 0)
-                if elapsed < self.cache_expiry:
-                    return self.cached_models[llm_type]
+            entry = self._cache.get(llm_type)
+            if entry is not None and time.monotonic() - entry[0] < self.rcfg.cache_expiry:
+                self._cache.move_to_end(llm_type)
+                return entry[1]
 
             # 如果沒有提供API金鑰，使用已存的金鑰
             if api_key is None:
                 api_key = self.api_keys.get(llm_type)
 
+            # 第二層：磁碟快取（依金鑰摘要區分，未提供金鑰時的預設列表不寫入）
+            disk_cache = None
+            disk_key = ""
+            if api_key and llm_type in _PERSISTED_MODEL_LISTS and self.config.get("persistent_model_cache", False):
+                disk_cache = _get_model_list_disk_cache()
+                disk_key = f"{llm_type}:{_credential_digest(api_key)}"
+            if disk_cache is not None:
+                persisted = disk_cache.get(disk_key)
+                if persisted is not None:
+                    self._remember_models(llm_type, persisted)
+                    return persisted
+
             # 根據不同 LLM 類型獲取模型列表
             if llm_type == "openai":
                 models = await self._get_openai_models_async(api_key or "")
@@ -534,21 +1083,22 @@ class ModelManager:
             elif llm_type == "google" and GOOGLE_AVAILABLE:
                 models = await self._get_google_models_async(api_key or "")
             else:
-                logger.warning(f"不支援的 LLM 類型: {llm_type}，返回空列表")
+                logger.warning("不支援的 LLM 類型: %s，返回空列表", llm_type)
                 models = []
 
-            # 更新快取
-            self.cached_models[llm_type] = models
-            self.cache_time[llm_type] = time.time()
+            self._remember_models(llm_type, models)
+            if disk_cache is not None and models:
+                disk_cache.put(disk_key, models, self.rcfg.cache_expiry)
 
             return models
 
         except Exception as e:
-            logger.error(f"獲取模型列表失敗: {e!s}")
+            logger.error("獲取模型列表失敗: %s", e)
             # 如果之前有快取，使用過期快取
-            if llm_type in self.cached_models:
+            stale = self._cache.get(llm_type)
+            if stale is not None:
                 logger.info("使用過期快取的模型列表")
-                return self.cached_models[llm_type]
+                return stale[1]
 
             # 返回預設模型
             if llm_type == "openai":
@@ -558,6 +1108,26 @@ class ModelManager:
                 return self._get_llamacpp_fallback_models()
             return []
 
+    def _remember_models(self, llm_type: str, models: list[ModelInfo]) -> None:
+        """寫入記憶體中的模型列表快取（LRU：超過上限時淘汰最久未使用的項目）"""
+        self._cache[llm_type] = (time.monotonic(), models)
+        self._cache.move_to_end(llm_type)
+        while len(self._cache) > MODEL_LIST_CACHE_SIZE:
+            self._cache.popitem(last=False)
+
+    async def get_model_lists_async(self, llm_types: Iterable[str] | None = None) -> dict[str, list[ModelInfo]]:
+        """並行獲取多個提供者的模型列表
+
+        參數:
+            llm_types: LLM類型列表，若為None則查詢所有內建提供者
+
+        回傳:
+            {LLM類型: ModelInfo物件列表} 字典
+        """
+        types = list(llm_types) if llm_types is not None else list(_model_catalog())
+        results = await asyncio.gather(*(self.get_model_list_async(llm_type) for llm_type in types))
+        return dict(zip(types, results, strict=True))
+
     def get_model_list(self, llm_type: str, api_key: str | None = None) -> list[str]:
         """同步獲取模型列表(字串列表版本，向後相容)
 
@@ -568,32 +1138,75 @@ class ModelManager:
         回傳:
             模型名稱字串列表
         """
-        # 確保在正確的事件循環中執行
-        try:
-            loop = asyncio.get_event_loop()
-            if loop.is_closed():
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-        except RuntimeError:
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
+        future = asyncio.run_coroutine_threadsafe(self.get_model_list_async(llm_type, api_key), self._get_sync_loop())
+        # 轉換為字串列表，保持向後相容
+        return [model.id for model in future.result()]
+
+    def _get_sync_loop(self) -> asyncio.AbstractEventLoop:
+        """取得同步包裝方法使用的背景 event loop（所有實例共用，HTTP session 也綁定於此 loop）
 
+        回傳:
+            背景執行中的 event loop
+        """
+        self._sync_loop = _get_background_loop()
+        return self._sync_loop
+
+    def close(self) -> None:
+        """同步關閉此實例持有的 HTTP session 與 SDK 客戶端"""
+        self._close_clients()
+        self._retire_session()
+
+    @staticmethod
+    async def _close_session_on_loop(session: aiohttp.ClientSession, loop: asyncio.AbstractEventLoop) -> None:
+        """於 session 所屬的另一個 event loop 上關閉它，不阻塞目前的 loop
+
+        參數:
+            session: 要關閉的 HTTP session
+            loop: session 所屬且尚未關閉的 event loop
+        """
         try:
-            model_infos = loop.run_until_complete(self.get_model_list_async(llm_type, api_key))
-            # 轉換為字串列表，保持向後相容
-            return [model.id for model in model_infos]
-        finally:
-            # 只在我們創建的新循環中關閉
             if loop.is_running():
-                pass  # 不關閉正在運行的循環
-            elif not loop.is_closed():
-                loop.close()
+                future = asyncio.run_coroutine_threadsafe(session.close(), loop)
+                await asyncio.wait_for(asyncio.wrap_future(future), timeout=5)
+            else:
+                # 閒置的 loop 無法在目前執行中的 loop 內驅動，改由工作執行緒執行關閉
+                await asyncio.to_thread(loop.run_until_complete, session.close())
+        except Exception as e:
+            logger.debug("關閉 HTTP 客戶端 session 失敗: %s", e)
+
+    def _retire_session(self) -> None:
+        """同步釋放目前的 HTTP session，並於其所屬 event loop 上關閉
+
+        session 所屬的 loop 若在其他執行緒執行中，交由該 loop 關閉並等待完成；
+        若正是目前執行緒的 loop，排入關閉工作後立即返回；loop 已關閉時僅釋放參照。
+        """
+        session, self.session = self.session, None
+        if session is None or session.closed:
+            return
+
+        loop: asyncio.AbstractEventLoop | None = getattr(session, "_loop", None)
+        try:
+            if loop is None or loop.is_closed():
+                return
+            if not loop.is_running():
+                loop.run_until_complete(session.close())
+                return
+            future = asyncio.run_coroutine_threadsafe(session.close(), loop)
+            try:
+                current_loop: asyncio.AbstractEventLoop | None = asyncio.get_running_loop()
+            except RuntimeError:
+                current_loop = None
+            if current_loop is not loop:
+                future.result(timeout=5)
+        except Exception as e:
+            logger.debug("關閉 HTTP 客戶端 session 失敗: %s", e)
 
     def _create_default_openai_model(self) -> ModelInfo:
         """建立預設 OpenAI 模型"""
+        _ensure_provider_loaded("openai")
         key = "openai:gpt-4.1-mini"
-        if key in self.model_database:
-            model = self.model_database[key]
+        if key in _REGISTRY.models:
+            model = _REGISTRY.models[key]
         else:
             model = ModelInfo(
                 id="gpt-4.1-mini",
@@ -618,105 +1231,60 @@ class ModelManager:
             return []
 
         try:
-            # 建立 Google Gemini 模型列表
-            google_models = [
-                # Gemini 3 系列（最新，2025年11月發布）
-                ModelInfo(
-                    id="gemini-3-pro",
-                    provider="google",
-                    name="Gemini 3 Pro",
-                    description="Google 最新旗艦模型，推理優先設計，適合複雜翻譯任務",
-                    context_length=1048576,
-                    pricing="高",
-                    recommended_for="專業翻譯、文學翻譯、需要最高品質",
-                    parallel=15,
-                    tags=["advanced", "accurate", "reasoning", "multilingual"],
-                    capabilities={"translation": 0.98, "multilingual": 0.99, "context_handling": 0.97},
-                ),
-                ModelInfo(
-                    id="gemini-3-flash",
-                    provider="google",
-                    name="Gemini 3 Flash",
-                    description="Google 最新快速模型，強大的多模態理解和推理能力",
-                    context_length=1048576,
-                    pricing="中",
-                    recommended_for="一般翻譯任務，平衡速度與品質",
-                    parallel=25,
-                    tags=["fast", "balanced", "reasoning", "multilingual"],
-                    capabilities={"translation": 0.95, "multilingual": 0.96, "context_handling": 0.94},
-                ),
-                # Gemini 2.5 系列
-                ModelInfo(
-                    id="gemini-2.5-pro",
-                    provider="google",
-                    name="Gemini 2.5 Pro",
-                    description="Google 進階專業模型，適合高品質翻譯",
-                    context_length=1048576,
-                    pricing="高",
-                    recommended_for="專業翻譯、需要高品質輸出",
-                    parallel=15,
-                    tags=["advanced", "accurate", "multilingual"],
-                    capabilities={"translation": 0.97, "multilingual": 0.98, "context_handling": 0.96},
-                ),
-                ModelInfo(
-                    id="gemini-2.5-flash",
-                    provider="google",
-                    name="Gemini 2.5 Flash",
-                    description="Google 快速模型，平衡速度與品質",
-                    context_length=1048576,
-                    pricing="中",
-                    recommended_for="一般翻譯任務，需要良好的速度和品質",
-                    parallel=25,
-                    tags=["balanced", "fast", "multilingual"],
-                    capabilities={"translation": 0.93, "multilingual": 0.94, "context_handling": 0.92},
-                ),
-                ModelInfo(
-                    id="gemini-2.5-flash-lite",
-                    provider="google",
-                    name="Gemini 2.5 Flash Lite",
-                    description="Google 輕量快速模型，優化速度和成本效益",
-                    context_length=1048576,
-                    pricing="低",
-                    recommended_for="大批量翻譯任務，速度快且成本低",
-                    parallel=30,
-                    tags=["fast", "economic", "lite", "multilingual"],
-                    capabilities={"translation": 0.90, "multilingual": 0.91, "context_handling": 0.88},
-                ),
-                # Gemini 2.0 系列（將於 2026年3月退役）
-                ModelInfo(
-                    id="gemini-2.0-flash",
-                    provider="google",
-                    name="Gemini 2.0 Flash",
-                    description="Google 2.0 快速模型（將於 2026年3月退役）",
-                    context_length=1048576,
-                    pricing="低",
-                    recommended_for="大批量翻譯任務，速度快且成本低",
-                    parallel=30,
-                    tags=["fast", "economic", "multilingual", "legacy"],
-                    capabilities={"translation": 0.90, "multilingual": 0.92, "context_handling": 0.88},
-                ),
-            ]
+            # 直接沿用內建模型目錄，不另行建立重複的 ModelInfo
+            _ensure_provider_loaded("google")
+            google_models = list(_REGISTRY.by_provider.get("google", ()))
+
+            # 驗證 API 金鑰是否有效：結果記錄於實例的可用性覆寫，並以副本回傳，不改動共用登錄表
+            valid = await self._validate_google_api_key(api_key)
+            for model in google_models:
+                self._availability[f"google:{model.id}"] = valid
+            self._recommended_cache.clear()
+            return [replace(model, available=valid) for model in google_models]
+        except Exception as e:
+            logger.error("獲取 Google 模型列表失敗: %s", e)
+            return []
 
-            # 驗證 API 金鑰是否有效
-            try:
-                with genai.Client(api_key=api_key) as client:
-                    # 使用簡單的請求驗證 API 金鑰
-                    response = client.models.generate_content(model="gemini-2.5-flash", contents="Hi")
-                    if response.text:
-                        # 呼叫成功，API 金鑰有效
-                        for model in google_models:
-                            model.available = True
-                        logger.info("Google API 金鑰驗證成功")
-            except Exception as e:
-                logger.warning(f"Google API 金鑰驗證失敗: {e!s}")
-                # 標記所有模型為不可用
-                for model in google_models:
-                    model.available = False
+    async def _validate_google_api_key(self, api_key: str) -> bool:
+        """以免費的模型列表端點驗證 Google API 金鑰
+
+        不發送計費的 generate_content 請求，而是透過共用 session 查詢 models 端點；
+        有效結果快取 API_KEY_VALIDATION_TTL 秒，無效結果快取 API_KEY_INVALID_TTL 秒。
+
+        參數:
+            api_key: Google API 金鑰
+
+        回傳:
+            金鑰是否有效
+        """
+        cache_key = ("google", _credential_digest(api_key))
+        cached = self._api_key_valid.get(cache_key)
+        if cached is not None and time.monotonic() < cached[1]:
+            return cached[0]
 
-            return google_models
+        async def probe() -> bool:
+            await self._init_async_session()
+            assert self.session is not None
+            async with (
+                self._provider_gate("google"),
+                self.session.get(GOOGLE_MODELS_ENDPOINT, headers={"x-goog-api-key": api_key}) as response,
+            ):
+                return response.status == 200
+
+        try:
+            valid = await asyncio.wait_for(probe(), timeout=self.rcfg.connect_timeout)
         except Exception as e:
-            logger.error(f"獲取 Google 模型列表失敗: {e!s}")
-            return []
+            # 網路錯誤或逾時不快取，下次重新驗證
+            logger.warning("Google API 金鑰驗證失敗: %s", e)
+            return False
+
+        ttl = API_KEY_VALIDATION_TTL if valid else API_KEY_INVALID_TTL
+        self._api_key_valid[cache_key] = (valid, time.monotonic() + ttl)
+        if valid:
+            logger.info("Google API 金鑰驗證成功")
+        else:
+            logger.warning("Google API 金鑰驗證失敗: 金鑰無效或無權限")
+        return valid
 
     def get_default_model(self, llm_type: str) -> str:
         """返回預設模型，針對翻譯進行最佳化
@@ -732,7 +1300,7 @@ class ModelManager:
             "google": "gemini-2.0-flash",  # 最快速且經濟的選擇
             "llamacpp": "local-model",  # llama-server 載入的模型
         }
-        return provider_defaults.get(llm_type, self.default_llamacpp_model)
+        return provider_defaults.get(llm_type, self.rcfg.default_llamacpp_model)
 
     def get_model_info(self, model_name: str, provider: str | None = None) -> dict[str, Any]:
         """獲取模型的詳細資訊
@@ -746,68 +1314,17 @@ class ModelManager:
         """
         # 如果提供了 provider，使用組合鍵查詢
         if provider:
+            _ensure_provider_loaded(provider)
             key = f"{provider}:{model_name}"
-            if key in self.model_database:
-                return self.model_database[key].to_dict()
-
-        # 直接查詢模型資料庫
-        for _key, model in self.model_database.items():
-            if model.id == model_name:
-                return model.to_dict()
-
-        # 嘗試在 OpenAI 預設模型中查找
-        openai_models = {
-            "gpt-4.1-mini": {
-                "description": "高性價比翻譯首選，指令遵循佳、速度快",
-                "pricing": "低",
-                "recommended_for": "字幕翻譯與日常翻譯，最具成本效益",
-                "parallel": 30,
-            },
-            "gpt-4.1": {
-                "description": "OpenAI 旗艦級指令模型，術語遵循與長文件一致性最佳",
-                "pricing": "高",
-                "recommended_for": "專業翻譯，需要最高品質",
-                "parallel": 25,
-            },
-            "gpt-4.1-nano": {
-                "description": "最便宜最快的輕量模型",
-                "pricing": "低",
-                "recommended_for": "大批量簡單翻譯",
-                "parallel": 35,
-            },
-            "gpt-4o": {
-                "description": "上一代旗艦模型（legacy），品質佳但費用高",
-                "pricing": "高",
-                "recommended_for": "既有工作流相容性，新工作建議改用 GPT-4.1 系列",
-                "parallel": 20,
-            },
-            "gpt-4-turbo": {
-                "description": "強大的翻譯模型，適合需要高品質翻譯的場合",
-                "pricing": "高",
-                "recommended_for": "專業翻譯，需要高品質",
-                "parallel": 15,
-            },
-            "gpt-4": {
-                "description": "強大而穩定的翻譯模型",
-                "pricing": "高",
-                "recommended_for": "專業翻譯，需要高品質",
-                "parallel": 10,
-            },
-            "gpt-3.5-turbo-16k": {
-                "description": "具有較大上下文視窗的翻譯模型",
-                "pricing": "中",
-                "recommended_for": "包含較多上下文的翻譯",
-                "parallel": 25,
-            },
-            "gpt-3.5-turbo": {
-                "description": "平衡經濟性和翻譯品質的模型",
-                "pricing": "低",
-                "recommended_for": "日常翻譯，最具成本效益",
-                "parallel": 30,
-            },
-        }
-        if model_name in openai_models:
-            return {"id": model_name, "name": model_name, "provider": "openai", **openai_models[model_name]}
+            if key in _REGISTRY.models:
+                return self._model_to_dict(key, _REGISTRY.models[key])
+
+        # 以模型 ID 索引查詢（需先載入所有提供者）
+        _ensure_all_providers_loaded()
+        found = _REGISTRY.by_id.get(model_name)
+        if found is not None:
+            return self._model_to_dict(f"{found.provider}:{found.id}", found)
+
         return {}
 
     def get_recommended_model(
@@ -826,55 +1343,66 @@ class ModelManager:
             [provider] if provider else self.config.get("default_providers", ["llamacpp", "openai"])
         )
 
-        # 定義不同任務的能力權重
-        task_weights = {
-            "translation": {"translation": 0.7, "multilingual": 0.2, "context_handling": 0.1},
-            "literary": {  # 文學翻譯
-                "translation": 0.5,
-                "multilingual": 0.2,
-                "context_handling": 0.3,
-            },
-            "technical": {  # 技術文件翻譯
-                "translation": 0.6,
-                "multilingual": 0.1,
-                "context_handling": 0.3,
-            },
-            "subtitle": {  # 字幕翻譯
-                "translation": 0.5,
-                "multilingual": 0.3,
-                "context_handling": 0.2,
-            },
-        }
-
-        weights = task_weights.get(task_type, task_weights["translation"])
+        task = task_type if task_type in _TASK_WEIGHT_VECTORS else "translation"
 
-        # 獲取所有可用模型
-        all_models = []
         for provider_name in available_providers:
-            for _key, model in self.model_database.items():
-                if model.provider == provider_name and model.available:
-                    all_models.append(model)
+            _ensure_provider_loaded(provider_name)
 
-        if not all_models:
-            return None
+        # 常見的重複呼叫（如每行字幕皆以相同參數查詢）直接沿用上次結果
+        cache_key = (task, provider)
+        cached = self._recommended_cache.get(cache_key)
+        if cached is not None and cached[0] is _REGISTRY:
+            return cached[1]
 
-        # 計算每個模型的得分
-        scored_models: list[tuple[ModelInfo, float]] = []
-        for model in all_models:
-            score: float = 0.0
-            for capability, weight in weights.items():
-                if capability in model.capabilities:
-                    score += model.capabilities[capability] * weight
+        # 各提供者的模型排序已預先計算並快取於登錄表；只需找出每個提供者排序中第一個可用的模型
+        best: ModelInfo | None = None
+        best_score = 0.0
+        for provider_name in available_providers:
+            for model, score in _REGISTRY.ranked(provider_name, task):
+                if self._is_available(f"{provider_name}:{model.id}", model):
+                    # 同分時保留先出現的提供者，與對全部候選取最大值的結果相同
+                    if best is None or score > best_score:
+                        best, best_score = model, score
+                    break
 
-            scored_models.append((model, score))
+        self._recommended_cache[cache_key] = (_REGISTRY, best)
+        return best
 
-        # 按得分排序
-        scored_models.sort(key=lambda x: x[1], reverse=True)
+    def _get_client(self, provider: str, api_key: str) -> Any:
+        """取得（必要時建立）指定提供者與金鑰的共用 SDK 客戶端
 
-        # 返回得分最高的模型
-        if scored_models:
-            return scored_models[0][0]
-        return None
+        參數:
+            provider: 提供者 ("openai" 或 "google")
+            api_key: API 金鑰
+
+        回傳:
+            SDK 客戶端實例
+        """
+        key = (provider, _credential_digest(api_key))
+        client = self._clients.get(key)
+        if client is None:
+            with self._clients_lock:
+                client = self._clients.get(key)
+                if client is None:
+                    if provider == "openai":
+                        _import_openai()
+                        client = OpenAI(api_key=api_key)
+                    else:
+                        _import_genai()
+                        client = genai.Client(api_key=api_key)
+                    self._clients[key] = client
+        return client
+
+    def _close_clients(self) -> None:
+        """關閉並清空 SDK 客戶端池"""
+        with self._clients_lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            try:
+                client.close()
+            except Exception as e:
+                logger.debug("關閉 SDK 客戶端時略過例外: %s", e)
 
     async def _test_openai_connection(self, model_name: str, api_key: str) -> tuple[bool, str]:
         """測試 OpenAI 模型連線
@@ -892,11 +1420,19 @@ class ModelManager:
         if not OPENAI_AVAILABLE:
             return False, "未安裝 OpenAI 客戶端函式庫"
 
+        # 下方的例外處理需要 openai 模組的例外類別
+        _import_openai()
         try:
-            client = OpenAI(api_key=api_key)
-            response = client.chat.completions.create(
-                model=model_name, messages=[{"role": "user", "content": "Hello"}], max_tokens=5
-            )
+            client = self._get_client("openai", api_key)
+            # 同步客戶端的請求移至工作執行緒，不阻塞 event loop 上的其他工作；
+            # 只需確認模型接受請求，生成上限設為 1 個 token 以縮短延遲並減少計費
+            async with self._provider_gate("openai"):
+                response = await asyncio.to_thread(
+                    client.chat.completions.create,
+                    model=model_name,
+                    messages=[{"role": "user", "content": "Hello"}],
+                    max_tokens=1,
+                )
 
             if response and response.choices and len(response.choices) > 0:
                 return True, "模型回應正常"
@@ -931,13 +1467,15 @@ class ModelManager:
             return False, "未提供 API 金鑰"
 
         try:
-            with genai.Client(api_key=api_key) as client:
-                response = client.models.generate_content(model=model_name, contents="Hello")
+            client = self._get_client("google", api_key)
+            # 同步客戶端的請求移至工作執行緒，不阻塞 event loop 上的其他工作
+            async with self._provider_gate("google"):
+                response = await asyncio.to_thread(client.models.generate_content, model=model_name, contents="Hello")
 
-                if response and response.text:
-                    return True, "模型回應正常"
-                else:
-                    return False, "模型回應格式異常"
+            if response and response.text:
+                return True, "模型回應正常"
+            else:
+                return False, "模型回應格式異常"
 
         except Exception as e:
             error_msg = str(e).lower()
@@ -956,19 +1494,23 @@ class ModelManager:
             await self._init_async_session()
             assert self.session is not None
 
-            base_url = self.llamacpp_url.rstrip("/")
+            base_url = self.rcfg.llamacpp_url.rstrip("/")
             if base_url.endswith("/v1"):
                 base_url = base_url[:-3]
 
+            # 只需確認伺服器接受請求：生成 1 個 token 即返回，避免本機模型完整推論
             payload = {
                 "model": model_name,
                 "messages": [{"role": "user", "content": "Hello"}],
-                "max_tokens": 5,
+                "max_tokens": 1,
                 "temperature": 0,
             }
             url = f"{base_url}/v1/chat/completions"
 
-            async with self.session.post(url, json=payload, timeout=aiohttp.ClientTimeout(total=15)) as response:
+            async with (
+                self._provider_gate("llamacpp"),
+                self.session.post(url, json=payload, timeout=LLAMACPP_PROBE_TIMEOUT) as response,
+            ):
                 if response.status == 200:
                     return True, "模型回應正常"
 
@@ -995,38 +1537,96 @@ class ModelManager:
         回傳:
             測試結果字典，包含 success 和 message 欄位
         """
-        if provider == "openai":
-            key = api_key or self.api_keys.get("openai", "")
-            success, message = await self._test_openai_connection(model_name, key)
-            return {"success": success, "message": message}
-        elif provider == "google":
-            key = api_key or self.api_keys.get("google", "")
-            success, message = await self._test_google_connection(model_name, key)
-            return {"success": success, "message": message}
+        keyed_test = _KEYED_CONNECTION_TESTS.get(provider)
+        if keyed_test is not None:
+            key = api_key or self.api_keys.get(provider, "")
+            credential = key
         elif provider == "llamacpp":
-            success, message = await self._test_llamacpp_connection(model_name)
-            return {"success": success, "message": message}
+            key = ""
+            credential = self.rcfg.llamacpp_url
         else:
             return {"success": False, "message": f"不支援的提供者: {provider}"}
 
+        # 短時間內重複測試同一模型時直接沿用成功結果，避免重複發送（可能計費的）測試請求
+        cache_key = (provider, model_name, _credential_digest(credential))
+        cached = _cached_probe(cache_key)
+        if cached is not None:
+            return cached
+
+        # 同一 event loop 上已有相同測試進行中時，等待其結果而不另發請求
+        loop = asyncio.get_running_loop()
+        inflight = _PROBE_INFLIGHT.get(cache_key)
+        if inflight is not None and inflight.get_loop() is loop:
+            return dict(await asyncio.shield(inflight))
+
+        future: asyncio.Future[dict[str, Any]] = loop.create_future()
+        _PROBE_INFLIGHT[cache_key] = future
+        try:
+            if keyed_test is not None:
+                success, message = await getattr(self, keyed_test)(model_name, key)
+            else:
+                success, message = await self._test_llamacpp_connection(model_name)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # 標記例外已取得，沒有等待者時不產生 "exception was never retrieved" 警告
+            future.exception()
+            raise
+        finally:
+            if _PROBE_INFLIGHT.get(cache_key) is future:
+                del _PROBE_INFLIGHT[cache_key]
+
+        result = {"success": success, "message": message}
+        if success:
+            _store_probe(cache_key, result)
+        future.set_result(result)
+        return dict(result)
+
     async def get_provider_status(self) -> dict[str, bool]:
         """獲取各提供者的連線狀態
 
         回傳:
             包含各提供者狀態的字典
         """
-        status = {"openai": False, "google": False, "llamacpp": False}
+        cached = self._status_cache
+        if cached is not None and time.monotonic() - cached[0] < PROVIDER_STATUS_TTL:
+            return dict(cached[1])
+
+        # 各提供者的檢查並行執行，整體延遲取決於最慢的單一檢查
+        probes = {
+            "openai": self._probe_api_key_provider("openai", OPENAI_AVAILABLE),
+            "google": self._probe_api_key_provider("google", GOOGLE_AVAILABLE),
+            "llamacpp": self._probe_llamacpp(),
+        }
+        results = await asyncio.gather(*probes.values(), return_exceptions=True)
 
-        # 其他提供者需要 API 金鑰，檢查是否有有效金鑰和客戶端庫
-        status["openai"] = OPENAI_AVAILABLE and bool(self.api_keys.get("openai"))
-        status["google"] = GOOGLE_AVAILABLE and bool(self.api_keys.get("google"))
-        try:
-            success, _message = await self._test_llamacpp_connection(self.default_llamacpp_model)
-            status["llamacpp"] = success
-        except Exception:
-            status["llamacpp"] = False
+        # 檢查拋出例外視為無法連線
+        status = {name: result is True for name, result in zip(probes, results, strict=True)}
+        self._status_cache = (time.monotonic(), status)
+        return dict(status)
+
+    async def _probe_api_key_provider(self, provider: str, client_available: bool) -> bool:
+        """檢查需要 API 金鑰的提供者：客戶端函式庫已安裝且已設定金鑰
+
+        參數:
+            provider: 提供者名稱
+            client_available: 客戶端函式庫是否可用
+
+        回傳:
+            是否可用
+        """
+        return client_available and bool(self.api_keys.get(provider))
+
+    async def _probe_llamacpp(self) -> bool:
+        """檢查 llama.cpp server 是否可連線
 
-        return status
+        回傳:
+            是否可連線
+        """
+        success, _message = await self._test_llamacpp_connection(self.rcfg.default_llamacpp_model)
+        return success
 
     async def __aenter__(self):
         """非同步上下文管理器入口"""
@@ -1035,7 +1635,15 @@ class ModelManager:
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """非同步上下文管理器退出"""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """非同步關閉此實例持有的 HTTP session 與 SDK 客戶端
+
+        在 session 所屬的 event loop 上直接關閉，不另建暫時的 event loop。
+        """
         await self._close_async_session()
+        self._close_clients()
 
     async def _get_llamacpp_models_async(self) -> list[ModelInfo]:
         """非同步獲取 llama.cpp server 載入的模型
@@ -1048,23 +1656,32 @@ class ModelManager:
         try:
             await self._init_async_session()
 
-            base_url = self.llamacpp_url.rstrip("/")
+            base_url = self.rcfg.llamacpp_url.rstrip("/")
             if base_url.endswith("/v1"):
                 base_url = base_url[:-3]
 
             async def fetch_json(endpoint: str) -> Any | None:
                 url = f"{base_url}{endpoint}"
-                logger.debug(f"嘗試從 {url} 讀取 llama.cpp 狀態")
+                logger.debug("嘗試從 %s 讀取 llama.cpp 狀態", url)
                 assert self.session is not None
-                async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=5)) as response:
+                async with (
+                    self._provider_gate("llamacpp"),
+                    self.session.get(url, timeout=LLAMACPP_STATUS_TIMEOUT) as response,
+                ):
                     if response.status != 200:
-                        logger.debug(f"llama.cpp {endpoint} 返回狀態碼: {response.status}")
+                        logger.debug("llama.cpp %s 返回狀態碼: %s", endpoint, response.status)
                         return None
-                    return await response.json()
+                    return await response.json(loads=_json_loads)
 
-            props = await fetch_json("/props")
-            slots = await fetch_json("/slots")
-            result = await fetch_json("/v1/models")
+            # 三個端點彼此獨立，並行查詢；總延遲取決於最慢的端點而非三者總和
+            responses = await asyncio.gather(
+                fetch_json("/props"), fetch_json("/slots"), fetch_json("/v1/models"), return_exceptions=True
+            )
+            # 與逐一查詢時相同：任一端點連線失敗即改用預設模型列表
+            for response in responses:
+                if isinstance(response, BaseException):
+                    raise response
+            props, slots, result = responses
 
             props_data = props if isinstance(props, dict) else {}
             slots_data = slots if isinstance(slots, list) else []
@@ -1087,7 +1704,7 @@ class ModelManager:
 
             build_info = props_data.get("build_info", "")
             if isinstance(build_info, str) and build_info:
-                logger.info(f"llama.cpp server 版本: {build_info}")
+                logger.info("llama.cpp server 版本: %s", build_info)
 
             model_path = props_data.get("model_path", "")
             if not models and model_path:
@@ -1133,7 +1750,7 @@ class ModelManager:
                     pricing="免費(本機執行)",
                     recommended_for="本地高速推理翻譯",
                     parallel=total_slots,
-                    tags=["free", "local", "llamacpp"],
+                    tags=("free", "local", "llamacpp"),
                     capabilities={
                         "translation": 0.85,
                         "multilingual": 0.80,
@@ -1142,35 +1759,16 @@ class ModelManager:
                 )
                 model_info_list.append(model_info)
 
-            logger.info(f"檢測到 {len(model_info_list)} 個 llama.cpp 模型（server slots: {total_slots}）")
+            logger.info("檢測到 %s 個 llama.cpp 模型（server slots: %s）", len(model_info_list), total_slots)
             return model_info_list
 
         except Exception as e:
-            logger.error(f"獲取 llama.cpp 模型列表失敗: {e!s}")
+            logger.error("獲取 llama.cpp 模型列表失敗: %s", e)
             return self._get_llamacpp_fallback_models()
 
     def _get_llamacpp_fallback_models(self) -> list[ModelInfo]:
         """當 llama-server 無法連線時返回提示模型"""
-        return [
-            ModelInfo(
-                id="llama-server-offline",
-                provider="llamacpp",
-                name="llama-server (未連線)",
-                description=(
-                    "請先啟動 llama-server："
-                    "llama-server -m <model.gguf> --jinja --parallel 1 -c 1024 --cache-ram 4096"
-                    "；Qwen3.5 建議加 --reasoning-format deepseek，"
-                    "Gemma 4 建議改用 --reasoning off --reasoning-format none"
-                ),
-                context_length=1024,
-                pricing="免費(本機執行)",
-                recommended_for="本地高速推理翻譯",
-                parallel=1,
-                tags=["free", "local", "llamacpp"],
-                capabilities={"translation": 0.0, "multilingual": 0.0, "context_handling": 0.0},
-                available=False,
-            )
-        ]
+        return [_llamacpp_offline_model()]
 
     def _format_model_name(self, model_id: str) -> str:
         """格式化模型名稱，使其更易讀
@@ -1181,29 +1779,19 @@ class ModelManager:
         回傳:
             格式化後的模型名稱
         """
-        try:
-            # 移除版本號和標籤
-            name = re.sub(r"[:@].+", "", model_id)
+        return _format_model_name(model_id)
 
-            # 處理常見縮寫
-            name = name.replace("-", " ").replace("_", " ")
+    def _fetch_openai_models(self, api_key: str) -> list[Any]:
+        """以同步客戶端取得 OpenAI 模型列表（於工作執行緒中執行）
 
-            # 分割路徑，只取最後部分
-            parts = name.split("/")
-            name = parts[-1]
-
-            # 首字母大寫
-            words = name.split()
-            capitalized = []
-            for word in words:
-                # 處理駝峰命名
-                camel_parts = re.findall(r"[A-Z][a-z]*|[a-z]+", word)
-                camel_parts = [p.capitalize() for p in camel_parts]
-                capitalized.append(" ".join(camel_parts))
+        參數:
+            api_key: OpenAI API金鑰
 
-            return " ".join(capitalized)
-        except Exception:
-            return model_id
+        回傳:
+            OpenAI 回傳的模型物件列表
+        """
+        client = self._get_client("openai", api_key)
+        return list(client.models.list())
 
     async def _get_openai_models_async(self, api_key: str) -> list[ModelInfo]:
         """非同步獲取 OpenAI 模型列表
@@ -1225,32 +1813,20 @@ class ModelManager:
             default_model = self._create_default_openai_model()
             return [default_model]
 
+        _ensure_provider_loaded("openai")
         try:
-            # 使用同步客戶端 - 未來可改為非同步
-            client = OpenAI(api_key=api_key)
-            models_response = client.models.list()
-
-            # 優先推薦適合翻譯的模型
-            translation_priority = {
-                "gpt-4.1-mini": 1,
-                "gpt-4.1": 2,
-                "gpt-4.1-nano": 3,
-                "gpt-4o": 4,
-                "gpt-4-turbo": 5,
-                "gpt-4": 6,
-                "gpt-3.5-turbo-16k": 7,
-                "gpt-3.5-turbo": 8,
-                "gpt-4-vision-preview": 999,
-            }
+            # 同步客戶端的請求（含自動分頁）移至工作執行緒，不阻塞 event loop
+            async with self._provider_gate("openai"):
+                models_response = await asyncio.to_thread(self._fetch_openai_models, api_key)
 
             # 過濾模型
             model_list = []
             for model in models_response:
                 # 只包含 GPT 系列，且排除日期版本(如 gpt-3.5-turbo-0301)
-                if "gpt" in model.id and not re.search(r"-\d{4}$", model.id):
+                if "gpt" in model.id and not _RE_DATE_SUFFIX.search(model.id):
                     key = f"openai:{model.id}"
-                    if key in self.model_database:
-                        model_info = self.model_database[key]
+                    if key in _REGISTRY.models:
+                        model_info = _REGISTRY.models[key]
                     else:
                         # 建立新的模型資訊
                         model_info = ModelInfo(
@@ -1265,16 +1841,18 @@ class ModelManager:
 
                     model_list.append(model_info)
 
-            # 按翻譯優先級排序
-            model_list.sort(key=lambda x: translation_priority.get(x.id, 900))
+            # 按翻譯優先級排序：只有少數已知模型需要排序，其餘維持 API 回傳順序置於中段
+            model_list = _order_by_translation_priority(model_list)
 
-            # 確保列表中有最常用的模型
+            # 確保列表中有最常用的模型（以集合判斷是否已存在，不逐一掃描列表）
             essential_models = ["gpt-4.1-mini", "gpt-4.1"]
+            seen_ids = {m.id for m in model_list}
             for model_id in essential_models:
-                if not any(m.id == model_id for m in model_list):
+                if model_id not in seen_ids:
+                    seen_ids.add(model_id)
                     key = f"openai:{model_id}"
-                    if key in self.model_database:
-                        model_info = self.model_database[key]
+                    if key in _REGISTRY.models:
+                        model_info = _REGISTRY.models[key]
                     else:
                         model_info = ModelInfo(
                             id=model_id,
@@ -1286,11 +1864,11 @@ class ModelManager:
                         )
                     model_list.append(model_info)
 
-            logger.info(f"檢測到 {len(model_list)} 個 OpenAI 模型")
+            logger.info("檢測到 %s 個 OpenAI 模型", len(model_list))
             return model_list
 
         except Exception as e:
-            logger.error(f"獲取 OpenAI 模型列表失敗: {e!s}")
+            logger.error("獲取 OpenAI 模型列表失敗: %s", e)
             # 返回預設模型
             default_model = self._create_default_openai_model()
             return [default_model]
@@ -1305,28 +1883,90 @@ class ModelManager:
             是否更新成功
         """
         try:
+            # 只處理實際改變的已知設定；內容相同時不寫檔，也不清除模型列表快取
+            changed = {
+                key: value for key, value in new_config.items() if key in self.config and self.config[key] != value
+            }
+            if not changed:
+                logger.debug("模型管理器配置未變更，略過儲存")
+                return True
+
             # 更新配置
-            for key, value in new_config.items():
-                if key in self.config:
-                    self.config[key] = value
+            self.config.update(changed)
 
             # 儲存配置
             save_result = self._save_config()
 
+            # 重建執行期設定快照，使新設定立即生效
+            self.rcfg = _RuntimeConfig.from_config(self.config)
+            if "model_patterns" in changed:
+                self.model_patterns_re = self._compile_model_patterns(self.rcfg.model_patterns)
+            if "log_level" in changed:
+                _apply_log_level(self.config["log_level"])
+            # 預設提供者等設定可能改變推薦結果
+            self._recommended_cache.clear()
+
             # 如果更新了重要設定，清除快取
             important_keys = ["llamacpp_url", "default_llamacpp_model", "model_patterns"]
-            if any(key in new_config for key in important_keys):
-                self.cached_models.clear()
-                self.cache_time.clear()
+            if any(key in changed for key in important_keys):
+                self._cache.clear()
+                self._status_cache = None
+            # 停用期間保存的列表可能已過時，切換磁碟快取時一併清除
+            if "persistent_model_cache" in changed:
+                self._cache.clear()
+                _clear_model_list_disk_cache()
+
+            # 逾時或連線池設定變更時，下次請求以新設定重建 HTTP session
+            session_keys = ["connect_timeout", "request_timeout", "http_pool_size", "http_limit_per_host"]
+            if self.session is not None and any(key in changed for key in session_keys):
+                self._retire_session()
 
             logger.info("已更新模型管理器配置")
             return save_result
         except Exception as e:
-            logger.error(f"更新模型管理器配置時發生錯誤: {e!s}")
+            logger.error("更新模型管理器配置時發生錯誤: %s", e)
             return False
 
 
 # 提供便捷的全域函數
+async def get_session() -> aiohttp.ClientSession:
+    """全域函數：取得模型管理器共用的 HTTP 客戶端 session
+
+    回傳:
+        綁定於當前 event loop 的 aiohttp.ClientSession（與 ModelManager 共用連線池）
+    """
+    manager = ModelManager.get_instance()
+    await manager._init_async_session()
+    assert manager.session is not None
+    return manager.session
+
+
+def _close_session_at_exit() -> None:
+    """行程結束時關閉單例仍持有的 HTTP 客戶端 session、停止背景 loop 與日誌監聽器，避免 Unclosed client session 警告"""
+    global _BACKGROUND_LOOP, _BACKGROUND_THREAD
+    manager = ModelManager._instance
+    if manager is not None:
+        manager.close()
+
+    loop, thread = _BACKGROUND_LOOP, _BACKGROUND_THREAD
+    _BACKGROUND_LOOP = _BACKGROUND_THREAD = None
+    if loop is not None and loop.is_running():
+        loop.call_soon_threadsafe(loop.stop)
+    # 等待背景執行緒結束後再關閉 loop，釋放其持有的選擇器與檔案描述符
+    if thread is not None:
+        thread.join(timeout=1)
+    if loop is not None and thread is not None and not thread.is_alive() and not loop.is_closed():
+        loop.close()
+
+    _close_model_list_disk_cache()
+
+    # 最後停止日誌監聽器，確保上述關閉過程的日誌也寫入檔案
+    _stop_log_listener()
+
+
+atexit.register(_close_session_at_exit)
+
+
 def get_model_info(model_name: str, provider: str | None = None) -> dict[str, Any]:
     """全域函數：獲取模型資訊
 
@@ -1,9 +1,13 @@
+import atexit
+import contextlib
 import json
 import logging
 import logging.handlers
 import os
+import queue
 import re
 import threading
+from collections.abc import Iterator
 from datetime import datetime
 from typing import Any, ClassVar
 
@@ -30,7 +34,14 @@ if not logger.handlers:
     )
     formatter = logging.Formatter("%(asctime)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s")
     handler.setFormatter(formatter)
-    logger.addHandler(handler)
+
+    # logger 只掛 QueueHandler，格式化、輪替檢查與寫檔由背景 QueueListener 執行緒負責
+    _log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(_log_queue, handler, respect_handler_level=True)
+    _log_listener.start()
+    # 行程結束時先寫出佇列中剩餘的記錄
+    atexit.register(_log_listener.stop)
+    logger.addHandler(logging.handlers.QueueHandler(_log_queue))
 
 
 class PromptManager:
@@ -40,6 +51,9 @@ class PromptManager:
     _instance = None
     _lock = threading.Lock()
 
+    # 內置預設提示詞快取：首次需要時組合，所有實例共用同一份字串
+    _builtin_default_prompts: ClassVar[dict[str, dict[str, str]] | None] = None
+
     @classmethod
     def get_instance(cls, config_file: str | None = None) -> "PromptManager":
         """獲取提示詞管理器的單例實例
@@ -109,6 +123,15 @@ class PromptManager:
         # 載入版本歷史
         self.version_history: dict[str, Any] = self.config_manager.get_value("version_history", default={}) or {}
 
+        # 待寫入狀態：一次變更（或 batch_updates 區塊）內的配置與模板寫入合併為一次
+        self._batch_depth = 0
+        self._config_dirty = False
+        self._dirty_templates: set[str] = set()
+
+        # 組合完成的提示詞快取：鍵包含 _prompt_rev，自訂提示詞變更時遞增版本並清空快取
+        self._prompt_cache: dict[tuple[Any, ...], str] = {}
+        self._prompt_rev = 0
+
         # 載入自訂提示詞
         self.custom_prompts: dict[str, Any] = self.config_manager.get_value("custom_prompts", default={}) or {}
         self._load_custom_prompts()
@@ -119,16 +142,23 @@ class PromptManager:
         logger.info("PromptManager 初始化完成")
 
     def _get_default_prompts(self) -> dict[str, dict[str, str]]:
-        """獲取預設提示詞，從配置檔案或內置預設值"""
-        # 嘗試從配置獲取預設提示詞
-        default_config = ConfigManager.get_instance("default_prompt")
-        default_prompts = default_config.get_value("default_prompts", None)
+        """獲取內置預設提示詞
 
-        if default_prompts:
-            return dict(default_prompts)
+        每個內容類型複製一層字典，提示詞字串本身由各實例共用。
+        """
+        return {content_type: dict(prompts) for content_type, prompts in self._get_builtin_default_prompts().items()}
 
-        # 如果配置中沒有，使用內置預設值
+    @classmethod
+    def _get_builtin_default_prompts(cls) -> dict[str, dict[str, str]]:
+        """取得內置預設提示詞（每個行程只組合一次，之後的實例直接沿用）"""
+        prompts = cls._builtin_default_prompts
+        if prompts is None:
+            prompts = cls._builtin_default_prompts = cls._build_builtin_default_prompts()
+        return prompts
 
+    @staticmethod
+    def _build_builtin_default_prompts() -> dict[str, dict[str, str]]:
+        """組合內置預設提示詞"""
         # ========== 核心可重用模組 ==========
 
         # 人名保留規則模組（適用於所有英語內容）
@@ -590,6 +620,7 @@ Output the translated text directly. No preamble, no explanations.
         # 更新自訂提示詞和版本歷史
         self.custom_prompts = config.get("custom_prompts", self.custom_prompts)
         self.version_history = config.get("version_history", self.version_history)
+        self._invalidate_prompt_cache()
 
         logger.debug("提示詞配置已更新")
 
@@ -619,9 +650,16 @@ Output the translated text directly. No preamble, no explanations.
                 except Exception as e:
                     logger.error(f"載入模板檔案時發生錯誤: {format_exception(e)}")
 
+        self._invalidate_prompt_cache()
+
         # 更新配置
         self.config_manager.set_value("custom_prompts", self.custom_prompts)
 
+    def _invalidate_prompt_cache(self) -> None:
+        """自訂提示詞變更後遞增版本並清空組合完成的提示詞快取"""
+        self._prompt_rev += 1
+        self._prompt_cache.clear()
+
     def get_batch_line_mapping_instruction(self) -> str:
         """取得批次翻譯的嚴格行對行映射指令
 
@@ -1117,6 +1155,21 @@ Rules:
         content_type = content_type or self.current_content_type
         style = style or self.current_style
 
+        # 輸入只在使用者切換設定時改變；精簡 prompt 選項存於 user 配置，每次讀取以反映外部變更
+        use_compact = self._should_use_compact_prompt(llm_type)
+        cache_key = (
+            llm_type,
+            content_type,
+            style,
+            model_name,
+            self.current_language_pair,
+            use_compact,
+            self._prompt_rev,
+        )
+        cached = self._prompt_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # 檢查是否有自訂提示詞
         if content_type in self.custom_prompts and llm_type in self.custom_prompts[content_type]:
             prompt = self.custom_prompts[content_type][llm_type]
@@ -1124,7 +1177,7 @@ Rules:
             prompt = self._get_hunyuan_mt_prompt(content_type)
         elif self._should_use_qwen_ud_adult_prompt(llm_type, content_type, model_name):
             prompt = self._get_qwen_ud_adult_prompt()
-        elif self._should_use_compact_prompt(llm_type):
+        elif use_compact:
             prompt = self._get_compact_prompt_text(content_type)
         else:
             prompt = self._get_default_prompt_text(content_type, llm_type)
@@ -1134,9 +1187,10 @@ Rules:
             prompt = self._apply_style_modifier(prompt, style, llm_type)
 
         # 套用語言對修飾符
-        prompt = self._apply_language_pair_modifier(prompt, self.current_language_pair)
+        prompt = self._apply_language_pair_modifier(prompt, self.current_language_pair).strip()
 
-        return prompt.strip()
+        self._prompt_cache[cache_key] = prompt
+        return prompt
 
     def get_prompt_version(
         self,
@@ -1171,6 +1225,27 @@ Rules:
         fingerprint = f"{prompt}\n\n[MESSAGE_STRATEGY]{strategy}"
         return hashlib.md5(fingerprint.encode()).hexdigest()[:8]
 
+    # 句尾連接詞（表示字幕為未完成的子句），與對應的 " when" 等後綴；類別載入時建立一次
+    _TRAILING_CONJUNCTIONS: ClassVar[tuple[str, ...]] = (
+        "when",
+        "if",
+        "because",
+        "although",
+        "while",
+        "before",
+        "after",
+        "unless",
+        "though",
+        "since",
+        "until",
+        "as",
+        "where",
+        "whereas",
+    )
+    _TRAILING_CONJUNCTION_SUFFIXES: ClassVar[tuple[str, ...]] = tuple(f" {conj}" for conj in _TRAILING_CONJUNCTIONS)
+    # 表示字幕尚未結束的句尾標點
+    _INCOMPLETE_ENDINGS: ClassVar[tuple[str, ...]] = (",", "，", "、", ";", "；", ":", "：", "-", "—", "–", "...", "…")
+
     def get_optimized_message(
         self,
         text: str,
@@ -1221,27 +1296,17 @@ Rules:
             context_before, context_after = self._compact_qwen35_ud_context(text, context_before, context_after)
 
         # 檢測句子是否以連接詞結尾
-        conjunctions = [
-            "when",
-            "if",
-            "because",
-            "although",
-            "while",
-            "before",
-            "after",
-            "unless",
-            "though",
-            "since",
-            "until",
-            "as",
-            "where",
-            "whereas",
-        ]
-        text_lower = text.strip().lower()
-        ends_with_conjunction = any(text_lower.endswith(f" {conj}") for conj in conjunctions)
-        ends_with_incomplete_punctuation = text.strip().endswith(
-            (",", "，", "、", ";", "；", ":", "：", "-", "—", "–", "...", "…")
-        )
+        stripped_text = text.strip()
+        text_lower = stripped_text.lower()
+        detected_conj = None
+        # 先以單次 endswith(tuple) 判斷，命中時才找出是哪個連接詞
+        if text_lower.endswith(self._TRAILING_CONJUNCTION_SUFFIXES):
+            detected_conj = next(
+                conj
+                for conj, suffix in zip(self._TRAILING_CONJUNCTIONS, self._TRAILING_CONJUNCTION_SUFFIXES, strict=True)
+                if text_lower.endswith(suffix)
+            )
+        ends_with_incomplete_punctuation = stripped_text.endswith(self._INCOMPLETE_ENDINGS)
 
         # 構建新格式的 user message
         if use_qwen_ud_strategy:
@@ -1249,8 +1314,7 @@ Rules:
         elif self._should_use_compact_prompt(llm_type):
             user_content_parts = ["CURRENT:", text]
 
-            if ends_with_conjunction:
-                detected_conj = next(conj for conj in conjunctions if text_lower.endswith(f" {conj}"))
+            if detected_conj is not None:
                 user_content_parts.extend(["", f"NOTE: preserve the trailing conjunction '{detected_conj}' in translation."])
             if ends_with_incomplete_punctuation:
                 user_content_parts.extend(
@@ -1273,8 +1337,7 @@ Rules:
             user_content_parts = []
 
             # 如果以連接詞結尾，添加超強警告
-            if ends_with_conjunction:
-                detected_conj = next(conj for conj in conjunctions if text_lower.endswith(f" {conj}"))
+            if detected_conj is not None:
                 user_content_parts.extend(
                     [
                         "🚨 **MANDATORY WARNING** 🚨",
@@ -1303,15 +1366,8 @@ Rules:
 
             user_message = "\n".join(user_content_parts)
 
-        # 為不同的LLM類型創建不同格式的訊息
-        if llm_type == "openai":
-            # OpenAI的訊息格式
-            messages = [{"role": "system", "content": prompt}, {"role": "user", "content": user_message}]
-        else:
-            # 本地模型等其他 LLM 的訊息格式
-            messages = [{"role": "system", "content": prompt}, {"role": "user", "content": user_message}]
-
-        return messages
+        # 各 LLM 類型（OpenAI 相容 API 與本地模型）皆使用相同的 system/user 訊息格式
+        return [{"role": "system", "content": prompt}, {"role": "user", "content": user_message}]
 
     def _apply_style_modifier(self, prompt: str, style: str, llm_type: str) -> str:
         """根據翻譯風格修改提示詞
@@ -1348,6 +1404,9 @@ Rules:
 
         return prompt
 
+    # 提示詞中的目標語言引用（繁體中文/Taiwan Mandarin 等），類別載入時編譯一次
+    _LANG_RE: ClassVar[re.Pattern[str]] = re.compile(r"Taiwan Mandarin|繁體中文|Traditional Chinese")
+
     def _apply_language_pair_modifier(self, prompt: str, language_pair: str) -> str:
         """根據語言對修改提示詞
 
@@ -1369,7 +1428,7 @@ Rules:
 
             # 基於正則表達式更新提示詞中的語言引用
             # 尋找並替換繁體中文/Taiwan Mandarin 等相關提示
-            prompt = re.sub(r"(Taiwan Mandarin|繁體中文|Traditional Chinese)", target, prompt)
+            prompt = self._LANG_RE.sub(target, prompt)
 
             # 添加明確的語言對說明
             language_instruction = (
@@ -1403,12 +1462,11 @@ Rules:
 
         # 更新提示詞
         self.custom_prompts[content_type][llm_type] = new_prompt.strip()
+        self._invalidate_prompt_cache()
 
-        # 更新配置
-        self.config_manager.set_value("custom_prompts", self.custom_prompts)
-
-        # 儲存至模板檔案
-        self._save_prompt_template(content_type)
+        # 更新配置並儲存至模板檔案（與版本歷史合併為一次配置寫入）
+        self.config_manager.set_value("custom_prompts", self.custom_prompts, auto_save=False)
+        self._persist(content_type)
 
         logger.info(f"已設置 '{content_type}' 類型的 '{llm_type}' 提示詞")
         return True
@@ -1441,8 +1499,51 @@ Rules:
             history = history[-10:]  # 只保留最新的 10 個版本
             self.version_history[content_type][llm_type] = history
 
-        # 更新配置
-        self.config_manager.set_value("version_history", self.version_history)
+        # 更新配置（由呼叫端的 _persist 一併寫入）
+        self.config_manager.set_value("version_history", self.version_history, auto_save=False)
+
+    @contextlib.contextmanager
+    def batch_updates(self) -> Iterator[None]:
+        """合併區塊內的提示詞變更，離開區塊時一次寫入配置與模板檔案"""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
+
+    def _persist(self, content_type: str | None = None) -> bool:
+        """標記配置（及指定內容類型的模板）待寫入；不在批次區塊中時立即寫入
+
+        參數:
+            content_type: 需要重寫模板檔案的內容類型
+
+        回傳:
+            是否儲存成功（批次區塊中一律回傳 True）
+        """
+        self._config_dirty = True
+        if content_type is not None:
+            self._dirty_templates.add(content_type)
+        if self._batch_depth:
+            return True
+        return self.flush()
+
+    def flush(self) -> bool:
+        """將待寫入的自訂提示詞、版本歷史與模板檔案寫入磁碟
+
+        回傳:
+            是否全部儲存成功
+        """
+        success = True
+        if self._config_dirty:
+            self._config_dirty = False
+            success = self.config_manager.save_config()
+
+        templates, self._dirty_templates = self._dirty_templates, set()
+        for content_type in sorted(templates):
+            success = self._save_prompt_template(content_type) and success
+        return success
 
     def _save_prompt_template(self, content_type: str) -> bool:
         """儲存提示詞模板至檔案
@@ -1542,15 +1643,17 @@ Rules:
             if content_type not in self.custom_prompts:
                 self.custom_prompts[content_type] = {}
             self.custom_prompts[content_type].pop(llm_type, None)
-            self.config_manager.set_value("custom_prompts", self.custom_prompts)
-            self._save_prompt_template(content_type)
+            self._invalidate_prompt_cache()
+            self.config_manager.set_value("custom_prompts", self.custom_prompts, auto_save=False)
+            self._persist(content_type)
             logger.info(f"已重置 '{content_type}' 類型的 '{llm_type}' 提示詞為預設值")
             return True
         else:
             # 重置所有 LLM 類型的提示詞
             self.custom_prompts[content_type] = {}
-            self.config_manager.set_value("custom_prompts", self.custom_prompts)
-            success = self._save_prompt_template(content_type)
+            self._invalidate_prompt_cache()
+            self.config_manager.set_value("custom_prompts", self.custom_prompts, auto_save=False)
+            success = self._persist(content_type)
             logger.info(f"已重置 '{content_type}' 類型的所有提示詞為預設值")
             return success
 
@@ -1705,12 +1808,13 @@ Rules:
 
             content_type = import_data["metadata"].get("content_type", "general")
 
-            # 匯入提示詞
-            for llm_type, prompt in import_data["prompts"].items():
-                if llm_type not in SUPPORTED_PROMPT_LLM_TYPES:
-                    logger.warning(f"跳過不支援的LLM類型: {llm_type}")
-                    continue
-                self.set_prompt(prompt, llm_type, content_type)
+            # 匯入提示詞（多個 LLM 類型合併為一次配置與模板寫入）
+            with self.batch_updates():
+                for llm_type, prompt in import_data["prompts"].items():
+                    if llm_type not in SUPPORTED_PROMPT_LLM_TYPES:
+                        logger.warning(f"跳過不支援的LLM類型: {llm_type}")
+                        continue
+                    self.set_prompt(prompt, llm_type, content_type)
 
             logger.info(f"已從 {input_path} 匯入 '{content_type}' 類型的提示詞")
             return True
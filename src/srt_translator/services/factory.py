@@ -1529,6 +1529,12 @@ class ModelService:
 
         self.translation_clients.clear()
 
+        # 在目前的 event loop 上釋放模型管理器的 HTTP session 與 SDK 客戶端
+        try:
+            await self.model_manager.aclose()
+        except Exception as e:
+            logger.error(f"關閉模型管理器資源時發生錯誤: {e!s}")
+
 
 # 快取服務 - 管理翻譯結果快取
 class CacheService:
@@ -115,6 +115,22 @@ def mock_cache_data() -> dict:
     }
 
 
+# ============================================================
+# 模型管理器相關 Fixtures
+# ============================================================
+
+
+@pytest.fixture(autouse=True)
+def reset_model_probe_cache() -> Generator[None, None, None]:
+    """清除行程層級的連線測試快取，避免測試之間共用成功結果"""
+    from srt_translator.core import models
+
+    models._PROBE_CACHE.clear()
+    yield
+    models._PROBE_CACHE.clear()
+    models._PROBE_INFLIGHT.clear()
+
+
 # ============================================================
 # pytest 配置 Hooks
 # ============================================================
@@ -2,6 +2,7 @@
 
 import contextlib
 import json
+import os
 from pathlib import Path
 
 import pytest
@@ -241,6 +242,30 @@ class TestConfigLoadSave:
 
         assert new_manager.get_value("version") == "4.0.0"
 
+    def test_load_config_skips_unchanged_file(self, config_manager, temp_dir):
+        """配置檔未變更時 load_config 不重新解析，reload 則強制重讀"""
+        config_manager.set_value("version", "5.0.0")
+        config_manager.configs["app"]["version"] = "in-memory"
+
+        config_manager.load_config()
+        assert config_manager.get_value("version") == "in-memory"
+
+        config_manager.reload()
+        assert config_manager.get_value("version") == "5.0.0"
+
+    def test_load_config_detects_modified_file(self, config_manager, temp_dir):
+        """配置檔修改時間改變後 load_config 重新解析"""
+        config_manager.set_value("version", "5.0.0")
+        config_path = Path(temp_dir) / "config" / "app_config.json"
+        data = json.loads(config_path.read_text(encoding="utf-8"))
+        data["version"] = "6.0.0"
+        config_path.write_text(json.dumps(data), encoding="utf-8")
+        stat = config_path.stat()
+        os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        config_manager.load_config()
+        assert config_manager.get_value("version") == "6.0.0"
+
     def test_merge_configs(self, config_manager):
         """測試配置合併"""
         default = {"a": 1, "b": {"c": 2, "d": 3}}
@@ -550,6 +575,25 @@ class TestConfigAdvancedValidation:
         errors = manager.validate_config("model")
         assert "connect_timeout" in errors
 
+    def test_validate_model_config_invalid_pool_size(self):
+        """測試驗證無效的連線池設定"""
+        ConfigManager._instances = {}
+        manager = ConfigManager("model")
+        manager.set_value("http_pool_size", 0, auto_save=False)
+
+        errors = manager.validate_config("model")
+        assert "http_pool_size" in errors
+        assert "http_limit_per_host" not in errors
+
+    def test_validate_model_config_invalid_log_level(self):
+        """測試驗證無效的日誌等級"""
+        ConfigManager._instances = {}
+        manager = ConfigManager("model")
+        manager.set_value("log_level", "VERBOSE", auto_save=False)
+
+        errors = manager.validate_config("model")
+        assert "log_level" in errors
+
     def test_validate_user_config_invalid_display_mode(self):
         """測試驗證無效的顯示模式"""
         ConfigManager._instances = {}
@@ -5,6 +5,8 @@
 對應 `-g` 顯式啟用 + 輸出端字面替換的既有設計（見 SHARED_NOTES / factory.py 呼叫慣例）。
 """
 
+from dataclasses import FrozenInstanceError
+
 import pytest
 
 from srt_translator.core.glossary import Glossary, GlossaryManager
@@ -58,6 +60,26 @@ class TestGlossaryEntryAndGlossary:
         # 區分大小寫只替換完全相同的片段
         assert g.apply_to_text("US and us") == "美國 and us"
 
+    def test_apply_to_text_single_char_case_sensitive_after_longer_terms(self):
+        """區分大小寫的單字元條目走 str.translate，但仍在多字元條目之後套用。"""
+        g = Glossary(name="t", source_lang="", target_lang="")
+        g.add_entry("王", "Wang", case_sensitive=True)
+        g.add_entry("李", "Lee", case_sensitive=True)
+        g.add_entry("王子", "Prince", case_sensitive=True)
+        assert g.apply_to_text("李與王子") == "Lee與Prince"
+        # 新增條目後轉換表需重建
+        g.add_entry("與", " & ", case_sensitive=True)
+        assert g.apply_to_text("李與王") == "Lee & Wang"
+
+    def test_apply_to_text_short_or_empty_returns_unchanged(self):
+        g = Glossary(name="t", source_lang="", target_lang="")
+        assert g.apply_to_text("Yes.") == "Yes."
+        g.add_entry("battalion chief", "營長")
+        # 比最短術語還短的文字直接原樣回傳
+        assert g.apply_to_text("Yes.") == "Yes."
+        g.add_entry("yes", "是")
+        assert g.apply_to_text("Yes.") == "是."
+
     def test_to_dict_from_dict_round_trip(self):
         g = Glossary(name="t", source_lang="英文", target_lang="繁體中文", description="d")
         g.add_entry("cortisol", "皮質醇", category="醫療", notes="n")
@@ -70,6 +92,26 @@ class TestGlossaryEntryAndGlossary:
         assert entry.target == "皮質醇"
         assert entry.category == "醫療"
 
+    def test_to_dict_tracks_entry_changes(self):
+        """序列化快取需反映新增、覆寫與移除。"""
+        g = Glossary(name="t", source_lang="", target_lang="")
+        g.add_entry("radio", "無線電")
+        assert [e["target"] for e in g.to_dict()["entries"]] == ["無線電"]
+        g.add_entry("apple", "蘋果")
+        g.add_entry("Radio", "收音機")
+        assert [e["target"] for e in g.to_dict()["entries"]] == ["收音機", "蘋果"]
+        g.remove_entry("apple")
+        assert [e["source"] for e in g.to_dict()["entries"]] == ["Radio"]
+
+    def test_to_dict_result_does_not_corrupt_cache(self):
+        """修改 to_dict 回傳的列表不影響快取，條目本身不可原地變更。"""
+        g = Glossary(name="t", source_lang="", target_lang="")
+        g.add_entry("radio", "無線電")
+        g.to_dict()["entries"].append({"source": "x", "target": "y"})
+        assert [e["source"] for e in g.to_dict()["entries"]] == ["radio"]
+        with pytest.raises(FrozenInstanceError):
+            g.entries["radio"].target = "收音機"  # type: ignore[misc]
+
 
 class TestGlossaryManager:
     """GlossaryManager 生命週期，於暫存 cwd 隔離，避免動到真實 data/glossaries。"""
@@ -120,6 +162,20 @@ class TestGlossaryManager:
         # 啟用不存在的術語表回傳 False
         assert manager.activate_glossary("missing") is False
 
+    def test_active_glossaries_keep_activation_order(self, manager):
+        """啟用順序即套用順序：先啟用的術語表先替換。"""
+        manager.create_glossary("b", "", "")
+        manager.create_glossary("a", "", "")
+        manager.add_entry_to_glossary("b", "收音機", "無線電")
+        manager.add_entry_to_glossary("a", "收音機", "廣播")
+        manager.activate_glossary("b")
+        manager.activate_glossary("a")
+        manager.activate_glossary("b")  # 重複啟用不改變順序
+        assert manager.get_active_glossaries() == ["b", "a"]
+        assert manager.apply_glossaries("打開收音機") == "打開無線電"
+        manager.delete_glossary("b")
+        assert manager.get_active_glossaries() == ["a"]
+
     def test_apply_glossaries_only_active(self, manager):
         manager.create_glossary("g1", "", "")
         manager.add_entry_to_glossary("g1", "收音機", "無線電")
@@ -146,6 +202,17 @@ class TestGlossaryManager:
         # 語言相符 → 套用
         assert manager.apply_glossaries("打開收音機", source_lang="英文", target_lang="繁體中文") == "打開無線電"
 
+    def test_apply_glossaries_batch_matches_per_line(self, manager):
+        manager.create_glossary("g1", "英文", "繁體中文")
+        manager.add_entry_to_glossary("g1", "radio", "無線電")
+        manager.add_entry_to_glossary("g1", "US", "美國", case_sensitive=True)
+        texts = ["Turn on the RADIO", "US and us", "Yes."]
+        # 未啟用時原樣回傳
+        assert manager.apply_glossaries_batch(texts) == texts
+        manager.activate_glossary("g1")
+        assert manager.apply_glossaries_batch(texts) == [manager.apply_glossaries(t) for t in texts]
+        assert manager.apply_glossaries_batch(texts, source_lang="日文") == texts
+
     def test_find_glossaries_for_languages(self, manager):
         manager.create_glossary("en", "英文", "繁體中文")
         manager.create_glossary("ja", "日文", "繁體中文")
@@ -163,6 +230,36 @@ class TestGlossaryManager:
         assert g is not None
         assert g.get_entry("cortisol").target == "皮質醇"
 
+    def test_add_entry_appends_to_sidecar_and_compact_merges(self, manager, tmp_path):
+        """新增條目只附加到 .jsonl 增量檔，compact 後合併回主檔並移除增量檔。"""
+        manager.create_glossary("g1", "英文", "繁體中文")
+        manager.add_entry_to_glossary("g1", "cortisol", "皮質醇")
+        manager.add_entry_to_glossary("g1", "Radio", "無線電")
+        glossary_dir = tmp_path / "data" / "glossaries"
+        sidecar = glossary_dir / "g1.jsonl"
+        assert len(sidecar.read_text(encoding="utf-8").splitlines()) == 2
+
+        # 新實例載入主檔後合併增量檔
+        reloaded = GlossaryManager()
+        assert reloaded.get_glossary("g1").get_entry("radio").target == "無線電"
+
+        assert reloaded.compact() is True
+        assert not sidecar.exists()
+        assert '"cortisol"' in (glossary_dir / "g1.json").read_text(encoding="utf-8")
+
+    def test_sidecar_located_by_name_when_file_renamed(self, manager, tmp_path):
+        """主檔檔名與術語表名稱不同時，仍合併依名稱寫入的增量檔。"""
+        manager.create_glossary("g1", "英文", "繁體中文")
+        manager.add_entry_to_glossary("g1", "Radio", "無線電", case_sensitive=True)
+        glossary_dir = tmp_path / "data" / "glossaries"
+        (glossary_dir / "g1.json").rename(glossary_dir / "renamed.json")
+        # 主檔已更名，下一筆增量仍依名稱寫入 g1.jsonl
+        (glossary_dir / "g1.jsonl").write_text('{"source": "cortisol", "target": "皮質醇"}\n', encoding="utf-8")
+
+        reloaded = GlossaryManager()
+        g = reloaded.get_glossary("g1")
+        assert g.get_entry("cortisol").target == "皮質醇"
+
     def test_export_import_json_round_trip(self, manager, tmp_path):
         manager.create_glossary("g1", "英文", "繁體中文")
         manager.add_entry_to_glossary("g1", "cortisol", "皮質醇")
@@ -173,6 +270,24 @@ class TestGlossaryManager:
         assert imported.name == "g2"
         assert imported.get_entry("cortisol").target == "皮質醇"
 
+    def test_import_large_json_uses_streaming_path(self, manager, tmp_path, monkeypatch):
+        """超過門檻的 JSON 匯入走串流路徑（未安裝 ijson 時退回 json.load），結果應一致。"""
+        import srt_translator.core.glossary as glossary_module
+
+        manager.create_glossary("g1", "英文", "繁體中文", description="d")
+        manager.add_entry_to_glossary("g1", "cortisol", "皮質醇", category="醫療")
+        manager.add_entry_to_glossary("g1", "US", "美國", case_sensitive=True)
+        out = tmp_path / "exported.json"
+        manager.export_glossary("g1", str(out), format="json")
+
+        monkeypatch.setattr(glossary_module, "STREAMING_IMPORT_THRESHOLD", 0)
+        imported = manager.import_glossary(str(out), name="g2")
+        assert imported is not None
+        assert imported.source_lang == "英文"
+        assert imported.description == "d"
+        assert imported.get_entry("cortisol").category == "醫療"
+        assert imported.get_entry("US").case_sensitive is True
+
     def test_export_missing_glossary_returns_false(self, manager, tmp_path):
         out = tmp_path / "x.json"
         assert manager.export_glossary("missing", str(out)) is False
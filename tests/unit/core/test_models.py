@@ -2,11 +2,15 @@
 
 import asyncio
 import json
+from collections.abc import Mapping
+from dataclasses import FrozenInstanceError, replace
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import aiohttp
 import pytest
 
+from srt_translator.core import models as models_module
 from srt_translator.core.config import ConfigManager
 from srt_translator.core.models import (
     ModelInfo,
@@ -36,7 +40,7 @@ class TestModelInfo:
         assert model.pricing == "未知"
         assert model.recommended_for == "一般翻譯"
         assert model.parallel == 10
-        assert model.tags == []
+        assert model.tags == ()
         assert model.capabilities == {}
         assert model.available is True
 
@@ -55,6 +59,44 @@ class TestModelInfo:
         assert result["description"] == "A test model"
         assert result["tags"] == ["test", "demo"]
 
+    def test_model_info_shares_interned_tags(self):
+        """測試相同的標籤組合共用同一個 tuple"""
+        first = ModelInfo(id="a", provider="llamacpp", tags=["fast", "local"])
+        second = ModelInfo(id="b", provider="openai", tags=("fast", "local"))
+
+        assert first.tags == ("fast", "local")
+        assert first.tags is second.tags
+        assert first.to_dict()["tags"] == ["fast", "local"]
+
+    def test_model_info_to_dict_is_cached(self):
+        """to_dict 重用快取內容，但回傳的字典可安全修改"""
+        model = ModelInfo(id="test", provider="llamacpp", tags=["fast"], capabilities={"translation": 0.8})
+
+        first = model.to_dict()
+        first["available"] = False
+        first["tags"].append("mutated")
+        first["capabilities"]["translation"] = 0.1
+
+        second = model.to_dict()
+        assert second is not first
+        assert second["available"] is True
+        assert second["tags"] == ["fast"]
+        assert second["capabilities"] == {"translation": 0.8}
+        assert model.capabilities == {"translation": 0.8}
+        assert replace(model, available=False).to_dict()["available"] is False
+
+    def test_model_info_is_frozen_and_slotted(self):
+        """測試 ModelInfo 不可變且不帶 __dict__"""
+        model = ModelInfo(id="test", provider="llamacpp")
+
+        assert not hasattr(model, "__dict__")
+        # to_dict 的快取欄位同樣存放於 slot 中
+        assert "_dict_cache" in ModelInfo.__slots__
+        with pytest.raises(FrozenInstanceError):
+            model.available = False  # type: ignore[misc]
+        assert replace(model, available=False).available is False
+        assert model.available is True
+
     def test_model_info_with_capabilities(self):
         """測試帶有能力評分的 ModelInfo"""
         capabilities = {"translation": 0.8, "context_handling": 0.7}
@@ -120,7 +162,38 @@ class TestModelManagerInit:
         assert manager.config_file == temp_config_file
         assert hasattr(manager, "config")
         assert hasattr(manager, "model_database")
-        assert hasattr(manager, "cached_models")
+        assert hasattr(manager, "_cache")
+
+    def test_get_instance_skips_lock_once_created(self, temp_config_file):
+        """測試單例建立後 get_instance 不再取得類別鎖"""
+        manager = ModelManager.get_instance(temp_config_file)
+
+        with patch.object(ModelManager, "_lock") as mock_lock:
+            assert ModelManager.get_instance() is manager
+        mock_lock.__enter__.assert_not_called()
+
+    def test_get_instance_concurrent_first_calls_initialize_once(self, temp_config_file):
+        """測試並行的首次 get_instance 只建立並初始化一個實例"""
+        import threading
+
+        barrier = threading.Barrier(8)
+        results = []
+        original_load_api_keys = ModelManager._load_api_keys
+
+        def run():
+            barrier.wait()
+            results.append(ModelManager.get_instance(temp_config_file))
+
+        with patch.object(ModelManager, "_load_api_keys", autospec=True, side_effect=original_load_api_keys) as load:
+            threads = [threading.Thread(target=run) for _ in range(8)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert len(results) == 8
+        assert all(result is results[0] for result in results)
+        assert load.call_count == 1
 
     def test_singleton_pattern(self, temp_config_file):
         """測試單例模式"""
@@ -144,7 +217,7 @@ class TestModelManagerInit:
         """測試模型資訊資料庫已初始化"""
         manager = ModelManager(temp_config_file)
 
-        assert isinstance(manager.model_database, dict)
+        assert isinstance(manager.model_database, Mapping)
         # 應該包含預設的模型資訊
         assert len(manager.model_database) > 0
 
@@ -152,8 +225,7 @@ class TestModelManagerInit:
         """測試初始化時快取為空"""
         manager = ModelManager(temp_config_file)
 
-        assert len(manager.cached_models) == 0
-        assert len(manager.cache_time) == 0
+        assert len(manager._cache) == 0
 
     def test_session_none_on_init(self, temp_config_file):
         """測試初始化時 session 為 None"""
@@ -313,6 +385,75 @@ class TestModelManagerDatabase:
             # 驗證提供者資訊
             assert info.provider is not None
 
+    def test_model_database_loads_providers_lazily(self, manager):
+        """內建模型依提供者延遲載入，只查詢單一提供者時不會實體化其他目錄"""
+        with (
+            patch("srt_translator.core.models._REGISTRY", models_module._Registry.build({})),
+            patch("srt_translator.core.models._LOADED_PROVIDERS", set()) as loaded,
+        ):
+            manager.get_recommended_model(provider="llamacpp")
+            assert loaded == {"llamacpp"}
+            assert all(key.startswith("llamacpp:") for key in models_module._REGISTRY.models)
+            # 透過公開屬性存取時載入全部提供者
+            providers = {model.provider for model in manager.model_database.values()}
+            assert providers == {"openai", "google", "llamacpp"}
+
+    def test_model_database_loads_missing_providers_in_one_rebuild(self, manager):
+        """存取完整資料庫時一次補齊所有未載入的提供者，之後不再重建登錄表"""
+        with (
+            patch("srt_translator.core.models._REGISTRY", models_module._Registry.build({})),
+            patch("srt_translator.core.models._LOADED_PROVIDERS", set()),
+            patch.object(models_module._Registry, "build", wraps=models_module._Registry.build) as build,
+        ):
+            first = manager.model_database
+            second = manager.model_database
+
+        assert build.call_count == 1
+        assert first is second
+        assert {model.provider for model in first.values()} == {"openai", "google", "llamacpp"}
+
+    def test_model_catalog_loaded_from_packaged_json(self):
+        """測試內建模型目錄由套件內的 JSON 資產載入"""
+        raw = json.loads(models_module.MODEL_CATALOG_PATH.read_text(encoding="utf-8"))
+
+        catalog = models_module._model_catalog()
+        assert set(catalog) == set(raw) == {"openai", "google", "llamacpp"}
+        assert all(isinstance(ModelInfo(**entry), ModelInfo) for entries in catalog.values() for entry in entries)
+
+    def test_model_catalog_missing_file_returns_empty(self, temp_dir):
+        """測試模型目錄檔案不存在時回傳空目錄而非拋出例外"""
+        models_module._model_catalog.cache_clear()
+        try:
+            with patch.object(models_module, "MODEL_CATALOG_PATH", Path(temp_dir) / "missing.json"):
+                assert models_module._model_catalog() == {}
+        finally:
+            models_module._model_catalog.cache_clear()
+
+    def test_model_database_is_shared_read_only(self, manager, temp_dir):
+        """內建模型登錄表為唯讀視圖，且由所有實例共用同一批 ModelInfo"""
+        with pytest.raises(TypeError):
+            manager.model_database["openai:gpt-4o"] = ModelInfo(id="gpt-4o", provider="openai")  # type: ignore[index]
+
+        other = ModelManager(str(temp_dir / "config" / "other_config.json"))
+        assert other.model_database["openai:gpt-4o"] is manager.model_database["openai:gpt-4o"]
+
+    def test_registry_indexes_match_database(self, manager):
+        """ID 與提供者索引與模型資料庫內容一致"""
+        database = manager.model_database
+        registry = models_module._REGISTRY
+
+        assert set(registry.by_id) == {model.id for model in database.values()}
+        for provider, models in registry.by_provider.items():
+            assert models == tuple(model for model in database.values() if model.provider == provider)
+        assert manager.get_model_info("gemini-2.5-flash")["provider"] == "google"
+
+    def test_availability_override_is_per_instance(self, manager):
+        """可用性覆寫只影響該實例，不改動共用的 ModelInfo"""
+        manager._availability["openai:gpt-4o"] = False
+
+        assert manager.get_model_info("gpt-4o", provider="openai")["available"] is False
+        assert manager.model_database["openai:gpt-4o"].available is True
+
 
 class TestModelManagerCaching:
     """測試模型快取機制"""
@@ -339,34 +480,30 @@ class TestModelManagerCaching:
 
     def test_cached_models_structure(self, manager):
         """測試快取模型的資料結構"""
-        assert isinstance(manager.cached_models, dict)
-        assert isinstance(manager.cache_time, dict)
+        assert isinstance(manager._cache, dict)
 
     def test_cache_manual_check(self, manager):
         """測試手動檢查快取狀態"""
         import time
 
         # 測試快取為空的情況
-        assert "test_provider" not in manager.cached_models
+        assert "test_provider" not in manager._cache
 
-        # 設定快取
-        manager.cached_models["test_provider"] = []
-        manager.cache_time["test_provider"] = time.time()
+        # 設定快取（寫入時間與模型列表存於同一筆）
+        manager._cache["test_provider"] = (time.monotonic(), [])
 
         # 驗證快取已設定
-        assert "test_provider" in manager.cached_models
-        assert "test_provider" in manager.cache_time
+        assert "test_provider" in manager._cache
 
     def test_cache_expiry_check(self, manager):
         """測試快取過期檢查邏輯"""
         import time
 
         # 設定一個很久以前的快取
-        manager.cached_models["old_provider"] = []
-        manager.cache_time["old_provider"] = time.time() - manager.cache_expiry - 100
+        manager._cache["old_provider"] = (time.monotonic() - manager.cache_expiry - 100, [])
 
         # 手動檢查是否過期
-        time_diff = time.time() - manager.cache_time["old_provider"]
+        time_diff = time.monotonic() - manager._cache["old_provider"][0]
         is_expired = time_diff > manager.cache_expiry
 
         assert is_expired is True
@@ -408,7 +545,7 @@ class TestModelManagerSelection:
     def test_model_database_structure(self, manager):
         """測試模型資料庫結構"""
         # 驗證資料庫是字典
-        assert isinstance(manager.model_database, dict)
+        assert isinstance(manager.model_database, Mapping)
 
         # 驗證鍵是字串，值是 ModelInfo
         for key, value in manager.model_database.items():
@@ -450,6 +587,19 @@ class TestModelManagerHelpers:
             # 驗證過濾結果
             assert isinstance(filtered, list)
 
+    def test_matches_pattern_uses_compiled_regex(self, manager):
+        """測試模型模式以單一正則比對（不分大小寫）"""
+        assert manager.matches_pattern("Qwen2.5-7B-Instruct") is True
+        assert manager.matches_pattern("library/DeepSeek-R1:8b") is True
+        assert manager.matches_pattern("gpt-4.1-mini") is False
+
+    def test_model_patterns_compiled_once_per_pattern_set(self, manager):
+        """測試相同的模式組合重用同一個已編譯正則"""
+        patterns = list(manager.model_patterns)
+
+        assert manager._compile_model_patterns(patterns) is manager.model_patterns_re
+        assert manager._compile_model_patterns([]) is None
+
     def test_model_patterns_matching(self, manager):
         """測試模型模式匹配"""
         # 測試模型模式是否包含預期的模型
@@ -495,11 +645,10 @@ class TestModelManagerDefaultModels:
         config_file.parent.mkdir(exist_ok=True)
         manager = ModelManager(str(config_file))
 
-        # 清空資料庫中的 openai:gpt-4.1-mini
-        if "openai:gpt-4.1-mini" in manager.model_database:
-            del manager.model_database["openai:gpt-4.1-mini"]
-
-        model = manager._create_default_openai_model()
+        # 以不含 openai:gpt-4.1-mini 的登錄表取代共用資料庫
+        registry = {key: model for key, model in manager.model_database.items() if key != "openai:gpt-4.1-mini"}
+        with patch("srt_translator.core.models._REGISTRY", models_module._Registry.build(registry)):
+            model = manager._create_default_openai_model()
 
         assert isinstance(model, ModelInfo)
         assert model.id == "gpt-4.1-mini"
@@ -568,23 +717,19 @@ class TestModelManagerModelInfo:
             info = manager.get_model_info(model_name)
             assert isinstance(info, dict)
 
-    def test_get_model_info_fallback_to_hardcoded(self, temp_dir):
-        """測試 get_model_info 回退到硬編碼資訊"""
+    def test_get_model_info_has_no_duplicate_catalog(self, temp_dir):
+        """測試 get_model_info 只查詢模型目錄，不再回退到重複的硬編碼資訊"""
         config_file = temp_dir / "config" / "model_config.json"
         config_file.parent.mkdir(exist_ok=True)
         manager = ModelManager(str(config_file))
 
-        # 清空資料庫中的 gpt-4o
-        if "openai:gpt-4o" in manager.model_database:
-            del manager.model_database["openai:gpt-4o"]
+        # 以不含 gpt-4o 的登錄表取代共用資料庫
+        registry = {key: model for key, model in manager.model_database.items() if key != "openai:gpt-4o"}
+        with patch("srt_translator.core.models._REGISTRY", models_module._Registry.build(registry)):
+            assert manager.get_model_info("gpt-4o") == {}
+            assert manager.get_model_info("gpt-4o", "openai") == {}
 
-        # 嘗試獲取 gpt-4o 資訊，應該回退到硬編碼
-        info = manager.get_model_info("gpt-4o")
-
-        assert isinstance(info, dict)
-        # 應該返回硬編碼的資訊
-        if info:
-            assert "id" in info or "name" in info
+        assert manager.get_model_info("gpt-4o")["provider"] == "openai"
 
 
 class TestModelManagerRecommendation:
@@ -645,15 +790,77 @@ class TestModelManagerRecommendation:
 
         assert model is None or isinstance(model, ModelInfo)
 
+    @pytest.mark.parametrize("task_type", ["translation", "literary", "technical", "subtitle"])
+    def test_get_recommended_model_matches_weighted_scores(self, manager, task_type):
+        """測試向量化計分與逐項加權的結果一致"""
+        weights = models_module._TASK_WEIGHTS[task_type]
+        candidates = [m for m in manager.model_database.values() if m.provider == "google"]
+        expected = max(
+            candidates,
+            key=lambda m: sum(m.capabilities[c] * w for c, w in weights.items() if c in m.capabilities),
+        )
+
+        assert manager.get_recommended_model(task_type=task_type, provider="google") is expected
+
+    @pytest.mark.parametrize("task_type", ["translation", "literary", "subtitle", "unknown"])
+    def test_get_recommended_model_uses_cached_ranking(self, manager, task_type):
+        """測試以快取的提供者排序推薦，結果與對所有可用模型取最大值相同"""
+        # 停用 openai 的前兩名，確認會沿排序往下找第一個可用模型
+        task = task_type if task_type in models_module._TASK_WEIGHTS else "translation"
+        weights = models_module._TASK_WEIGHTS[task]
+        assert manager.model_database  # 載入所有提供者
+        top_openai = models_module._REGISTRY.ranked("openai", task)[:2]
+        for model, _score in top_openai:
+            manager._availability[f"openai:{model.id}"] = False
+
+        def score(m):
+            return sum(m.capabilities.get(c, 0.0) * w for c, w in weights.items())
+
+        candidates = [
+            m
+            for provider in ("llamacpp", "openai")
+            for m in models_module._REGISTRY.by_provider[provider]
+            if manager._is_available(f"{provider}:{m.id}", m)
+        ]
+        expected = max(candidates, key=score)
+
+        assert manager.get_recommended_model(task_type=task_type) is expected
+        ranking = models_module._REGISTRY.ranked("openai", task)
+        assert models_module._REGISTRY.ranked("openai", task) is ranking
+
+    def test_get_recommended_model_memoizes_result(self, manager):
+        """測試相同參數的重複呼叫直接沿用快取結果，不再走訪排序"""
+        first = manager.get_recommended_model()
+        with patch.object(models_module._Registry, "ranked", side_effect=AssertionError("不應重新排序")):
+            assert manager.get_recommended_model() is first
+            assert manager.get_recommended_model(task_type="unknown") is first
+
+    def test_get_recommended_model_cache_invalidation(self, manager):
+        """測試登錄表重建或設定變更後重新計算推薦模型"""
+        first = manager.get_recommended_model(provider="openai")
+        assert first is not None
+
+        # 可用性覆寫變更需搭配快取清除（與 Google 金鑰驗證流程相同）
+        manager._availability[f"openai:{first.id}"] = False
+        manager.update_config({"default_providers": ["openai"]})
+        second = manager.get_recommended_model(provider="openai")
+        assert second is not None and second.id != first.id
+
+        # 登錄表重建後快取的結果自動失效
+        with patch("srt_translator.core.models._REGISTRY", models_module._Registry.build(dict(manager.model_database))):
+            with patch.object(models_module._Registry, "ranked", wraps=models_module._REGISTRY.ranked) as ranked:
+                manager.get_recommended_model(provider="openai")
+            ranked.assert_called()
+
     def test_get_recommended_model_no_available(self, temp_dir):
         """測試無可用模型時返回 None"""
         config_file = temp_dir / "config" / "model_config.json"
         config_file.parent.mkdir(exist_ok=True)
         manager = ModelManager(str(config_file))
 
-        # 標記所有模型為不可用
-        for model in manager.model_database.values():
-            model.available = False
+        # 標記所有模型為不可用（透過實例層級的可用性覆寫）
+        for key in manager.model_database:
+            manager._availability[key] = False
 
         result = manager.get_recommended_model()
 
@@ -702,6 +909,56 @@ class TestModelManagerSync:
             assert "local-model" in result
             assert "Hy-MT2-7B-Q4_K_M" in result
 
+    def test_get_model_list_reuses_background_loop(self, manager):
+        """測試同步包裝方法重複使用同一個背景 event loop，而非每次建立新 loop"""
+        loops = []
+
+        async def fake_get_model_list_async(llm_type, api_key=None):
+            loops.append(asyncio.get_running_loop())
+            return [ModelInfo(id="m", provider=llm_type)]
+
+        with patch.object(manager, "get_model_list_async", fake_get_model_list_async):
+            assert manager.get_model_list("llamacpp") == ["m"]
+            assert manager.get_model_list("openai") == ["m"]
+
+        assert loops[0] is loops[1] is manager._sync_loop
+        assert loops[0].is_running()
+
+    def test_background_loop_shared_across_instances(self, manager, temp_dir):
+        """測試不同 ModelManager 實例共用同一個背景 event loop，而非各自啟動執行緒"""
+        ModelManager._instance = None
+        other = ModelManager(str(temp_dir / "config" / "model_config.json"))
+        assert other is not manager
+
+        assert manager._get_sync_loop() is other._get_sync_loop() is models_module._get_background_loop()
+
+    def test_close_closes_session_on_background_loop(self, manager):
+        """測試 close() 於背景 loop 上關閉該 loop 建立的 session"""
+        loop = manager._get_sync_loop()
+
+        async def open_session():
+            await manager._init_async_session()
+            return manager.session
+
+        session = asyncio.run_coroutine_threadsafe(open_session(), loop).result(timeout=5)
+        manager.close()
+
+        assert session.closed
+        assert manager.session is None
+
+    def test_exit_hook_stops_and_joins_background_loop(self, manager):
+        """測試結束時停止共用背景 loop、等待執行緒結束並關閉 loop"""
+        loop = manager._get_sync_loop()
+        thread = models_module._BACKGROUND_THREAD
+
+        with patch.object(models_module, "_stop_log_listener"):
+            models_module._close_session_at_exit()
+
+        assert not thread.is_alive()
+        assert loop.is_closed()
+        # 之後的同步呼叫會重新啟動新的背景 loop
+        assert manager._get_sync_loop() is not loop
+
     def test_get_model_list_invalid_type(self, manager):
         """測試無效的 LLM 類型"""
         # Mock get_model_list_async 返回空列表
@@ -739,6 +996,73 @@ class TestModelManagerAsync:
         # 清理
         await manager._close_async_session()
 
+    @pytest.mark.asyncio
+    async def test_init_async_session_uses_tuned_connector(self, manager):
+        """測試 session 使用明確設定的連線池"""
+        await manager._init_async_session()
+
+        connector = manager.session.connector
+        assert isinstance(connector, aiohttp.TCPConnector)
+        assert connector.limit == 100
+        assert connector.limit_per_host == 10
+
+        await manager._close_async_session()
+
+    @pytest.mark.asyncio
+    async def test_global_get_session_shares_manager_session(self):
+        """測試全域 get_session 回傳單例管理器持有的 session"""
+        from srt_translator.core.models import get_session
+
+        session = await get_session()
+        try:
+            assert session is ModelManager.get_instance().session
+            assert await get_session() is session
+        finally:
+            await ModelManager.get_instance()._close_async_session()
+
+    def test_init_async_session_closes_session_of_other_idle_loop(self, manager):
+        """測試在另一個 event loop 使用時，會於原 loop 上關閉舊 session 而非直接丟棄"""
+        first_loop = asyncio.new_event_loop()
+        try:
+            first_loop.run_until_complete(manager._init_async_session())
+            first_session = manager.session
+
+            async def use_from_second_loop():
+                await manager._init_async_session()
+                second_session = manager.session
+                await manager._close_async_session()
+                return second_session
+
+            second_session = asyncio.run(use_from_second_loop())
+
+            assert first_session.closed
+            assert second_session is not first_session
+        finally:
+            first_loop.close()
+
+    def test_init_async_session_closes_session_of_other_running_loop(self, manager):
+        """測試舊 session 所屬 loop 在其他執行緒執行中時，交由該 loop 關閉"""
+        import threading
+
+        first_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=first_loop.run_forever, daemon=True)
+        thread.start()
+        try:
+            asyncio.run_coroutine_threadsafe(manager._init_async_session(), first_loop).result(timeout=5)
+            first_session = manager.session
+
+            async def use_from_second_loop():
+                await manager._init_async_session()
+                await manager._close_async_session()
+
+            asyncio.run(use_from_second_loop())
+
+            assert first_session.closed
+        finally:
+            first_loop.call_soon_threadsafe(first_loop.stop)
+            thread.join(timeout=5)
+            first_loop.close()
+
     @pytest.mark.asyncio
     async def test_close_async_session(self, manager):
         """測試關閉非同步 session"""
@@ -774,6 +1098,40 @@ class TestModelManagerAsync:
         if manager.session:
             await manager._close_async_session()
 
+    @pytest.mark.asyncio
+    async def test_get_provider_status_probe_failure_is_isolated(self, manager):
+        """單一提供者檢查拋出例外時僅該提供者視為離線"""
+        manager.api_keys["openai"] = "sk-test"
+        with (
+            patch("srt_translator.core.models.OPENAI_AVAILABLE", True),
+            patch.object(manager, "_test_llamacpp_connection", AsyncMock(side_effect=RuntimeError("boom"))),
+        ):
+            status = await manager.get_provider_status()
+
+        assert status["llamacpp"] is False
+        assert status["openai"] is True
+
+    @pytest.mark.asyncio
+    async def test_get_provider_status_cached_within_ttl(self, manager):
+        """測試短時間內重複查詢共用探測結果，過期或設定變更後重新探測"""
+        probe = AsyncMock(return_value=(True, "ok"))
+        with patch.object(manager, "_test_llamacpp_connection", probe):
+            first = await manager.get_provider_status()
+            first["llamacpp"] = False  # 回傳副本，修改不影響快取
+            second = await manager.get_provider_status()
+            assert probe.await_count == 1
+            assert second["llamacpp"] is True
+
+            # 使快取過期
+            cached_at, cached_status = manager._status_cache
+            manager._status_cache = (cached_at - models_module.PROVIDER_STATUS_TTL, cached_status)
+            await manager.get_provider_status()
+            assert probe.await_count == 2
+
+            manager.update_config({"llamacpp_url": "http://127.0.0.1:9999"})
+            await manager.get_provider_status()
+            assert probe.await_count == 3
+
     @pytest.mark.asyncio
     async def test_test_model_connection_timeout_returns_readable_message(self, manager):
         """測試 llama.cpp 連線逾時時回傳可讀訊息。"""
@@ -783,6 +1141,131 @@ class TestModelManagerAsync:
         assert result["success"] is False
         assert "連線逾時" in result["message"]
 
+    @pytest.mark.asyncio
+    async def test_test_model_connection_caches_success_only(self, manager):
+        """測試連線成功的結果短時間內重用，失敗結果不快取"""
+        probe = AsyncMock(return_value=(True, "模型回應正常"))
+        with patch.object(manager, "_test_openai_connection", probe):
+            first = await manager.test_model_connection("gpt-4.1-mini", "openai", api_key="sk-a")
+            second = await manager.test_model_connection("gpt-4.1-mini", "openai", api_key="sk-a")
+            await manager.test_model_connection("gpt-4.1-mini", "openai", api_key="sk-b")
+
+        assert first == second == {"success": True, "message": "模型回應正常"}
+        assert probe.await_count == 2
+
+        failing = AsyncMock(return_value=(False, "連線逾時"))
+        with patch.object(manager, "_test_llamacpp_connection", failing):
+            await manager.test_model_connection("local-model", "llamacpp")
+            await manager.test_model_connection("local-model", "llamacpp")
+        assert failing.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_test_model_connection_cache_shared_and_deduplicated(self, manager, temp_dir):
+        """測試連線測試結果跨實例共用，且並行的相同測試只發送一次請求"""
+        started = asyncio.Event()
+        release = asyncio.Event()
+
+        async def slow_probe(model_name, key):
+            started.set()
+            await release.wait()
+            return True, "模型回應正常"
+
+        probe = AsyncMock(side_effect=slow_probe)
+        with patch.object(manager, "_test_openai_connection", probe):
+            first = asyncio.create_task(manager.test_model_connection("gpt-4.1", "openai", api_key="sk-a"))
+            await started.wait()
+            second = asyncio.create_task(manager.test_model_connection("gpt-4.1", "openai", api_key="sk-a"))
+            await asyncio.sleep(0)
+            release.set()
+            results = await asyncio.gather(first, second)
+
+        assert probe.await_count == 1
+        assert results[0] == results[1] == {"success": True, "message": "模型回應正常"}
+        assert results[0] is not results[1]
+
+        ModelManager._instance = None
+        other = ModelManager(str(temp_dir / "config" / "model_config.json"))
+        other_probe = AsyncMock(return_value=(True, "模型回應正常"))
+        with patch.object(other, "_test_openai_connection", other_probe):
+            assert (await other.test_model_connection("gpt-4.1", "openai", api_key="sk-a"))["success"] is True
+        other_probe.assert_not_awaited()
+
+    def test_probe_cache_is_bounded(self):
+        """測試連線測試快取超過上限時淘汰最久未使用的項目"""
+        with patch("srt_translator.core.models.PROBE_CACHE_SIZE", 2):
+            for name in ("a", "b", "c"):
+                models_module._store_probe(("llamacpp", name, "x"), {"success": True, "message": ""})
+
+        assert list(models_module._PROBE_CACHE) == [("llamacpp", "b", "x"), ("llamacpp", "c", "x")]
+
+    @pytest.mark.asyncio
+    async def test_test_model_connection_dispatches_by_provider(self, manager):
+        """測試依提供者分派至對應的連線測試，未知提供者直接回報不支援"""
+        manager.api_keys["google"] = "g-key"
+        google_probe = AsyncMock(return_value=(True, "模型回應正常"))
+        with patch.object(manager, "_test_google_connection", google_probe):
+            result = await manager.test_model_connection("gemini-2.5-flash", "google")
+
+        google_probe.assert_awaited_once_with("gemini-2.5-flash", "g-key")
+        assert result["success"] is True
+
+        unsupported = await manager.test_model_connection("any", "unknown")
+        assert unsupported == {"success": False, "message": "不支援的提供者: unknown"}
+
+    @pytest.mark.asyncio
+    async def test_provider_gate_limits_concurrency(self, manager):
+        """測試同一提供者的並行請求數不超過上限，且 semaphore 於同一 loop 內重複使用"""
+        limit = models_module.PROVIDER_CONCURRENCY["openai"]
+        active = peak = 0
+
+        async def request():
+            nonlocal active, peak
+            async with manager._provider_gate("openai"):
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+
+        await asyncio.gather(*(request() for _ in range(limit * 3)))
+
+        assert peak == limit
+        assert manager._provider_gate("openai") is manager._provider_gate("openai")
+        assert manager._provider_gate("openai") is not manager._provider_gate("google")
+
+    @pytest.mark.asyncio
+    async def test_sdk_clients_are_pooled_per_key(self, manager):
+        """測試相同金鑰重用同一個 SDK 客戶端，退出上下文時關閉"""
+        with (
+            patch("srt_translator.core.models.OPENAI_AVAILABLE", True),
+            patch("srt_translator.core.models.OpenAI") as mock_client,
+        ):
+            mock_client.side_effect = lambda api_key: MagicMock(name=api_key)
+            async with manager:
+                await manager._test_openai_connection("gpt-4.1", "sk-a")
+                await manager._test_openai_connection("gpt-4.1-mini", "sk-a")
+                await manager._test_openai_connection("gpt-4.1", "sk-b")
+                clients = list(manager._clients.values())
+
+        assert mock_client.call_count == 2
+        assert manager._clients == {}
+        for client in clients:
+            client.close.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_aclose_releases_session_and_clients(self, manager):
+        """測試 aclose 在目前的 event loop 上關閉 session 並清空 SDK 客戶端池"""
+        await manager._init_async_session()
+        session = manager.session
+        client = MagicMock()
+        manager._clients[("openai", "digest")] = client
+
+        await manager.aclose()
+
+        assert session.closed
+        assert manager.session is None
+        assert manager._clients == {}
+        client.close.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_global_test_model_connection_closes_session(self):
         """測試全域連線 helper 會在完成後關閉 session。"""
@@ -821,6 +1304,10 @@ class TestModelManagerAsync:
 
         assert result[0] is True
         assert manager.session is fresh_session
+        # 連線測試只要求生成 1 個 token
+        assert fresh_session.post.call_args.kwargs["json"]["max_tokens"] == 1
+        # 逾時設定重用模組層級的 ClientTimeout，不於每次請求重新建立
+        assert fresh_session.post.call_args.kwargs["timeout"] is models_module.LLAMACPP_PROBE_TIMEOUT
 
     @pytest.mark.asyncio
     async def test_get_model_list_async_with_cache(self, manager):
@@ -829,8 +1316,7 @@ class TestModelManagerAsync:
 
         # 模擬快取
         mock_models = [ModelInfo(id="test", provider="llamacpp")]
-        manager.cached_models["llamacpp"] = mock_models
-        manager.cache_time["llamacpp"] = time.time()
+        manager._cache["llamacpp"] = (time.monotonic(), mock_models)
 
         # 應該返回快取的模型
         result = await manager.get_model_list_async("llamacpp")
@@ -843,14 +1329,28 @@ class TestModelManagerAsync:
         if manager.session:
             await manager._close_async_session()
 
+    @pytest.mark.asyncio
+    async def test_model_list_cache_evicts_least_recently_used(self, manager):
+        """測試模型列表快取有上限，超過時淘汰最久未使用的項目"""
+        with patch("srt_translator.core.models.MODEL_LIST_CACHE_SIZE", 2):
+            await manager.get_model_list_async("unknown-a")
+            await manager.get_model_list_async("unknown-b")
+            # 命中快取會將項目移至最新
+            await manager.get_model_list_async("unknown-a")
+            await manager.get_model_list_async("unknown-c")
+
+        assert list(manager._cache) == ["unknown-a", "unknown-c"]
+
+        if manager.session:
+            await manager._close_async_session()
+
     @pytest.mark.asyncio
     async def test_get_model_list_async_cache_expired(self, manager):
         """測試非同步獲取模型列表（快取過期）"""
         import time
 
         # 設定過期的快取
-        manager.cached_models["llamacpp"] = []
-        manager.cache_time["llamacpp"] = time.time() - manager.cache_expiry - 100
+        manager._cache["llamacpp"] = (time.monotonic() - manager.cache_expiry - 100, [])
 
         with patch.object(manager, "_get_llamacpp_models_async", return_value=[]):
             result = await manager.get_model_list_async("llamacpp")
@@ -881,8 +1381,7 @@ class TestModelManagerAsync:
 
         # 設定舊快取
         mock_models = [ModelInfo(id="cached", provider="llamacpp")]
-        manager.cached_models["llamacpp"] = mock_models
-        manager.cache_time["llamacpp"] = time.time() - manager.cache_expiry - 10
+        manager._cache["llamacpp"] = (time.monotonic() - manager.cache_expiry - 10, mock_models)
 
         with patch.object(manager, "_get_llamacpp_models_async", side_effect=Exception("Network error")):
             result = await manager.get_model_list_async("llamacpp")
@@ -1,11 +1,16 @@
 """測試 models 模組的擴展功能"""
 
+import asyncio
+import json
+import logging
+import threading
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from srt_translator.core import models as models_module
 from srt_translator.core.config import ConfigManager
-from srt_translator.core.models import ModelManager, get_model_info, get_recommended_model
+from srt_translator.core.models import ModelInfo, ModelManager, get_model_info, get_recommended_model
 
 
 class TestModelManagerAPIKeyOperations:
@@ -36,6 +41,15 @@ class TestModelManagerAPIKeyOperations:
 
         assert manager.api_keys == {"openai": "sk-env-openai", "google": "env-google"}
 
+    @patch.dict("os.environ", {"GOOGLE_API_KEY": "  ", "GEMINI_API_KEY": "env-gemini"}, clear=True)
+    def test_load_api_keys_falls_back_to_gemini_env_var(self, manager):
+        """測試 GOOGLE_API_KEY 為空白時改用 GEMINI_API_KEY。"""
+        manager.api_keys.clear()
+
+        manager._load_api_keys()
+
+        assert manager.api_keys == {"google": "env-gemini"}
+
     @patch.dict("os.environ", {}, clear=True)
     def test_load_api_keys_does_not_fallback_to_legacy_txt_files(self, manager):
         """測試未設定環境變數時不再回退讀取舊 txt 金鑰檔。"""
@@ -47,6 +61,119 @@ class TestModelManagerAPIKeyOperations:
         assert manager.api_keys == {}
         mock_open.assert_not_called()
 
+    def test_load_env_once_skips_when_sentinel_set(self, monkeypatch):
+        """測試已有哨兵環境變數（如由父行程繼承）時不再解析 .env"""
+        from srt_translator.core import models
+
+        monkeypatch.setenv(models._DOTENV_SENTINEL, "1")
+        with patch.object(models, "dotenv_values") as mock_values:
+            models._load_env_once.__wrapped__()
+        mock_values.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "env",
+        [
+            {"SRT_SKIP_DOTENV": "1"},
+            {"OPENAI_API_KEY": "sk-env", "GEMINI_API_KEY": "g-env"},
+        ],
+    )
+    def test_load_env_once_skips_when_env_already_provided(self, monkeypatch, env):
+        """測試明確略過或金鑰皆已由環境提供時不解析 .env"""
+        from srt_translator.core import models
+
+        for key in (models._DOTENV_SENTINEL, "SRT_SKIP_DOTENV", "OPENAI_API_KEY", "GOOGLE_API_KEY", "GEMINI_API_KEY"):
+            monkeypatch.delenv(key, raising=False)
+        for key, value in env.items():
+            monkeypatch.setenv(key, value)
+        with patch.object(models, "dotenv_values") as mock_values:
+            models._load_env_once.__wrapped__()
+        mock_values.assert_not_called()
+
+    def test_load_env_once_does_not_override_existing_env(self, monkeypatch):
+        """測試 .env 內容只補上尚未設定的環境變數"""
+        from srt_translator.core import models
+
+        for key in (models._DOTENV_SENTINEL, "SRT_SKIP_DOTENV", "GOOGLE_API_KEY", "GEMINI_API_KEY"):
+            monkeypatch.delenv(key, raising=False)
+        monkeypatch.setenv("OPENAI_API_KEY", "from-env")
+        monkeypatch.delenv("SRT_TEST_DOTENV_ONLY", raising=False)
+        values = {"OPENAI_API_KEY": "from-file", "SRT_TEST_DOTENV_ONLY": "x"}
+        with patch.object(models, "dotenv_values", return_value=values):
+            models._load_env_once.__wrapped__()
+        assert models.os.environ["OPENAI_API_KEY"] == "from-env"
+        assert models.os.environ["SRT_TEST_DOTENV_ONLY"] == "x"
+        monkeypatch.delenv("SRT_TEST_DOTENV_ONLY")
+
+
+class TestLazySdkImports:
+    """測試 LLM 客戶端 SDK 延後匯入"""
+
+    def test_importing_models_does_not_import_sdks(self):
+        """測試匯入 models 模組時不載入 openai 與 google.genai"""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys; import srt_translator.core.models as m; "
+            "print(m.OPENAI_AVAILABLE, 'openai' in sys.modules, 'google.genai' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        assert result.stdout.split()[1:] == ["False", "False"]
+
+    def test_import_openai_loads_sdk_on_demand(self, monkeypatch):
+        """測試首次使用時才匯入 OpenAI SDK，已替換的客戶端類別不會被覆寫"""
+        if not models_module.OPENAI_AVAILABLE:
+            pytest.skip("未安裝 openai")
+        sentinel = MagicMock()
+        monkeypatch.setattr(models_module, "openai", None)
+        monkeypatch.setattr(models_module, "OpenAI", sentinel)
+
+        models_module._import_openai()
+
+        assert models_module.openai.__name__ == "openai"
+        assert models_module.OpenAI is sentinel
+
+
+class TestModelLogHandler:
+    """測試延遲建立的檔案日誌處理程序"""
+
+    def test_ensure_log_handler_is_lazy_and_idempotent(self, tmp_path, monkeypatch):
+        """測試首次呼叫才建立 logs 目錄與處理程序，重複呼叫不再新增"""
+        from srt_translator.core import models
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(models, "_LOG_HANDLER_ATTACHED", False)
+        monkeypatch.setattr(models.logger, "handlers", [])
+
+        models._ensure_log_handler()
+        models._ensure_log_handler()
+
+        assert (tmp_path / "logs").is_dir()
+        assert len(models.logger.handlers) == 1
+        models._stop_log_listener()
+
+    def test_log_records_written_by_background_listener(self, tmp_path, monkeypatch):
+        """測試 logger 只掛佇列處理程序，記錄由背景監聽器寫入檔案"""
+        import logging.handlers
+
+        from srt_translator.core import models
+
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(models, "_LOG_HANDLER_ATTACHED", False)
+        monkeypatch.setattr(models.logger, "handlers", [])
+
+        models._ensure_log_handler()
+        assert isinstance(models.logger.handlers[0], logging.handlers.QueueHandler)
+
+        models.logger.warning("佇列日誌測試 %s", 42)
+        # 停止監聽器會先寫出佇列中剩餘的記錄
+        models._stop_log_listener()
+
+        content = (tmp_path / "logs" / "model_manager.log").read_text(encoding="utf-8")
+        assert "佇列日誌測試 42" in content
+
+
 class TestModelManagerConfigOperations:
     """測試配置操作"""
 
@@ -79,8 +206,7 @@ class TestModelManagerConfigOperations:
     def test_update_config_clears_cache_on_important_changes(self, manager):
         """測試更新重要配置項時清除快取"""
         # 設定快取
-        manager.cached_models["test"] = []
-        manager.cache_time["test"] = 1234567890
+        manager._cache["test"] = (1234567890.0, [])
 
         # 更新重要配置項
         new_config = {"llamacpp_url": "http://newhost:8080"}
@@ -88,8 +214,56 @@ class TestModelManagerConfigOperations:
         manager.update_config(new_config)
 
         # 驗證快取已清除
-        assert len(manager.cached_models) == 0
-        assert len(manager.cache_time) == 0
+        assert len(manager._cache) == 0
+
+    def test_update_config_refreshes_runtime_snapshot(self, manager):
+        """測試更新配置後執行期設定快照同步更新"""
+        manager.update_config({"llamacpp_url": "http://newhost:8080", "request_timeout": 42})
+
+        assert manager.rcfg.llamacpp_url == "http://newhost:8080"
+        assert manager.llamacpp_url == "http://newhost:8080"
+        assert manager.request_timeout == 42
+
+    def test_session_connector_uses_pool_settings(self, manager):
+        """測試 HTTP session 的連線池上限取自配置"""
+        manager.config.update({"http_pool_size": 64, "http_limit_per_host": 4})
+        manager.rcfg = models_module._RuntimeConfig.from_config(manager.config)
+
+        async def run():
+            await manager._init_async_session()
+            connector = manager.session.connector
+            limits = (connector.limit, connector.limit_per_host)
+            await manager._close_async_session()
+            return limits
+
+        assert asyncio.run(run()) == (64, 4)
+
+    def test_update_config_pool_change_retires_session(self, manager):
+        """測試連線池設定變更時關閉舊 session，下次請求以新設定重建"""
+        loop = manager._get_sync_loop()
+
+        async def open_session():
+            await manager._init_async_session()
+            return manager.session
+
+        session = asyncio.run_coroutine_threadsafe(open_session(), loop).result(timeout=5)
+        manager.update_config({"http_limit_per_host": 3})
+
+        assert session.closed
+        assert manager.session is None
+        assert manager.rcfg.http_limit_per_host == 3
+
+    def test_log_level_follows_model_config(self, manager):
+        """測試模組日誌等級預設為 INFO，並隨配置的 log_level 更新"""
+        try:
+            assert models_module.logger.level == logging.INFO
+            manager.update_config({"log_level": "DEBUG"})
+            assert models_module.logger.isEnabledFor(logging.DEBUG)
+        finally:
+            models_module._apply_log_level("INFO")
+
+        models_module._apply_log_level("verbose")
+        assert models_module.logger.level == logging.INFO
 
     def test_update_config_default_model(self, manager):
         """測試更新預設模型配置"""
@@ -98,7 +272,7 @@ class TestModelManagerConfigOperations:
         manager.update_config(new_config)
 
         # 驗證快取已清除
-        assert len(manager.cached_models) == 0
+        assert len(manager._cache) == 0
         assert manager.config.get("llamacpp_url") == "http://localhost:8081"
 
     def test_update_config_model_patterns(self, manager):
@@ -109,8 +283,37 @@ class TestModelManagerConfigOperations:
         manager.update_config(new_config)
 
         # 驗證快取已清除
-        assert len(manager.cached_models) == 0
+        assert len(manager._cache) == 0
         assert manager.config.get("model_patterns") == new_patterns
+        # 編譯後的正則同步更新
+        assert manager.matches_pattern("My-Custom-Model") is True
+        assert manager.matches_pattern("gemma-2") is False
+
+    def test_update_config_unchanged_values_skip_save(self, manager):
+        """測試設定值未變更時不寫檔也不清除快取"""
+        manager._cache["test"] = (1234567890.0, [])
+
+        with patch.object(manager, "_save_config") as save:
+            result = manager.update_config({"llamacpp_url": manager.config["llamacpp_url"], "unknown_key": 1})
+
+        assert result is True
+        save.assert_not_called()
+        assert "test" in manager._cache
+
+    def test_reload_rereads_config_file(self, manager):
+        """reload 重新讀取配置檔並重建執行期設定與快取"""
+        manager._cache["test"] = (1234567890.0, [])
+        with open(manager.config_file, encoding="utf-8") as f:
+            data = json.load(f)
+        data["llamacpp_url"] = "http://reloaded:8080"
+        with open(manager.config_file, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+
+        manager.reload()
+
+        assert manager.llamacpp_url == "http://reloaded:8080"
+        assert manager.config["llamacpp_url"] == "http://reloaded:8080"
+        assert manager._cache == {}
 
 
 class TestModelManagerFormatHelpers:
@@ -188,6 +391,15 @@ class TestModelManagerFormatHelpers:
         result = manager._format_model_name("model-v1.2.3_final")
         assert isinstance(result, str)
 
+    def test_format_model_name_is_memoized(self, manager):
+        """測試相同模型 ID 重複格式化時沿用快取結果"""
+        models_module._format_model_name.cache_clear()
+        first = manager._format_model_name("gpt-4o-mini")
+        second = manager._format_model_name("gpt-4o-mini")
+        assert first == second
+        info = models_module._format_model_name.cache_info()
+        assert (info.hits, info.misses) == (1, 1)
+
 
 class TestGlobalFunctions:
     """測試全域函數"""
@@ -323,6 +535,40 @@ class TestModelManagerLlamaCppModelsAsync:
             assert "8.0B 參數" in model.description
             assert "3 個並行槽" in model.description
 
+    @pytest.mark.asyncio
+    async def test_get_llamacpp_models_queries_endpoints_concurrently(self, manager):
+        """測試三個 llama.cpp 端點並行查詢，任一端點連線失敗時回退預設列表"""
+        in_flight = 0
+        peak = 0
+
+        async def enter():
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            mock_resp = AsyncMock()
+            mock_resp.status = 404
+            return mock_resp
+
+        def mock_get(url, *args, **kwargs):
+            mock_context_manager = MagicMock()
+            if url.endswith("/slots"):
+                mock_context_manager.__aenter__ = AsyncMock(side_effect=OSError("connection refused"))
+            else:
+                mock_context_manager.__aenter__ = AsyncMock(side_effect=enter)
+            mock_context_manager.__aexit__ = AsyncMock(return_value=None)
+            return mock_context_manager
+
+        with patch.object(manager, "_init_async_session", return_value=None):
+            manager.session = MagicMock()
+            manager.session.get = mock_get
+
+            result = await manager._get_llamacpp_models_async()
+
+        assert peak == 2
+        assert result == manager._get_llamacpp_fallback_models()
+
     @pytest.mark.asyncio
     async def test_get_llamacpp_models_falls_back_to_props_model_path(self, manager):
         """測試 /v1/models 不可用時仍可用 /props 建立單一模型資訊"""
@@ -368,6 +614,40 @@ class TestModelManagerLlamaCppModelsAsync:
             assert model.context_length == 4096
             assert model.available is True
 
+    @pytest.mark.asyncio
+    async def test_get_llamacpp_models_parses_with_module_json_loads(self, manager):
+        """測試 llama.cpp 回應本文以模組選定的 JSON 解析函式（orjson 或標準函式庫）解析"""
+        loads_used = []
+
+        def mock_get(url, *args, **kwargs):
+            async def json(loads=None):
+                loads_used.append(loads)
+                return {}
+
+            mock_resp = MagicMock()
+            mock_resp.status = 200
+            mock_resp.json = json
+            mock_context_manager = MagicMock()
+            mock_context_manager.__aenter__ = AsyncMock(return_value=mock_resp)
+            mock_context_manager.__aexit__ = AsyncMock(return_value=None)
+            return mock_context_manager
+
+        with patch.object(manager, "_init_async_session", return_value=None):
+            manager.session = MagicMock()
+            manager.session.get = mock_get
+            await manager._get_llamacpp_models_async()
+
+        assert loads_used == [models_module._json_loads] * 3
+
+    def test_get_llamacpp_fallback_models_reuses_model_instance(self, manager):
+        """測試多次回退共用同一個不可變的提示模型，但每次回傳新的列表"""
+        first = manager._get_llamacpp_fallback_models()
+        second = manager._get_llamacpp_fallback_models()
+
+        assert first is not second
+        assert first[0] is second[0]
+        assert first[0].available is False
+
     def test_get_llamacpp_fallback_models_uses_updated_startup_hint(self, manager):
         """測試 llama.cpp fallback 提示改為最佳化後的建議參數"""
         fallback_model = manager._get_llamacpp_fallback_models()[0]
@@ -431,6 +711,144 @@ class TestModelManagerOpenAIModelsAsync:
                 model_ids = [m.id for m in result]
                 assert "gpt-4o" in model_ids or "gpt-3.5-turbo" in model_ids
 
+    def test_order_by_translation_priority_matches_stable_sort(self):
+        """測試分段排序與以優先級穩定排序的結果一致"""
+        ids = ["gpt-4-vision-preview", "gpt-x", "gpt-4", "gpt-y", "gpt-4.1-mini", "gpt-4o", "gpt-z", "gpt-4.1"]
+        models = [ModelInfo(id=model_id, provider="openai") for model_id in ids]
+        priority = models_module._OPENAI_TRANSLATION_PRIORITY
+
+        expected = sorted(models, key=lambda m: priority.get(m.id, 900))
+
+        assert models_module._order_by_translation_priority(models) == expected
+
+    @pytest.mark.asyncio
+    async def test_get_openai_models_fetches_off_event_loop(self, manager):
+        """測試同步的模型列表請求在工作執行緒中執行"""
+        loop_thread = threading.get_ident()
+        calls = []
+
+        def fake_list():
+            calls.append(threading.get_ident())
+            return [MagicMock(id="gpt-4.1")]
+
+        with (
+            patch("srt_translator.core.models.OPENAI_AVAILABLE", True),
+            patch("srt_translator.core.models.OpenAI") as mock_client,
+        ):
+            mock_client.return_value.models.list.side_effect = fake_list
+            result = await manager._get_openai_models_async(api_key="test-key")
+
+        assert calls and calls[0] != loop_thread
+        assert result[0].id == "gpt-4.1"
+
+    @pytest.mark.asyncio
+    async def test_connection_tests_call_sdk_off_event_loop(self, manager):
+        """測試 OpenAI 與 Google 連線測試的同步 SDK 呼叫在工作執行緒中執行"""
+        loop_thread = threading.get_ident()
+        calls = []
+
+        def record(result):
+            def call(**kwargs):
+                calls.append(threading.get_ident())
+                return result
+
+            return call
+
+        openai_client = MagicMock()
+        openai_client.chat.completions.create.side_effect = record(MagicMock(choices=[MagicMock()]))
+        google_client = MagicMock()
+        google_client.models.generate_content.side_effect = record(MagicMock(text="Hi"))
+
+        with (
+            patch("srt_translator.core.models.OPENAI_AVAILABLE", True),
+            patch("srt_translator.core.models.GOOGLE_AVAILABLE", True),
+            patch.object(manager, "_get_client", side_effect=[openai_client, google_client]),
+        ):
+            assert await manager._test_openai_connection("gpt-4.1-mini", "sk-test") == (True, "模型回應正常")
+            assert await manager._test_google_connection("gemini-2.5-flash", "g-test") == (True, "模型回應正常")
+
+        assert len(calls) == 2
+        assert loop_thread not in calls
+        assert openai_client.chat.completions.create.call_args.kwargs["max_tokens"] == 1
+
+    @pytest.mark.asyncio
+    async def test_openai_model_list_persisted_across_instances(self, manager, temp_dir, monkeypatch):
+        """測試啟用磁碟快取後，新實例直接沿用已保存的 OpenAI 模型列表"""
+        monkeypatch.setattr(models_module, "MODEL_LIST_CACHE_DB", str(temp_dir / "data" / "model_lists.db"))
+        monkeypatch.setattr(models_module, "_MODEL_LIST_DISK_CACHE", None)
+        manager.config["persistent_model_cache"] = True
+        fetched = [ModelInfo(id="gpt-4.1", provider="openai", tags=("gpt",), capabilities={"translation": 0.9})]
+
+        try:
+            with patch.object(manager, "_get_openai_models_async", AsyncMock(return_value=fetched)):
+                await manager.get_model_list_async("openai", api_key="sk-a")
+
+            ModelManager._instance = None
+            other = ModelManager(str(temp_dir / "config" / "model_config.json"))
+            other.config["persistent_model_cache"] = True
+            live = AsyncMock(return_value=[])
+            with patch.object(other, "_get_openai_models_async", live):
+                cached = await other.get_model_list_async("openai", api_key="sk-a")
+                # 不同金鑰不共用磁碟快取（先清除以 llm_type 為鍵的記憶體快取）
+                other._cache.clear()
+                await other.get_model_list_async("openai", api_key="sk-b")
+
+            assert [m.to_dict() for m in cached] == [m.to_dict() for m in fetched]
+            live.assert_awaited_once_with("sk-b")
+        finally:
+            models_module._close_model_list_disk_cache()
+            await manager._close_async_session()
+
+    @pytest.mark.asyncio
+    async def test_model_list_disk_cache_disabled_by_default(self, manager, monkeypatch):
+        """測試預設不啟用磁碟快取，不會開啟資料庫"""
+        opened = MagicMock()
+        monkeypatch.setattr(models_module, "_get_model_list_disk_cache", opened)
+        with patch.object(manager, "_get_openai_models_async", AsyncMock(return_value=[])):
+            await manager.get_model_list_async("openai", api_key="sk-a")
+        await manager._close_async_session()
+
+        opened.assert_not_called()
+
+    def test_model_list_disk_cache_cleared_on_toggle_and_reload(self, manager, temp_dir, monkeypatch):
+        """測試切換 persistent_model_cache 與 reload 會清除磁碟快取"""
+        monkeypatch.setattr(models_module, "MODEL_LIST_CACHE_DB", str(temp_dir / "data" / "model_lists.db"))
+        monkeypatch.setattr(models_module, "_MODEL_LIST_DISK_CACHE", None)
+        try:
+            cache = models_module._get_model_list_disk_cache()
+            cache.put("openai:x", [ModelInfo(id="gpt-4.1", provider="openai")], ttl=60)
+            manager.update_config({"persistent_model_cache": True})
+            assert cache.get("openai:x") is None
+
+            cache.put("openai:x", [ModelInfo(id="gpt-4.1", provider="openai")], ttl=60)
+            manager.reload()
+            assert cache.get("openai:x") is None
+        finally:
+            models_module._close_model_list_disk_cache()
+
+    def test_model_list_disk_cache_skips_expired_entries(self, temp_dir):
+        """測試過期的磁碟快取項目不會被讀出"""
+        cache = models_module._ModelListDiskCache(str(temp_dir / "lists.db"))
+        try:
+            cache.put("openai:x", [ModelInfo(id="gpt-4.1", provider="openai")], ttl=-1)
+            assert cache.get("openai:x") is None
+            cache.put("openai:x", [ModelInfo(id="gpt-4.1", provider="openai")], ttl=60)
+            assert [m.id for m in cache.get("openai:x")] == ["gpt-4.1"]
+        finally:
+            cache.close()
+
+    @pytest.mark.asyncio
+    async def test_get_model_lists_async_gathers_providers(self, manager):
+        """測試一次並行查詢多個提供者的模型列表"""
+        with (
+            patch.object(manager, "_get_llamacpp_models_async", AsyncMock(return_value=[])),
+            patch.object(manager, "_get_openai_models_async", AsyncMock(return_value=["openai-model"])),
+        ):
+            result = await manager.get_model_lists_async(["openai", "llamacpp"])
+
+        assert result == {"openai": ["openai-model"], "llamacpp": []}
+        await manager._close_async_session()
+
     @pytest.mark.asyncio
     async def test_get_openai_models_excludes_date_versions(self, manager):
         """測試排除日期版本的模型"""
@@ -465,3 +883,79 @@ class TestModelManagerOpenAIModelsAsync:
                 assert isinstance(result, list)
                 assert len(result) == 1
                 assert result[0].id == "gpt-4.1-mini"
+
+
+class TestModelManagerGoogleModelsAsync:
+    """測試 _get_google_models_async 的各種場景"""
+
+    @pytest.fixture(autouse=True)
+    def reset_instances(self):
+        """每個測試前重置單例實例"""
+        ModelManager._instance = None
+        ConfigManager._instances = {}
+        yield
+        ModelManager._instance = None
+        ConfigManager._instances = {}
+
+    @pytest.fixture
+    def manager(self, temp_dir):
+        """提供測試用的 ModelManager"""
+        config_file = temp_dir / "config" / "model_config.json"
+        config_file.parent.mkdir(exist_ok=True)
+        return ModelManager(str(config_file))
+
+    @pytest.mark.asyncio
+    async def test_get_google_models_invalid_key_does_not_mutate_database(self, manager):
+        """測試金鑰驗證失敗時回傳不可用副本，資料庫中的內建條目維持原狀"""
+        with patch("srt_translator.core.models.GOOGLE_AVAILABLE", True):  # noqa: SIM117
+            with patch.object(manager, "_validate_google_api_key", AsyncMock(return_value=False)):
+                result = await manager._get_google_models_async(api_key="bad-key")
+
+        assert {m.id for m in result} == {
+            m.id for key, m in manager.model_database.items() if key.startswith("google:")
+        }
+        assert all(not m.available for m in result)
+        assert manager.model_database["google:gemini-2.5-flash"].available is True
+
+    @pytest.mark.asyncio
+    async def test_validate_google_api_key_probes_models_endpoint_once(self, manager):
+        """測試金鑰驗證走免費的 models 端點，且結果在 TTL 內重複使用"""
+        response = MagicMock(status=200)
+        get_context = AsyncMock()
+        get_context.__aenter__.return_value = response
+        get_context.__aexit__.return_value = False
+        session = MagicMock(closed=False)
+        session.get.return_value = get_context
+        manager.session = session
+
+        with patch.object(manager, "_init_async_session", AsyncMock()):
+            assert await manager._validate_google_api_key("good-key") is True
+            assert await manager._validate_google_api_key("good-key") is True
+
+        session.get.assert_called_once()
+        assert session.get.call_args.kwargs["headers"] == {"x-goog-api-key": "good-key"}
+
+    @pytest.mark.asyncio
+    async def test_validate_google_api_key_negative_cache_is_short(self, manager):
+        """測試無效金鑰以較短的 TTL 快取，且快取鍵不保存明文金鑰"""
+        response = MagicMock(status=403)
+        get_context = AsyncMock()
+        get_context.__aenter__.return_value = response
+        get_context.__aexit__.return_value = False
+        session = MagicMock(closed=False)
+        session.get.return_value = get_context
+        manager.session = session
+
+        with (
+            patch.object(manager, "_init_async_session", AsyncMock()),
+            patch("srt_translator.core.models.time.monotonic", return_value=1000.0) as clock,
+        ):
+            assert await manager._validate_google_api_key("bad-key") is False
+            assert await manager._validate_google_api_key("bad-key") is False
+            assert session.get.call_count == 1
+
+            clock.return_value = 1000.0 + models_module.API_KEY_INVALID_TTL + 1
+            assert await manager._validate_google_api_key("bad-key") is False
+            assert session.get.call_count == 2
+
+        assert all("bad-key" not in part for key in manager._api_key_valid for part in key)
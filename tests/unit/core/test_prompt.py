@@ -4,6 +4,7 @@ import contextlib
 import json
 from datetime import datetime
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -90,6 +91,34 @@ class TestPromptManagerInit:
             assert "llamacpp" in manager.default_prompts[content_type]
             assert "openai" in manager.default_prompts[content_type]
 
+    def test_builtin_default_prompts_built_once_and_shared(self, temp_config_file):
+        """測試內置預設提示詞只組合一次，各實例共用字串但字典彼此獨立"""
+        first = PromptManager(temp_config_file)
+        with patch.object(PromptManager, "_build_builtin_default_prompts", side_effect=AssertionError("不應重新組合")):
+            second = PromptManager(temp_config_file)
+
+        assert second.default_prompts["general"]["llamacpp"] is first.default_prompts["general"]["llamacpp"]
+        second.default_prompts["general"]["llamacpp"] = "changed"
+        assert first.default_prompts["general"]["llamacpp"] != "changed"
+        assert PromptManager._get_builtin_default_prompts()["general"]["llamacpp"] != "changed"
+
+    def test_init_does_not_probe_default_prompt_config(self, temp_config_file):
+        """測試初始化不再建立沒有對應配置檔的 default_prompt 配置管理器"""
+        PromptManager(temp_config_file)
+
+        assert all(config_type != "default_prompt" for config_type, _location in ConfigManager._instances)
+
+    def test_logger_writes_through_queue_listener(self):
+        """測試 logger 只掛佇列處理程序，檔案寫入交由背景監聽器"""
+        import logging.handlers
+
+        from srt_translator.core import prompt
+
+        if not hasattr(prompt, "_log_listener"):
+            pytest.skip("logger 已由其他設定掛上處理程序")
+        assert [type(h) for h in prompt.logger.handlers] == [logging.handlers.QueueHandler]
+        assert isinstance(prompt._log_listener.handlers[0], logging.handlers.TimedRotatingFileHandler)
+
     def test_translation_styles_defined(self, temp_config_file):
         """測試翻譯風格定義"""
         manager = PromptManager(temp_config_file)
@@ -253,6 +282,32 @@ class TestPromptManagerGetPrompt:
 
         assert "Taiwan expressions and references" in prompt
 
+    def test_get_prompt_reuses_composed_prompt(self, manager):
+        """測試相同設定重複取得時沿用已組合的提示詞，不再套用修飾符"""
+        manager.set_language_pair("英文→繁體中文")
+        first = manager.get_prompt("llamacpp", "general", "literal")
+
+        with (
+            patch.object(manager, "_apply_style_modifier", side_effect=AssertionError("不應重新組合")),
+            patch.object(manager, "_apply_language_pair_modifier", side_effect=AssertionError("不應重新組合")),
+        ):
+            assert manager.get_prompt("llamacpp", "general", "literal") is first
+
+    def test_get_prompt_cache_follows_settings_and_custom_prompts(self, manager):
+        """測試語言對或自訂提示詞變更後取得新的提示詞"""
+        original = manager.get_prompt("llamacpp", "general")
+
+        manager.set_language_pair("英文→繁體中文")
+        switched = manager.get_prompt("llamacpp", "general")
+        assert switched != original
+        assert "Translate from 英文 to 繁體中文" in switched
+
+        manager.set_prompt("Custom cached prompt", "llamacpp", "general")
+        assert manager.get_prompt("llamacpp", "general").startswith("Custom cached prompt")
+
+        manager.reset_to_default("llamacpp", "general")
+        assert manager.get_prompt("llamacpp", "general") == switched
+
 
 class TestPromptManagerSetPrompt:
     """測試提示詞設置功能"""
@@ -395,6 +450,14 @@ class TestPromptManagerStyles:
         assert "英文" in modified or "English" in modified
         assert "繁體中文" in modified or "Traditional Chinese" in modified
 
+    def test_apply_language_pair_modifier_replaces_all_target_references(self, manager):
+        """測試所有目標語言引用皆替換為語言對的目標語言"""
+        base_prompt = "Use Taiwan Mandarin. Output Traditional Chinese. 輸出繁體中文。"
+        modified = manager._apply_language_pair_modifier(base_prompt, "繁體中文→英文")
+
+        assert modified.startswith("Use 英文. Output 英文. 輸出英文。")
+        assert modified.endswith("Translate from 繁體中文 to 英文. Remember to ONLY translate the CURRENT text, not context.")
+
     def test_apply_language_pair_modifier_default_unchanged(self, manager):
         """測試預設語言對不修改"""
         base_prompt = "Translate to Traditional Chinese."
@@ -718,6 +781,20 @@ class TestPromptManagerOptimizedMessage:
         assert "preserve the trailing conjunction" not in messages[0]["content"]
         assert "NOTE: preserve the trailing conjunction 'because'" in messages[1]["content"]
 
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [("She left whereas", "WHEREAS"), ("I know it as", "AS"), ("We waited until", "UNTIL"), ("Wait", None)],
+    )
+    def test_get_optimized_message_detects_trailing_conjunction(self, manager, text, expected):
+        """測試非精簡格式對句尾連接詞加上保留警告，並辨識出正確的連接詞"""
+        messages = manager.get_optimized_message(text, [text], "llamacpp", "model", current_index=0)
+
+        user_message = messages[1]["content"]
+        if expected is None:
+            assert "MANDATORY WARNING" not in user_message
+        else:
+            assert f"ends with the conjunction '{expected}'" in user_message
+
     def test_get_optimized_message_includes_context(self, manager):
         """測試優化訊息包含上下文"""
         text = "Main text"
@@ -1122,6 +1199,39 @@ class TestPromptManagerFileOperations:
         assert manager.custom_prompts["anime"]["google"] == "Custom Google prompt"
         assert manager.custom_prompts["anime"]["llamacpp"] == "Custom llama.cpp prompt"
 
+    def test_set_prompt_writes_config_and_template_once(self, manager):
+        """測試覆寫提示詞時版本歷史與自訂提示詞合併為一次配置寫入"""
+        manager.set_prompt("First prompt", "llamacpp", "general")
+
+        with (
+            patch.object(manager.config_manager, "save_config", wraps=manager.config_manager.save_config) as save,
+            patch.object(manager, "_save_prompt_template", wraps=manager._save_prompt_template) as template,
+        ):
+            manager.set_prompt("Second prompt", "llamacpp", "general")
+
+        assert save.call_count == 1
+        template.assert_called_once_with("general")
+        saved = json.loads(Path(manager.config_file).read_text(encoding="utf-8"))
+        assert saved["custom_prompts"]["general"]["llamacpp"] == "Second prompt"
+        assert saved["version_history"]["general"]["llamacpp"][-1]["prompt"] == "First prompt"
+
+    def test_batch_updates_defers_writes_until_exit(self, manager):
+        """測試批次區塊內的變更於離開時才一次寫入"""
+        template_file = Path(manager.templates_dir) / "movie_template.json"
+
+        with (
+            patch.object(manager.config_manager, "save_config", wraps=manager.config_manager.save_config) as save,
+            manager.batch_updates(),
+        ):
+            manager.set_prompt("Movie llama.cpp", "llamacpp", "movie")
+            manager.set_prompt("Movie OpenAI", "openai", "movie")
+            assert save.call_count == 0
+            assert not template_file.exists()
+
+        assert save.call_count == 1
+        templates = json.loads(template_file.read_text(encoding="utf-8"))
+        assert templates == {"llamacpp": "Movie llama.cpp", "openai": "Movie OpenAI"}
+
 
 class TestPromptManagerEdgeCases:
     """測試邊緣情況和錯誤處理"""
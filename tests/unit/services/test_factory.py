@@ -502,6 +502,21 @@ class TestModelService:
         assert models == ["gpt-4o-mini", "gpt-4o"]
         mock_model_instance.get_model_list_async.assert_awaited_once_with("openai", "sk-test")
 
+    @pytest.mark.asyncio
+    @patch("srt_translator.services.factory.ModelManager")
+    @patch("srt_translator.services.factory.ConfigManager")
+    async def test_cleanup_closes_model_manager(self, mock_config, mock_model):
+        """Test cleanup releases the model manager's session and SDK clients."""
+        mock_config.get_instance.return_value = MagicMock()
+        mock_model_instance = MagicMock()
+        mock_model_instance.aclose = AsyncMock()
+        mock_model.return_value = mock_model_instance
+
+        service = ModelService()
+        await service.cleanup()
+
+        mock_model_instance.aclose.assert_awaited_once()
+
     @patch("srt_translator.services.factory.ModelManager")
     @patch("srt_translator.services.factory.ConfigManager")
     def test_get_model_info(self, mock_config, mock_model):